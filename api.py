@@ -0,0 +1,374 @@
+import os
+import json
+import time
+import uuid
+import queue
+import shutil
+import argparse
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from email.parser import BytesParser
+from email import policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from pdf_parser import extract_text_from_pdf
+from extract_info import extract_information
+
+MAX_UPLOAD_MB = float(os.environ.get('RESUME_PARSER_API_MAX_UPLOAD_MB', 200))
+JOB_RETENTION = float(os.environ.get('RESUME_PARSER_API_JOB_RETENTION', 3600))
+LATENCY_WINDOW = 1000
+
+
+def process_job_file(pdf_path: str, file_name: str) -> Dict[str, Any]:
+    """Extract one resume for the API (runs in a worker process)"""
+    start_time = time.perf_counter()
+    try:
+        text = extract_text_from_pdf(pdf_path)
+
+        if not text or len(text.strip()) < 50:
+            return {'file': file_name, 'success': False, 'data': None,
+                    'error': f'Little or no text extracted from {file_name}',
+                    'latency': time.perf_counter() - start_time}
+
+        extracted_data = extract_information(text)
+        extracted_data['Resume Name'] = file_name
+        return {'file': file_name, 'success': True, 'data': extracted_data, 'error': None,
+                'latency': time.perf_counter() - start_time}
+
+    except Exception as e:
+        return {'file': file_name, 'success': False, 'data': None,
+                'error': f'Error processing {file_name}: {str(e)}',
+                'latency': time.perf_counter() - start_time}
+
+
+def percentile(values: List[float], fraction: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Job:
+    """One batch of PDFs submitted through the API"""
+
+    def __init__(self, files: List[Tuple[str, str]], temp_dir: Optional[str] = None):
+        self.id = uuid.uuid4().hex
+        self.files = files
+        self.temp_dir = temp_dir
+        self.status = 'queued'
+        self.results: List[Dict[str, Any]] = []
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.condition = threading.Condition()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ('done', 'failed')
+
+    def add_result(self, result: Dict[str, Any]):
+        with self.condition:
+            self.results.append(result)
+            self.condition.notify_all()
+
+    def finish(self, status: str):
+        with self.condition:
+            self.status = status
+            self.finished_at = time.time()
+            self.condition.notify_all()
+        if self.temp_dir:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def summary(self) -> Dict[str, Any]:
+        successful = sum(1 for result in self.results if result['success'])
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'total_files': len(self.files),
+            'completed_files': len(self.results),
+            'successful': successful,
+            'failed': len(self.results) - successful,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at
+        }
+
+
+class BatchService:
+    """Bounded job queue feeding a shared process pool"""
+
+    def __init__(self, workers: Optional[int] = None, queue_size: int = 16, job_concurrency: int = 2):
+        self.executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+        self.queue: "queue.Queue[Job]" = queue.Queue(maxsize=queue_size)
+        self.jobs: Dict[str, Job] = {}
+        self.lock = threading.Lock()
+        self.running = 0
+        self.files_processed = 0
+        self.files_failed = 0
+        self.jobs_completed = 0
+        self.jobs_rejected = 0
+        self.file_latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        self.queue_waits: deque = deque(maxlen=LATENCY_WINDOW)
+        self.job_latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        self.dispatchers = [
+            threading.Thread(target=self._dispatch, name=f"job-dispatcher-{i}", daemon=True)
+            for i in range(job_concurrency)
+        ]
+        for thread in self.dispatchers:
+            thread.start()
+
+    def submit(self, files: List[Tuple[str, str]], temp_dir: Optional[str] = None) -> Optional[Job]:
+        """Queue a job; returns None when the queue is full"""
+        self._expire_jobs()
+        job = Job(files, temp_dir)
+        try:
+            self.queue.put_nowait(job)
+        except queue.Full:
+            with self.lock:
+                self.jobs_rejected += 1
+            return None
+        with self.lock:
+            self.jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def _expire_jobs(self):
+        cutoff = time.time() - JOB_RETENTION
+        with self.lock:
+            for job_id in [job_id for job_id, job in self.jobs.items()
+                           if job.finished and job.finished_at < cutoff]:
+                del self.jobs[job_id]
+
+    def _dispatch(self):
+        while True:
+            job = self.queue.get()
+            with self.lock:
+                self.running += 1
+            job.status = 'running'
+            job.started_at = time.time()
+            self.queue_waits.append(job.started_at - job.created_at)
+            try:
+                futures = [self.executor.submit(process_job_file, path, name) for name, path in job.files]
+                for future in as_completed(futures):
+                    result = future.result()
+                    with self.lock:
+                        self.files_processed += 1
+                        self.files_failed += 0 if result['success'] else 1
+                        self.file_latencies.append(result['latency'])
+                    job.add_result(result)
+                job.finish('done')
+            except Exception as e:
+                print(f"❌ Job {job.id} failed: {str(e)}")
+                job.finish('failed')
+            finally:
+                with self.lock:
+                    self.running -= 1
+                    self.jobs_completed += 1
+                    self.job_latencies.append(job.finished_at - job.created_at)
+                self.queue.task_done()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self.lock:
+            file_latencies = list(self.file_latencies)
+            queue_waits = list(self.queue_waits)
+            job_latencies = list(self.job_latencies)
+            return {
+                'queue_depth': self.queue.qsize(),
+                'queue_capacity': self.queue.maxsize,
+                'jobs_running': self.running,
+                'jobs_completed': self.jobs_completed,
+                'jobs_rejected': self.jobs_rejected,
+                'files_processed': self.files_processed,
+                'files_failed': self.files_failed,
+                'file_latency_p50': percentile(file_latencies, 0.5),
+                'file_latency_p95': percentile(file_latencies, 0.95),
+                'queue_wait_p50': percentile(queue_waits, 0.5),
+                'queue_wait_p95': percentile(queue_waits, 0.95),
+                'job_latency_p50': percentile(job_latencies, 0.5),
+                'job_latency_p95': percentile(job_latencies, 0.95)
+            }
+
+
+class APIRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    service: BatchService = None
+    allowed_roots: List[str] = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: Any, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        self._send_json(status, {'error': message}, headers)
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):X}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        parts = [part for part in urlparse(self.path).path.split('/') if part]
+
+        if parts == ['health']:
+            return self._send_json(200, {'status': 'ok'})
+
+        if parts == ['metrics']:
+            return self._send_json(200, self.service.metrics())
+
+        if len(parts) in (2, 3) and parts[0] == 'jobs':
+            job = self.service.get(parts[1])
+            if job is None:
+                return self._send_error(404, f"Unknown job '{parts[1]}'")
+            if len(parts) == 2:
+                return self._send_json(200, job.summary())
+            if parts[2] == 'results':
+                return self._stream_results(job)
+
+        self._send_error(404, "Not found")
+
+    def do_POST(self):
+        if urlparse(self.path).path.rstrip('/') != '/jobs':
+            return self._send_error(404, "Not found")
+
+        length = int(self.headers.get('Content-Length') or 0)
+        if length <= 0:
+            return self._send_error(400, "Request body is empty")
+        if length > MAX_UPLOAD_MB * 1024 * 1024:
+            return self._send_error(413, f"Request body exceeds {MAX_UPLOAD_MB:g} MB")
+
+        body = self.rfile.read(length)
+        content_type = self.headers.get('Content-Type', '')
+
+        try:
+            if content_type.startswith('multipart/form-data'):
+                files, temp_dir = self._save_uploads(content_type, body)
+            elif content_type.startswith('application/json'):
+                files, temp_dir = self._resolve_paths(json.loads(body)), None
+            else:
+                return self._send_error(415, "Use multipart/form-data uploads or a JSON list of paths")
+        except ValueError as e:
+            return self._send_error(400, str(e))
+
+        job = self.service.submit(files, temp_dir)
+        if job is None:
+            if temp_dir:
+                shutil.rmtree(temp_dir, ignore_errors=True)
+            return self._send_error(429, "Job queue is full, retry later", {'Retry-After': '5'})
+
+        self._send_json(202, job.summary(), {'Location': f"/jobs/{job.id}"})
+
+    def _save_uploads(self, content_type: str, body: bytes) -> Tuple[List[Tuple[str, str]], str]:
+        header = f"Content-Type: {content_type}\r\nMIME-Version: 1.0\r\n\r\n".encode('latin-1')
+        message = BytesParser(policy=policy.HTTP).parsebytes(header + body)
+        temp_dir = tempfile.mkdtemp(prefix="resume_api_")
+        files = []
+
+        for number, part in enumerate(message.iter_parts(), 1):
+            file_name = part.get_filename()
+            if not file_name or not file_name.lower().endswith('.pdf'):
+                continue
+            file_name = os.path.basename(file_name)
+            file_path = os.path.join(temp_dir, f"{number:05d}_{file_name}")
+            with open(file_path, 'wb') as f:
+                f.write(part.get_payload(decode=True) or b'')
+            files.append((file_name, file_path))
+
+        if not files:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise ValueError("No PDF files found in upload")
+        return files, temp_dir
+
+    def _resolve_paths(self, payload: Any) -> List[Tuple[str, str]]:
+        paths = payload.get('paths') if isinstance(payload, dict) else None
+        if not paths or not isinstance(paths, list):
+            raise ValueError("Expected a JSON object with a non-empty 'paths' list")
+        if not self.allowed_roots:
+            raise ValueError("Server-side paths are disabled; start the API with --allow-root")
+
+        files = []
+        for path in paths:
+            real_path = os.path.realpath(str(path))
+            if not any(os.path.commonpath([real_path, root]) == root for root in self.allowed_roots):
+                raise ValueError(f"Path '{path}' is outside the allowed roots")
+            if not os.path.isfile(real_path) or not real_path.lower().endswith('.pdf'):
+                raise ValueError(f"Path '{path}' is not a PDF file")
+            files.append((os.path.basename(real_path), real_path))
+        return files
+
+    def _stream_results(self, job: Job):
+        """Stream results as newline-delimited JSON while the job runs"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson; charset=utf-8')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+
+        sent = 0
+        try:
+            while True:
+                with job.condition:
+                    while sent == len(job.results) and not job.finished:
+                        job.condition.wait(timeout=15)
+                    pending = job.results[sent:]
+                    finished = job.finished
+                for result in pending:
+                    self._write_chunk((json.dumps(result, ensure_ascii=False) + "\n").encode('utf-8'))
+                sent += len(pending)
+                if finished and sent == len(job.results):
+                    break
+            self._write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def setup_argument_parser():
+    """Setup command line argument parser"""
+    parser = argparse.ArgumentParser(
+        description="📄 Resume Parser HTTP API - batch extraction jobs over JSON",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='Interface to bind')
+    parser.add_argument('--port', type=int, default=8000, help='Port to listen on')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help='Worker processes for extraction')
+    parser.add_argument('--queue-size', type=int, default=16, help='Maximum queued jobs before returning 429')
+    parser.add_argument('--job-concurrency', type=int, default=2, help='Jobs processed at the same time')
+    parser.add_argument('--allow-root', action='append', default=[],
+                        help='Directory server-side paths may be read from (repeatable)')
+    return parser
+
+
+def main():
+    args = setup_argument_parser().parse_args()
+
+    APIRequestHandler.service = BatchService(args.workers, args.queue_size, args.job_concurrency)
+    APIRequestHandler.allowed_roots = [os.path.realpath(root) for root in args.allow_root]
+
+    server = ThreadingHTTPServer((args.host, args.port), APIRequestHandler)
+    server.daemon_threads = True
+    print(f"🚀 Resume Parser API listening on http://{args.host}:{args.port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️ Shutting down API server...")
+    finally:
+        server.server_close()
+        APIRequestHandler.service.executor.shutdown(wait=False, cancel_futures=True)
+
+
+if __name__ == "__main__":
+    main()
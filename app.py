@@ -1,146 +1,421 @@
 import gradio as gr
 import os
-import tempfile
 import shutil
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future, as_completed, wait
 import json
+import time
+import threading
 
 from extract_info import extract_information
 from pdf_parser import extract_text_from_pdf
 from utils import save_to_csv, save_to_excel
+from stats import ExtractionStats
+from session_store import SessionStore, create_session_temp_directory, estimate_record_size
+from result_cache import ResultCache, hash_file
+from skill_index import SkillIndex, QueryError, MANIFEST_FILENAME, search_records
+
+MAX_WORKERS = int(os.environ.get('RESUME_PARSER_WORKERS', os.cpu_count() or 1))
+PREVIEW_UPDATE_INTERVAL = 0.5
+PREVIEW_PAGE_SIZE = 10
+PREVIEW_PAGE_SIZES = [10, 25, 50, 100]
+
+SESSION_IDLE_TIMEOUT = float(os.environ.get('RESUME_PARSER_SESSION_TTL', 3600))
+SESSION_MEMORY_CAP_MB = float(os.environ.get('RESUME_PARSER_SESSION_MEMORY_MB', 512))
+MAX_SESSIONS = int(os.environ.get('RESUME_PARSER_MAX_SESSIONS', 100))
+PROCESS_CONCURRENCY = int(os.environ.get('RESUME_PARSER_PROCESS_CONCURRENCY', 2))
+QUEUE_MAX_SIZE = int(os.environ.get('RESUME_PARSER_QUEUE_SIZE', 32))
+JANITOR_INTERVAL = float(os.environ.get('RESUME_PARSER_JANITOR_INTERVAL', 300))
+
+CACHE_MAX_ENTRIES = int(os.environ.get('RESUME_PARSER_CACHE_ENTRIES', 2000))
+CACHE_MAX_MB = float(os.environ.get('RESUME_PARSER_CACHE_MB', 256))
+CACHE_TTL = float(os.environ.get('RESUME_PARSER_CACHE_TTL', 86400))
+
+SKILL_INDEX_DIR = os.environ.get('RESUME_PARSER_INDEX_DIR')
+SEARCH_RESULT_LIMIT = 50
+
+result_cache = ResultCache(
+    max_entries=CACHE_MAX_ENTRIES,
+    max_bytes=int(CACHE_MAX_MB * 1024 * 1024),
+    ttl=CACHE_TTL
+)
+
+EXPORT_FORMATS = {"CSV": "resume_data.csv", "Excel": "resume_data.xlsx", "JSON": "resume_data.json"}
+
+_executor = None
+_export_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="export")
+_skill_index = None
+_skill_index_mtime = None
+_skill_index_lock = threading.Lock()
+
+def get_executor() -> ProcessPoolExecutor:
+    """Return the process pool shared by all processing requests"""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=MAX_WORKERS)
+    return _executor
+
+def search_skill_index(query: str, limit: int = SEARCH_RESULT_LIMIT):
+    """Search the persistent index, reopening it when `main.py index add` has added segments"""
+    global _skill_index, _skill_index_mtime
+    manifest_path = os.path.join(SKILL_INDEX_DIR, MANIFEST_FILENAME)
+    with _skill_index_lock:
+        mtime = os.path.getmtime(manifest_path)
+        if _skill_index is None or mtime != _skill_index_mtime:
+            if _skill_index is not None:
+                _skill_index.close()
+            _skill_index = SkillIndex(SKILL_INDEX_DIR)
+            _skill_index_mtime = mtime
+        total, names = _skill_index.search(query, limit)
+        return total, names, _skill_index.doc_count
+
+def format_preview_snippet(index: int, resume_data: Dict[str, Any]) -> str:
+    """Render the Markdown preview block for one extracted resume"""
+    lines = [f"**📄 Resume {index}: {resume_data.get('Resume_File', 'Unknown')}**\n"]
+    
+    preview_fields = ['Name', 'Email', 'Phone', 'Skills', 'Work Experience']
+    for field in preview_fields:
+        value = resume_data.get(field, 'Not found')
+        if value and len(str(value)) > 100:
+            value = str(value)[:100] + "..."
+        lines.append(f"- **{field}:** {value}")
+    
+    lines.append("\n" + "-" * 50 + "\n\n")
+    return "\n".join(lines)
+
+def write_export(data: List[Dict[str, Any]], format_type: str, filepath: str) -> str:
+    """Write one export artifact (runs on the background export pool)"""
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    
+    if format_type == "CSV":
+        save_to_csv(data, filepath)
+    
+    elif format_type == "Excel":
+        save_to_excel(data, filepath)
+    
+    elif format_type == "JSON":
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+    
+    return filepath if os.path.exists(filepath) else None
+
+def parse_resume_file(file_path: str, file_name: str) -> Dict[str, Any]:
+    """Extract text and information from one PDF (runs in a worker process)"""
+    start_time = time.perf_counter()
+    try:
+        text = extract_text_from_pdf(file_path)
+        
+        if not text or len(text.strip()) < 50:
+            return {
+                'success': False,
+                'error': f'Little or no text extracted from {file_name}',
+                'data': None,
+                'latency': time.perf_counter() - start_time
+            }
+        
+        extracted_data = extract_information(text)
+        extracted_data['Resume_File'] = file_name
+        
+        return {
+            'success': True,
+            'error': None,
+            'data': extracted_data,
+            'latency': time.perf_counter() - start_time
+        }
+        
+    except Exception as e:
+        return {
+            'success': False,
+            'error': f'Error processing {file_name}: {str(e)}',
+            'data': None,
+            'latency': time.perf_counter() - start_time
+        }
 
 class ResumeParserApp:
     def __init__(self):
         self.processed_data = []
+        self.preview_snippets = []
+        self.stats = ExtractionStats()
         self.temp_dir = None
+        self.data_size = 0
+        self.active_runs = 0
+        self.data_version = 0
+        self.exports = {}
+        self.retired_exports = set()
         
     def create_temp_directory(self):
-        """Create a temporary directory for processing"""
+        """Create the session's temporary directory on first use.
+        
+        It is kept across runs: an export of older data may still be writing
+        into it, and removes its own version directory once it finishes.
+        """
+        if not self.temp_dir:
+            self.temp_dir = create_session_temp_directory()
+        return self.temp_dir
+    
+    def memory_usage(self) -> int:
+        """Approximate bytes held by this session's results"""
+        return self.data_size
+    
+    def is_busy(self) -> bool:
+        return self.active_runs > 0
+    
+    def reset_results(self):
+        """Drop all results; invalidates every memoized export"""
+        self.processed_data = []
+        self.preview_snippets = []
+        self.data_size = 0
+        self.stats = ExtractionStats()
+        self.data_version += 1
+        self.discard_stale_exports()
+    
+    def cleanup(self):
+        """Release results and remove the session's temporary directory"""
+        self.reset_results()
         if self.temp_dir:
+            wait(list(self.retired_exports))
             shutil.rmtree(self.temp_dir, ignore_errors=True)
-        self.temp_dir = tempfile.mkdtemp()
-        return self.temp_dir
+            self.temp_dir = None
+    
+    def lookup_cached(self, file_path: str, file_name: str) -> Tuple[Any, Any]:
+        """Hash an upload and return (hash, cached result or None)"""
+        start_time = time.perf_counter()
+        try:
+            file_hash = hash_file(file_path)
+        except OSError:
+            return None, None
+        
+        record = result_cache.get(file_hash)
+        if record is None:
+            return file_hash, None
+        
+        record['Resume_File'] = file_name
+        return file_hash, {
+            'success': True,
+            'error': None,
+            'data': record,
+            'latency': time.perf_counter() - start_time
+        }
+    
+    def cache_result(self, file_hash: str, result: Dict[str, Any]):
+        """Share a successful extraction with every session via the result cache"""
+        if file_hash and result['success']:
+            record = dict(result['data'])
+            record.pop('Resume_File', None)
+            result_cache.put(file_hash, record)
     
     def process_single_file(self, file_path: str, file_name: str) -> Dict[str, Any]:
         """Process a single PDF file and return extracted data"""
+        file_hash, cached = self.lookup_cached(file_path, file_name)
+        if cached is not None:
+            return cached
+        
+        result = parse_resume_file(file_path, file_name)
+        self.cache_result(file_hash, result)
+        return result
+    
+    def iter_results(self, files: List[Any]) -> Iterator[Dict[str, Any]]:
+        """Yield one result per upload: cache hits first, then worker results as they complete"""
+        executor = get_executor()
+        cached_results = []
+        pending = {}
+        future_hashes = {}
+        futures_by_hash = {}
+        
         try:
-            text = extract_text_from_pdf(file_path)
-            
-            if not text or len(text.strip()) < 50:
-                return {
-                    'success': False,
-                    'error': f'Little or no text extracted from {file_name}',
-                    'data': None
-                }
+            for file in files:
+                file_name = os.path.basename(file.name)
+                file_hash, cached = self.lookup_cached(file.name, file_name)
+                
+                if cached is not None:
+                    cached_results.append(cached)
+                elif file_hash in futures_by_hash:
+                    pending[futures_by_hash[file_hash]].append(file_name)
+                else:
+                    future = executor.submit(parse_resume_file, file.name, file_name)
+                    pending[future] = [file_name]
+                    future_hashes[future] = file_hash
+                    if file_hash:
+                        futures_by_hash[file_hash] = future
             
-            extracted_data = extract_information(text)
-            extracted_data['Resume_File'] = file_name
+            yield from cached_results
             
-            return {
-                'success': True,
-                'error': None,
-                'data': extracted_data
-            }
-            
-        except Exception as e:
-            return {
-                'success': False,
-                'error': f'Error processing {file_name}: {str(e)}',
-                'data': None
-            }
+            for future in as_completed(list(pending)):
+                result = future.result()
+                self.cache_result(future_hashes[future], result)
+                
+                for i, file_name in enumerate(pending[future]):
+                    if i and result['success']:
+                        result = dict(result, data=dict(result['data'], Resume_File=file_name))
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    def add_record(self, record: Dict[str, Any], latency: float = None):
+        """Store a successful extraction and its cached preview snippet"""
+        snippet = format_preview_snippet(len(self.processed_data) + 1, record)
+        self.processed_data.append(record)
+        self.preview_snippets.append(snippet)
+        self.data_size += estimate_record_size(record) + len(snippet)
+        self.stats.add_record(record, latency)
+        self.data_version += 1
+    
+    def format_summary(self, total_files: int, successful_count: int, failed_count: int) -> str:
+        """Format the processing summary for the files completed so far"""
+        completed = successful_count + failed_count
+        success_rate = (successful_count / completed) * 100 if completed > 0 else 0
+        status = "📊 **Processing Summary**" if completed == total_files else f"⏳ **Processing… {completed}/{total_files} files done**"
+        
+        return f"""
+        {status}
+        
+        - **Total files processed:** {completed}/{total_files}
+        - **✅ Successful extractions:** {successful_count}
+        - **❌ Failed extractions:** {failed_count}
+        - **📈 Success rate:** {success_rate:.1f}%
+        """
     
-    def process_files(self, files: List[Any], progress=gr.Progress()) -> Tuple[str, str, str]:
-        """Process multiple PDF files"""
+    def process_files(self, files: List[Any], progress=gr.Progress(),
+                      memory_cap_bytes: int = None) -> Iterator[Tuple[str, str, str]]:
+        """Process multiple PDF files on the worker pool, yielding partial results as files complete.
+        
+        Stops early once this session's results reach `memory_cap_bytes`.
+        """
         if not files:
-            return "❌ No files uploaded", "", ""
+            yield "❌ No files uploaded", "", ""
+            return
         
-        temp_dir = self.create_temp_directory()
+        self.reset_results()
+        self.create_temp_directory()
         
-        self.processed_data = []
         successful_count = 0
         failed_count = 0
         error_messages = []
-        
-        progress(0, desc="Starting processing...")
-        
-        for i, file in enumerate(files):
-            progress((i + 1) / len(files), desc=f"Processing file {i + 1}/{len(files)}")
-            
-            file_name = os.path.basename(file.name)
-            
-            result = self.process_single_file(file.name, file_name)
-            
-            if result['success']:
-                self.processed_data.append(result['data'])
-                successful_count += 1
-            else:
-                failed_count += 1
-                error_messages.append(result['error'])
-        
         total_files = len(files)
-        success_rate = (successful_count / total_files) * 100 if total_files > 0 else 0
-        
-        summary = f"""
-        📊 **Processing Summary**
         
-        - **Total files processed:** {total_files}
-        - **✅ Successful extractions:** {successful_count}
-        - **❌ Failed extractions:** {failed_count}
-        - **📈 Success rate:** {success_rate:.1f}%
-        """
-        
-        preview = self.generate_preview()
+        progress(0, desc="Starting processing...")
         
-        error_report = "\n".join(error_messages) if error_messages else "No errors occurred."
+        results = self.iter_results(files)
+        last_update = time.monotonic()
+        self.active_runs += 1
         
-        return summary, preview, error_report
+        try:
+            for result in results:
+                if memory_cap_bytes and self.data_size >= memory_cap_bytes:
+                    skipped = total_files - successful_count - failed_count
+                    error_messages.append(f"⚠️ Session memory limit of {memory_cap_bytes / (1024 * 1024):.0f} MB "
+                                          f"reached, {skipped} file(s) were not processed")
+                    yield (self.format_summary(total_files, successful_count, failed_count),
+                           self.generate_preview(), "\n".join(error_messages))
+                    return
+                
+                if result['success']:
+                    self.add_record(result['data'], result['latency'])
+                    successful_count += 1
+                else:
+                    self.stats.add_failure(result['latency'])
+                    failed_count += 1
+                    error_messages.append(result['error'])
+                
+                completed = successful_count + failed_count
+                progress(completed / total_files, desc=f"Processed {completed}/{total_files} files")
+                
+                if completed < total_files and time.monotonic() - last_update < PREVIEW_UPDATE_INTERVAL:
+                    continue
+                last_update = time.monotonic()
+                
+                error_report = "\n".join(error_messages) if error_messages else "No errors occurred."
+                yield self.format_summary(total_files, successful_count, failed_count), self.generate_preview(), error_report
+        finally:
+            self.active_runs -= 1
+            results.close()
     
-    def generate_preview(self) -> str:
-        """Generate a preview of extracted data"""
+    def page_count(self, page_size: int = PREVIEW_PAGE_SIZE) -> int:
+        return max(1, -(-len(self.preview_snippets) // page_size))
+    
+    def generate_preview(self, page: int = 1, page_size: int = PREVIEW_PAGE_SIZE) -> str:
+        """Generate one page of the extracted data preview from cached snippets"""
         if not self.processed_data:
             return "No data available for preview."
         
-        preview_text = "📋 **Extraction Preview**\n\n"
+        page_size = max(1, int(page_size))
+        total_pages = self.page_count(page_size)
+        page = min(max(1, int(page)), total_pages)
+        start = (page - 1) * page_size
         
-        for i, resume_data in enumerate(self.processed_data[:], 1):
-            preview_text += f"**📄 Resume {i}: {resume_data.get('Resume_File', 'Unknown')}**\n\n"
-            
-            preview_fields = ['Name', 'Email', 'Phone', 'Skills', 'Work Experience']
-            for field in preview_fields:
-                value = resume_data.get(field, 'Not found')
-                if value and len(str(value)) > 100:
-                    value = str(value)[:100] + "..."
-                preview_text += f"- **{field}:** {value}\n"
-            
-            preview_text += "\n" + "-" * 50 + "\n\n"
-        return preview_text
+        header = (f"📋 **Extraction Preview** — page {page} of {total_pages} "
+                  f"({len(self.preview_snippets)} resumes)\n\n")
+        return header + "".join(self.preview_snippets[start:start + page_size])
     
-    def download_results(self, format_type: str) -> str:
-        """Generate download file"""
-        if not self.processed_data:
+    def show_preview_page(self, page: int, page_size: int) -> Tuple[str, int]:
+        """Clamp the requested page and render it"""
+        page_size = max(1, int(page_size or PREVIEW_PAGE_SIZE))
+        page = min(max(1, int(page or 1)), self.page_count(page_size))
+        return self.generate_preview(page, page_size), page
+    
+    def export_path(self, version: int, format_type: str) -> str:
+        return os.path.join(self.temp_dir, f"v{version}", EXPORT_FORMATS[format_type])
+    
+    def discard_stale_exports(self):
+        """Forget exports of older data versions and delete their files once written"""
+        for key in [key for key in self.exports if key[0] != self.data_version]:
+            future = self.exports.pop(key)
+            if not future.cancel():
+                self.retired_exports.add(future)
+                future.add_done_callback(self.retired_exports.discard)
+            if self.temp_dir:
+                version_dir = os.path.dirname(self.export_path(key[0], key[1]))
+                future.add_done_callback(lambda _, path=version_dir: shutil.rmtree(path, ignore_errors=True))
+    
+    def prepare_export(self, format_type: str) -> Future:
+        """Start (or reuse) the background export for the current data version"""
+        if not self.processed_data or format_type not in EXPORT_FORMATS:
             return None
         
+        self.discard_stale_exports()
+        key = (self.data_version, format_type)
+        if key not in self.exports:
+            filepath = self.export_path(self.data_version, format_type)
+            self.exports[key] = _export_executor.submit(write_export, list(self.processed_data), format_type, filepath)
+        return self.exports[key]
+    
+    def download_results(self, format_type: str) -> str:
+        """Generate download file, reusing the memoized artifact when data hasn't changed"""
+        future = self.prepare_export(format_type)
+        if future is None:
+            return None
         
-        if format_type == "CSV":
-            filename = f"resume_data.csv"
-            filepath = os.path.join(self.temp_dir, filename)
-            save_to_csv(self.processed_data, filepath)
-            return filepath
-        
-        elif format_type == "Excel":
-            filename = f"resume_data.xlsx"
-            filepath = os.path.join(self.temp_dir, filename)
-            save_to_excel(self.processed_data, filepath)
-            return filepath
-        
-        elif format_type == "JSON":
-            filename = f"resume_data.json"
-            filepath = os.path.join(self.temp_dir, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(self.processed_data, f, indent=2, ensure_ascii=False)
-            return filepath
+        return future.result()
+    
+    def search_skills(self, query: str) -> str:
+        """Boolean skill search over the persistent index, or this session's results without one"""
+        query = (query or "").strip()
+        if not query:
+            return "Enter a query such as `python AND (django OR flask) NOT php`."
         
-        return None
+        try:
+            if SKILL_INDEX_DIR and os.path.exists(os.path.join(SKILL_INDEX_DIR, MANIFEST_FILENAME)):
+                total, names, searched = search_skill_index(query)
+                source = f"{searched} indexed resumes"
+            else:
+                if not self.processed_data:
+                    return "Process some resumes to search them..."
+                matches = search_records(self.processed_data, query)
+                total = len(matches)
+                names = [self.processed_data[i].get('Resume_File', 'Unknown') for i in matches[:SEARCH_RESULT_LIMIT]]
+                searched = len(self.processed_data)
+                source = f"{searched} resumes from this session"
+        except QueryError as e:
+            return str(e)
+        except OSError as e:
+            return f"❌ Index error: {e}"
+        
+        result_text = f"🔍 **{total} of {source} match** `{query}`\n\n"
+        result_text += "".join(f"- {name}\n" for name in names)
+        if total > len(names):
+            result_text += f"\n…and {total - len(names)} more\n"
+        return result_text
     
     def get_statistics(self) -> str:
         """Generate detailed statistics"""
@@ -149,31 +424,66 @@ class ResumeParserApp:
         
         stats_text = "📊 **Detailed Statistics**\n\n"
         
-        fields = ['Name', 'Email', 'Phone', 'Skills', 'Work Experience', 
-                 'Education', 'Projects', 'Hobbies', 'Qualities']
-        
         stats_text += "**Field Completion Rates:**\n\n"
-        for field in fields:
-            completed = sum(1 for item in self.processed_data if item.get(field))
-            percentage = (completed / len(self.processed_data)) * 100
-            stats_text += f"- **{field}:** {completed}/{len(self.processed_data)} ({percentage:.1f}%)\n"
-        
-        all_skills = []
-        for resume in self.processed_data:
-            skills = resume.get('Skills', '')
-            if skills:
-                all_skills.extend([skill.strip() for skill in skills.split(',')])
-        
-        if all_skills:
-            from collections import Counter
-            top_skills = Counter(all_skills).most_common(10)
+        for field, completed, total, percentage in self.stats.completion_rates():
+            stats_text += f"- **{field}:** {completed}/{total} ({percentage:.1f}%)\n"
+        
+        top_skills = self.stats.top_skills(10)
+        if top_skills:
             stats_text += "\n**Top 10 Most Common Skills:**\n\n"
             for skill, count in top_skills:
                 stats_text += f"- **{skill}:** {count} resumes\n"
         
+        if self.stats.average_latency is not None:
+            stats_text += f"\n**⏱️ Average extraction time:** {self.stats.average_latency:.2f}s per file\n"
+        
+        cache_stats = result_cache.stats()
+        stats_text += (f"\n**♻️ Result cache hit rate:** {cache_stats['hit_rate']:.1f}% "
+                       f"({cache_stats['hits']} hits, {cache_stats['misses']} misses, "
+                       f"{cache_stats['entries']} cached resumes)\n")
+        
         return stats_text
 
-app = ResumeParserApp()
+sessions = SessionStore(
+    ResumeParserApp,
+    idle_timeout=SESSION_IDLE_TIMEOUT,
+    memory_cap_bytes=int(SESSION_MEMORY_CAP_MB * 1024 * 1024),
+    max_sessions=MAX_SESSIONS
+)
+
+def process_files(files: List[Any], request: gr.Request, progress=gr.Progress()):
+    """Run processing against the caller's own session, charging its memory to it even when cancelled"""
+    try:
+        yield from sessions.get(request.session_hash).process_files(files, progress, sessions.memory_cap_bytes)
+    finally:
+        sessions.charge(request.session_hash)
+
+def download_results(format_type: str, request: gr.Request) -> str:
+    return sessions.get(request.session_hash).download_results(format_type)
+
+def show_preview_page(page: int, page_size: int, request: gr.Request) -> Tuple[str, int]:
+    return sessions.get(request.session_hash).show_preview_page(page, page_size)
+
+def show_previous_page(page: int, page_size: int, request: gr.Request) -> Tuple[str, int]:
+    return show_preview_page((page or 1) - 1, page_size, request)
+
+def show_next_page(page: int, page_size: int, request: gr.Request) -> Tuple[str, int]:
+    return show_preview_page((page or 1) + 1, page_size, request)
+
+def show_first_page(page_size: int, request: gr.Request) -> Tuple[str, int]:
+    return show_preview_page(1, page_size, request)
+
+def prepare_export(format_type: str, request: gr.Request):
+    sessions.get(request.session_hash).prepare_export(format_type)
+
+def get_statistics(request: gr.Request) -> str:
+    return sessions.get(request.session_hash).get_statistics()
+
+def search_skills(query: str, request: gr.Request) -> str:
+    return sessions.get(request.session_hash).search_skills(query)
+
+def end_session(request: gr.Request):
+    sessions.evict(request.session_hash)
 
 custom_css = """
 .gradio-container {
@@ -381,6 +691,10 @@ def create_interface():
                                 variant="primary", 
                                 size="lg"
                             )
+                            stop_btn = gr.Button(
+                                "⏹️ Stop", 
+                                variant="stop"
+                            )
                             clear_btn = gr.Button(
                                 "🗑️ Clear All", 
                                 variant="secondary"
@@ -411,6 +725,21 @@ def create_interface():
                             label="Data Preview",
                             value="Upload and process files to see preview here..."
                         )
+                        
+                        with gr.Row():
+                            prev_page_btn = gr.Button("⬅️ Previous", size="sm")
+                            page_number = gr.Number(
+                                value=1,
+                                precision=0,
+                                minimum=1,
+                                label="Page"
+                            )
+                            page_size = gr.Dropdown(
+                                choices=PREVIEW_PAGE_SIZES,
+                                value=PREVIEW_PAGE_SIZE,
+                                label="Resumes per page"
+                            )
+                            next_page_btn = gr.Button("Next ➡️", size="sm")
                     
                     with gr.Column(scale=1):
                         with gr.Group():
@@ -431,6 +760,18 @@ def create_interface():
                                 label="Download File",
                                 visible=False
                             )
+                        
+                        with gr.Group():
+                            gr.HTML("<h3>🔍 Search by Skills</h3>")
+                            
+                            search_query = gr.Textbox(
+                                label="Query",
+                                placeholder="python AND (django OR flask) NOT php"
+                            )
+                            
+                            search_btn = gr.Button("🔍 Search", variant="secondary")
+                            
+                            search_output = gr.Markdown()
             
             with gr.TabItem("📈 Statistics", elem_id="stats-tab"):
                 with gr.Row():
@@ -458,15 +799,65 @@ def create_interface():
         </div>
         """)
         
-        process_btn.click(
-            fn=app.process_files,
+        process_event = process_btn.click(
+            fn=process_files,
             inputs=[file_upload],
             outputs=[summary_output, preview_output, error_output],
-            show_progress=True
+            show_progress=True,
+            concurrency_limit=PROCESS_CONCURRENCY,
+            concurrency_id="processing"
+        )
+        
+        process_event.then(
+            fn=get_statistics,
+            outputs=[stats_output]
+        ).then(
+            fn=prepare_export,
+            inputs=[format_dropdown]
+        )
+        
+        format_dropdown.change(
+            fn=prepare_export,
+            inputs=[format_dropdown]
+        )
+        
+        process_btn.click(
+            fn=lambda: 1,
+            outputs=[page_number]
+        )
+        
+        prev_page_btn.click(
+            fn=show_previous_page,
+            inputs=[page_number, page_size],
+            outputs=[preview_output, page_number]
+        )
+        
+        next_page_btn.click(
+            fn=show_next_page,
+            inputs=[page_number, page_size],
+            outputs=[preview_output, page_number]
+        )
+        
+        page_number.submit(
+            fn=show_preview_page,
+            inputs=[page_number, page_size],
+            outputs=[preview_output, page_number]
+        )
+        
+        page_size.change(
+            fn=show_first_page,
+            inputs=[page_size],
+            outputs=[preview_output, page_number]
+        )
+        
+        stop_btn.click(
+            fn=get_statistics,
+            outputs=[stats_output],
+            cancels=[process_event]
         )
         
         download_btn.click(
-            fn=lambda format_type: app.download_results(format_type),
+            fn=download_results,
             inputs=[format_dropdown],
             outputs=[download_file]
         ).then(
@@ -476,24 +867,36 @@ def create_interface():
         )
         
         refresh_stats_btn.click(
-            fn=app.get_statistics,
+            fn=get_statistics,
             outputs=[stats_output]
         )
         
+        search_btn.click(
+            fn=search_skills,
+            inputs=[search_query],
+            outputs=[search_output]
+        )
+        
+        search_query.submit(
+            fn=search_skills,
+            inputs=[search_query],
+            outputs=[search_output]
+        )
+        
         clear_btn.click(
             fn=lambda: (None, "", "", "", "Process some resumes to see detailed statistics..."),
-            outputs=[file_upload, summary_output, preview_output, error_output, stats_output]
+            outputs=[file_upload, summary_output, preview_output, error_output, stats_output],
+            cancels=[process_event]
         )
         
-        process_btn.click(
-            fn=app.get_statistics,
-            outputs=[stats_output]
-        )
+        demo.unload(end_session)
     
     return demo
 
 if __name__ == "__main__":
     demo = create_interface()
+    demo.queue(max_size=QUEUE_MAX_SIZE)
+    sessions.start_janitor(JANITOR_INTERVAL)
     
     demo.launch(
         server_name="0.0.0.0",  
@@ -0,0 +1,80 @@
+"""Compare per-document and batch Email/Phone extraction over many texts.
+
+Times extract_email + extract_phone_number called document by document,
+extract_contacts over the whole list, and pandas Series.str.extract with the
+same patterns for reference, on the texts of a synthetic corpus. Checks that
+extract_contacts returns exactly the per-document values.
+
+    python benchmarks/bench_contacts.py --count 5000
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_corpus import iter_corpus
+from extract_info import extract_contacts, extract_email, extract_phone_number, get_extractor
+
+
+def best_of(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def pandas_contacts(series):
+    """Series.str.extract with stdlib re; leaves out the email.com rule, so it only gives a lower bound"""
+    import re
+
+    extractor = get_extractor()
+    emails = series.str.extract('(' + extractor.email_pattern + ')', flags=re.IGNORECASE)[0]
+    phones = series.str.extract(extractor.phone_pattern)
+    return emails, phones
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-document vs batch contact extraction")
+    parser.add_argument('--count', type=int, default=2000, help='Synthetic texts to extract from')
+    parser.add_argument('--seed', type=int, default=0, help='Corpus seed')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per method, the fastest is kept')
+    parser.add_argument('--output', help='Also write the results as JSON to this file')
+    args = parser.parse_args()
+
+    texts = [text for _, _, text, _ in iter_corpus(args.count, seed=args.seed)]
+    per_document, per_document_s = best_of(
+        lambda: {'Email': [extract_email(text) for text in texts],
+                 'Phone': [extract_phone_number(text) for text in texts]}, args.repeat)
+    batch, batch_s = best_of(lambda: extract_contacts(texts), args.repeat)
+    if batch != per_document:
+        raise SystemExit("❌ extract_contacts differs from the per-document extraction")
+
+    results = {'texts': len(texts), 'per_document_s': round(per_document_s, 4), 'batch_s': round(batch_s, 4)}
+    print(f"{len(texts)} texts   per document {per_document_s * 1000:8.1f} ms   "
+          f"extract_contacts {batch_s * 1000:8.1f} ms (x{per_document_s / batch_s:.2f})")
+    try:
+        import pandas as pd
+    except ImportError:
+        print("⚠️ pandas not installed, skipping Series.str.extract")
+    else:
+        series = pd.Series(texts, dtype=object)
+        _, pandas_s = best_of(lambda: pandas_contacts(series), args.repeat)
+        results['pandas_str_extract_s'] = round(pandas_s, 4)
+        print(f"{'':>{len(str(len(texts))) + 9}}Series.str.extract {pandas_s * 1000:8.1f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"📝 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
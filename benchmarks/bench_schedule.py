@@ -0,0 +1,111 @@
+"""Compare discovery-order and longest-first (LPT) scheduling of a skewed batch.
+
+Generates a corpus of short resumes with a few long documents scattered
+through it, times each document once with process_single_resume, then
+replays the measured times on N workers that pull the next file when they
+become free, as the pipeline's parse workers do. Reports the makespan of
+both orders against the ideal (total time / N). Replaying lets the orders be
+compared on any worker count on one machine. Documents that lpt_schedule
+gives page workers are replayed as occupying that many workers for an even
+share of their time each, plus --split-overhead for starting the page
+processes and opening the PDF in each, when they reach the page splitting
+threshold. The tail rule of the pipeline is not modelled.
+
+    python benchmarks/bench_schedule.py --count 200 --long 6 --workers 4,8,16
+"""
+import os
+import sys
+import json
+import heapq
+import random
+import argparse
+import tempfile
+from functools import partial
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_corpus import generate_resume
+from pipeline import profiled_call
+from scheduler import estimate_page_count, lpt_schedule
+from pdf_parser import PAGE_PARALLEL_MIN_PAGES
+
+
+def write_corpus(output_dir, count, long_count, long_pages, seed):
+    """Write `count` resumes of 1-3 pages, `long_count` of them `long_pages` long, at random positions"""
+    rng = random.Random(seed)
+    long_indexes = set(rng.sample(range(count), long_count))
+    paths = []
+    for index in range(count):
+        resume_rng = random.Random(rng.getrandbits(64))
+        pages = resume_rng.randint(*long_pages) if index in long_indexes else resume_rng.randint(1, 3)
+        pdf, _, _ = generate_resume(resume_rng, page_count=pages, column_count=resume_rng.randint(1, 2), noise=0.1)
+        path = os.path.join(output_dir, f"resume_{index:05d}.pdf")
+        with open(path, 'wb') as f:
+            f.write(pdf)
+        paths.append(path)
+    return paths
+
+
+def makespan(jobs, workers, split_overhead=0.0):
+    """Finish time of the last of the (duration, page workers) jobs when each goes to the first workers to become free"""
+    free_at = [0.0] * workers
+    for duration, split in jobs:
+        split = min(split, workers)
+        start = max(heapq.heappop(free_at) for _ in range(split))
+        if split > 1:
+            duration *= 1 + split_overhead
+        for _ in range(split):
+            heapq.heappush(free_at, start + duration / split)
+    return max(free_at)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark discovery-order vs LPT scheduling of a skewed batch")
+    parser.add_argument('--count', type=int, default=120, help='Resumes in the batch')
+    parser.add_argument('--long', type=int, default=4, help='How many of them are long documents')
+    parser.add_argument('--long-pages', default='40-80', help='Page range of the long documents')
+    parser.add_argument('--workers', default='2,4,8', help='Comma-separated worker counts to replay')
+    parser.add_argument('--split-overhead', type=float, default=0.4,
+                        help='Extra CPU time of a split document, as a fraction of its serial time')
+    parser.add_argument('--seed', type=int, default=3, help='Corpus seed')
+    parser.add_argument('--output', help='Also write the results as JSON to this file')
+    args = parser.parse_args()
+
+    from main import process_single_resume
+
+    low, _, high = args.long_pages.partition('-')
+    with tempfile.TemporaryDirectory() as corpus_dir:
+        paths = write_corpus(corpus_dir, args.count, args.long, (int(low), int(high or low)), args.seed)
+        process_fn = partial(process_single_resume, verbose=False)
+        durations = {}
+        splittable = set()
+        for path in paths:
+            _, durations[path], _ = profiled_call(process_fn, path, os.path.basename(path))
+            if (estimate_page_count(path) or 0) >= PAGE_PARALLEL_MIN_PAGES:
+                splittable.add(os.path.basename(path))
+        inputs = [(path, os.path.basename(path)) for path in paths]
+        schedules = {workers: lpt_schedule(inputs, workers) for workers in map(int, args.workers.split(','))}
+
+    total = sum(durations.values())
+    print(f"{args.count} resumes ({args.long} long), {total:.1f}s of processing in total")
+    results = []
+    for workers, (ordered, page_workers) in schedules.items():
+        ideal = total / workers
+        fifo = makespan([(durations[path], 1) for path in paths], workers)
+        lpt = makespan([(durations[path], page_workers.get(name, 1) if name in splittable else 1)
+                        for path, name in ordered], workers, args.split_overhead)
+        results.append({'workers': workers, 'ideal_s': round(ideal, 3), 'fifo_s': round(fifo, 3),
+                        'lpt_s': round(lpt, 3)})
+        print(f"{workers:>3} workers   ideal {ideal:7.2f}s   discovery order {fifo:7.2f}s ({ideal / fifo:.0%})   "
+              f"longest first {lpt:7.2f}s ({ideal / lpt:.0%})")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"📝 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Compare pickling with the shared memory transport between the pipeline and its workers.
+
+Each round trip sends a PDF-sized payload to a worker process and brings back
+a record of nine text fields, the way the pipeline's parse stage does, and
+only the transfer is measured: the worker does no parsing. Sizes cover
+ordinary resumes up to long portfolios.
+
+    python benchmarks/bench_transport.py
+    python benchmarks/bench_transport.py --payload-kb 200,2000 --field-kb 5,100 --repeat 50
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from pipeline import profiled_call
+from shm_transport import SharedMemoryTransport, shared_call
+
+FIELDS = ['Name', 'Email', 'Phone', 'Skills', 'Work Experience', 'Education', 'Projects', 'Hobbies', 'Qualities']
+
+
+def fake_process(source, name, field_kb=1, timings=None):
+    """Stand-in for process_single_resume: touch the input, return a record of `field_kb` KB per field"""
+    value = ("x" * 1023 + "\n") * field_kb
+    record = {field: value for field in FIELDS}
+    record['Resume Name'] = f"{name} ({len(source)} bytes)"
+    return record
+
+
+def run_pickle(executor, process_fn, payload, repeat):
+    samples = []
+    for index in range(repeat):
+        start_time = time.perf_counter()
+        record, _, _ = executor.submit(profiled_call, process_fn, payload, f"r{index}", {}).result()
+        samples.append(time.perf_counter() - start_time)
+    return samples
+
+
+def run_shared(executor, transport, process_fn, payload, repeat):
+    samples = []
+    slot = transport.slots[0]
+    for index in range(repeat):
+        start_time = time.perf_counter()
+        handle = slot.send(payload)
+        result, _, _ = executor.submit(shared_call, process_fn, handle, f"r{index}", {}).result()
+        assert slot.receive(result)['Resume Name'] == f"r{index} ({len(payload)} bytes)"
+        samples.append(time.perf_counter() - start_time)
+    return samples
+
+
+def summarize(samples):
+    return {'p50_ms': round(statistics.median(samples) * 1000, 3),
+            'mean_ms': round(statistics.fmean(samples) * 1000, 3)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pickle vs shared memory transport to worker processes")
+    parser.add_argument('--payload-kb', default='100,1000,8000', help='Comma-separated PDF payload sizes in KB')
+    parser.add_argument('--field-kb', default='1,20,200', help='Comma-separated sizes in KB of each of the nine fields')
+    parser.add_argument('--repeat', type=int, default=30, help='Round trips per case')
+    parser.add_argument('--output', help='Also write the results as JSON to this file')
+    args = parser.parse_args()
+
+    results = []
+    with ProcessPoolExecutor(max_workers=1) as executor, SharedMemoryTransport(1) as transport:
+        executor.submit(os.getpid).result()
+        for payload_kb in (int(size) for size in args.payload_kb.split(',')):
+            payload = os.urandom(payload_kb * 1024)
+            for field_kb in (int(size) for size in args.field_kb.split(',')):
+                process_fn = partial(fake_process, field_kb=field_kb)
+                run_pickle(executor, process_fn, payload, 2)
+                run_shared(executor, transport, process_fn, payload, 2)
+                pickled = summarize(run_pickle(executor, process_fn, payload, args.repeat))
+                shared = summarize(run_shared(executor, transport, process_fn, payload, args.repeat))
+                speedup = pickled['p50_ms'] / shared['p50_ms'] if shared['p50_ms'] else 0.0
+                results.append({'payload_kb': payload_kb, 'field_kb': field_kb,
+                                'pickle': pickled, 'shared_memory': shared, 'speedup': round(speedup, 2)})
+                print(f"payload {payload_kb:>6} KB  fields 9x{field_kb:>4} KB   "
+                      f"pickle {pickled['p50_ms']:>9.3f} ms   shared memory {shared['p50_ms']:>9.3f} ms   "
+                      f"x{speedup:.2f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"📝 Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Import-time regression check for the CLI and worker entry points.
+
+Measures cumulative import time with ``python -X importtime`` and fails when
+a module imports a heavy dependency it should defer, or when its import time
+regresses beyond the threshold over the recorded baseline. Timings depend on
+the machine, so record the baseline on yours first; without one only the
+deferred imports are checked.
+
+    python benchmarks/check_import_time.py
+    python benchmarks/check_import_time.py --update-baseline
+"""
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "importtime_baseline.json")
+
+# Modules that must stay importable without pulling in heavy dependencies.
+DEFERRED_IMPORTS = {
+    'main': ['pandas', 'openpyxl', 'pdfplumber', 'PyPDF2', 'regex', 'sqlite3',
+             'metrics', 'dedupe', 'text_corpus', 'discovery'],
+    'utils': ['pandas', 'openpyxl'],
+    'stats': ['pandas', 'openpyxl', 'pdfplumber', 'PyPDF2', 'regex'],
+}
+
+
+def measure_import(module, runs=5):
+    """Return (best cumulative import time in microseconds, imported module names)"""
+    best = None
+    imported = set()
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=REPO_ROOT, capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"Importing {module} failed:\n{completed.stderr.strip()}")
+
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line:
+                continue
+            fields = line[len("import time:"):].split("|")
+            name = fields[2].rstrip()
+            if not fields[1].strip().isdigit():
+                continue
+            imported.add(name.strip())
+            if name == f" {module}":
+                cumulative = int(fields[1])
+                best = cumulative if best is None else min(best, cumulative)
+    return best, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check module import times against a baseline")
+    parser.add_argument('--runs', type=int, default=5, help='Measurements per module (best is kept)')
+    parser.add_argument('--threshold', type=float, default=0.5,
+                        help='Allowed fractional regression over the baseline')
+    parser.add_argument('--update-baseline', action='store_true', help='Record current timings as the baseline')
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    failures = []
+    results = {}
+    for module, deferred in DEFERRED_IMPORTS.items():
+        cumulative, imported = measure_import(module, args.runs)
+        results[module] = cumulative
+
+        eager = [name for name in deferred if name in imported]
+        if eager:
+            failures.append(f"{module} imports {', '.join(eager)} at import time")
+
+        limit = baseline.get(module)
+        status = "ok"
+        if limit is not None and cumulative > limit * (1 + args.threshold):
+            status = "REGRESSION"
+            failures.append(f"{module} import took {cumulative} us (baseline {limit} us)")
+        print(f"{module:<12} {cumulative:>8} us  baseline {limit if limit is not None else '-':>8}  {status}")
+
+    if args.update_baseline:
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {BASELINE_FILE}")
+    elif not baseline:
+        print("ℹ️ No baseline recorded on this machine; run with --update-baseline to record one")
+
+    if failures:
+        print("\n".join(f"❌ {failure}" for failure in failures))
+        sys.exit(1)
+    print("✅ Import times within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""End-to-end benchmarks on an offline synthetic resume corpus.
+
+Generates a deterministic corpus with synthetic_corpus.py, then times
+`extract_text_from_pdf`, `clean_extracted_text`, every `ResumeInfoExtractor`
+extraction method and every `utils` writer separately. Results are written as
+JSON and compared with the recorded baseline; the run fails when a benchmark's
+median regresses beyond the threshold. Benchmarks whose dependencies are not
+installed are reported as skipped.
+
+    python benchmarks/run_benchmarks.py --count 2000
+    python benchmarks/run_benchmarks.py --only extract. --threshold 0.2
+    python benchmarks/run_benchmarks.py --update-baseline
+"""
+import os
+import io
+import sys
+import json
+import time
+import shutil
+import random
+import argparse
+import platform
+import tempfile
+import statistics
+import contextlib
+import importlib.util
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARK_DIR)
+BASELINE_FILE = os.path.join(BENCHMARK_DIR, "benchmark_baseline.json")
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, BENCHMARK_DIR)
+
+from synthetic_corpus import iter_corpus, parse_range
+
+EXTRACTOR_METHODS = ['extract_name', 'extract_email', 'extract_phone_number', 'extract_education',
+                     'extract_skills', 'extract_projects', 'extract_work_experience',
+                     'extract_hobbies', 'extract_qualities']
+
+# writer name -> (modules it needs, output suffix)
+WRITERS = {
+    'save_to_csv': (['pandas'], '.csv'),
+    'save_to_excel': (['pandas', 'openpyxl'], '.xlsx'),
+    'save_to_excel_chunked': (['pandas', 'openpyxl'], '.xlsx'),
+    'save_to_jsonl': ([], '.jsonl'),
+    'save_to_parquet': (['pandas', 'pyarrow'], '.parquet'),
+    'CsvSink': ([], '.csv'),
+}
+
+
+def missing_modules(modules):
+    return [module for module in modules if importlib.util.find_spec(module) is None]
+
+
+def summarize(samples):
+    """Per-call statistics in milliseconds for a list of durations in seconds"""
+    ordered = sorted(samples)
+    return {
+        'n': len(ordered),
+        'total_s': round(sum(ordered), 6),
+        'mean_ms': round(statistics.fmean(ordered) * 1000, 4),
+        'p50_ms': round(statistics.median(ordered) * 1000, 4),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 4),
+        'max_ms': round(ordered[-1] * 1000, 4),
+    }
+
+
+def time_calls(fn, inputs, warmup=True):
+    """Time `fn` on each input; an untimed first call keeps lazy imports out of the samples"""
+    inputs = list(inputs)
+    if warmup and inputs:
+        fn(inputs[0])
+    samples = []
+    for item in inputs:
+        start_time = time.perf_counter()
+        fn(item)
+        samples.append(time.perf_counter() - start_time)
+    return samples
+
+
+@contextlib.contextmanager
+def quiet():
+    """Swallow the emoji progress prints of the code under test"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def bench_parsing(paths, raw_texts, results):
+    """Time PDF text extraction and text cleaning; return cleaned texts for the extractor benchmarks"""
+    missing = missing_modules(['regex'])
+    if missing:
+        for name in ('pdf.extract_text_from_pdf', 'pdf.clean_extracted_text'):
+            results[name] = {'skipped': f"missing {', '.join(missing)}"}
+        return None
+
+    from pdf_parser import extract_text_from_pdf, clean_extracted_text
+
+    missing_pdf = missing_modules(['pdfplumber', 'PyPDF2'])
+    if missing_pdf:
+        results['pdf.extract_text_from_pdf'] = {'skipped': f"missing {', '.join(missing_pdf)}"}
+    else:
+        with quiet():
+            results['pdf.extract_text_from_pdf'] = summarize(time_calls(extract_text_from_pdf, paths))
+
+    results['pdf.clean_extracted_text'] = summarize(time_calls(clean_extracted_text, raw_texts))
+    return [clean_extracted_text(text) for text in raw_texts]
+
+
+def bench_extractor(texts, results):
+    """Time each ResumeInfoExtractor method on the cleaned corpus; return extracted records"""
+    if texts is None:
+        for method in EXTRACTOR_METHODS:
+            results[f"extract.{method}"] = {'skipped': 'missing regex'}
+        return None
+
+    from extract_info import ResumeInfoExtractor, extract_information
+
+    extractor = ResumeInfoExtractor()
+    for method in EXTRACTOR_METHODS:
+        results[f"extract.{method}"] = summarize(time_calls(getattr(extractor, method), texts))
+
+    records = []
+    for index, text in enumerate(texts):
+        record = extract_information(text)
+        record['Resume Name'] = f"synthetic_{index:05d}.pdf"
+        records.append(record)
+    return records
+
+
+def synthetic_records(count, seed):
+    """Records shaped like extractor output, for timing the writers without the parsers"""
+    records = []
+    for file_name, _, text, metadata in iter_corpus(count, seed):
+        lines = text.split("\n")
+        records.append({
+            'Name': metadata['name'], 'Email': metadata['email'], 'Phone': metadata['phone'],
+            'Skills': ', '.join(random.Random(file_name).sample(lines, min(3, len(lines)))),
+            'Work Experience': ' '.join(lines[:20]), 'Education': ' '.join(lines[20:24]),
+            'Projects': ' '.join(lines[24:28]), 'Hobbies': '', 'Qualities': '', 'Resume Name': file_name,
+        })
+    return records
+
+
+def bench_writers(records, rows, repeat, work_dir, results):
+    """Time each utils writer on `rows` records, `repeat` times"""
+    import utils
+
+    data = [dict(records[i % len(records)]) for i in range(rows)]
+    for name, (modules, suffix) in WRITERS.items():
+        missing = missing_modules(modules)
+        if missing:
+            results[f"write.{name}"] = {'skipped': f"missing {', '.join(missing)}"}
+            continue
+
+        def write(run, name=name, suffix=suffix):
+            output_file = os.path.join(work_dir, f"{name}_{run}{suffix}")
+            with quiet():
+                if name == 'CsvSink':
+                    with utils.CsvSink(output_file) as sink:
+                        sink.write_many(data)
+                elif name == 'save_to_excel_chunked':
+                    utils.save_to_excel_chunked(data, output_file, rows_per_part=max(1, rows // 4))
+                else:
+                    getattr(utils, name)(data, output_file)
+
+        results[f"write.{name}"] = summarize(time_calls(write, range(repeat)))
+        results[f"write.{name}"]['rows'] = rows
+
+
+def compare(results, baseline, threshold, min_delta_ms=0.05):
+    """Return (benchmark, current p50, baseline p50) for regressions beyond `threshold`.
+
+    A regression must also exceed the baseline by `min_delta_ms`, so that
+    microsecond-scale benchmarks do not fail on timer noise.
+    """
+    regressions = []
+    for name, result in results.items():
+        limit = baseline.get(name)
+        if 'p50_ms' not in result or limit is None:
+            continue
+        if result['p50_ms'] > limit * (1 + threshold) and result['p50_ms'] - limit > min_delta_ms:
+            regressions.append((name, result['p50_ms'], limit))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parsing, extraction and writers on a synthetic corpus")
+    parser.add_argument('--count', type=int, default=500, help='Synthetic resumes to generate')
+    parser.add_argument('--seed', type=int, default=0, help='Corpus seed')
+    parser.add_argument('--pages', default='1-3', help='Page count or inclusive range per resume')
+    parser.add_argument('--columns', default='1-2', help='Column layouts (1, 2 or 1-2)')
+    parser.add_argument('--noise', type=float, default=0.1, help='Fraction of noisy lines')
+    parser.add_argument('--writer-rows', type=int, default=5000, help='Rows written per writer call')
+    parser.add_argument('--writer-repeat', type=int, default=3, help='Timed calls per writer')
+    parser.add_argument('--only', action='append', metavar='PREFIX',
+                        help='Only report benchmarks whose name starts with PREFIX (repeatable)')
+    parser.add_argument('--corpus-dir', help='Keep the generated corpus here instead of a temporary directory')
+    parser.add_argument('--output', default='benchmark_results.json', help='Where to write the JSON results')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed fractional regression of the median over the baseline')
+    parser.add_argument('--min-delta-ms', type=float, default=0.05,
+                        help='Ignore regressions smaller than this many milliseconds')
+    parser.add_argument('--update-baseline', action='store_true', help='Record current medians as the baseline')
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix="resume_bench_")
+    corpus_dir = args.corpus_dir or os.path.join(work_dir, "corpus")
+    try:
+        print(f"📦 Generating {args.count} synthetic resumes in {corpus_dir}...")
+        start_time = time.perf_counter()
+        os.makedirs(corpus_dir, exist_ok=True)
+        paths, raw_texts = [], []
+        for file_name, pdf, text, _ in iter_corpus(args.count, args.seed, parse_range(args.pages),
+                                                   parse_range(args.columns), args.noise):
+            path = os.path.join(corpus_dir, file_name)
+            with open(path, 'wb') as f:
+                f.write(pdf)
+            paths.append(path)
+            raw_texts.append(text)
+        print(f"✅ Corpus ready in {time.perf_counter() - start_time:.1f}s")
+
+        results = {}
+        texts = bench_parsing(paths, raw_texts, results)
+        records = bench_extractor(texts, results) or synthetic_records(min(args.count, 200), args.seed)
+        bench_writers(records, args.writer_rows, args.writer_repeat, work_dir, results)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.only:
+        results = {name: result for name, result in results.items() if name.startswith(tuple(args.only))}
+
+    baseline = {}
+    if os.path.exists(BASELINE_FILE):
+        with open(BASELINE_FILE, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    for name, result in results.items():
+        if 'skipped' in result:
+            print(f"{name:<36} skipped ({result['skipped']})")
+            continue
+        limit = baseline.get(name)
+        print(f"{name:<36} p50 {result['p50_ms']:>10.3f} ms  p95 {result['p95_ms']:>10.3f} ms  "
+              f"baseline {f'{limit:.3f}' if limit is not None else '-':>10}")
+
+    report = {
+        'meta': {
+            'timestamp': time.time(), 'python': platform.python_version(), 'platform': platform.platform(),
+            'count': args.count, 'seed': args.seed, 'pages': args.pages, 'columns': args.columns,
+            'noise': args.noise, 'writer_rows': args.writer_rows, 'threshold': args.threshold,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"📝 Results written to {args.output}")
+
+    if args.update_baseline:
+        baseline.update({name: result['p50_ms'] for name, result in results.items() if 'p50_ms' in result})
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"Baseline written to {BASELINE_FILE}")
+        return
+
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+    if regressions:
+        for name, current, limit in regressions:
+            print(f"❌ {name} median {current:.3f} ms exceeds baseline {limit:.3f} ms by more than {args.threshold:.0%}")
+        sys.exit(1)
+    print("✅ No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
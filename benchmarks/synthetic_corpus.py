@@ -0,0 +1,269 @@
+"""Offline generator for a synthetic corpus of text-layer resume PDFs.
+
+Writes minimal, valid PDFs by hand (Helvetica text objects, no dependencies)
+with controlled page counts, one- or two-column layouts, shuffled section
+orders and optional noise such as run-together words, stray page headers and
+extra whitespace. The same seed always produces the same corpus.
+
+    python benchmarks/synthetic_corpus.py /tmp/corpus --count 2000 --pages 1-4 --seed 7
+"""
+import os
+import json
+import random
+import argparse
+import textwrap
+
+PAGE_WIDTH, PAGE_HEIGHT = 612, 792
+MARGIN = 54
+FONT_SIZE = 10
+LEADING = 13
+LINES_PER_PAGE = (PAGE_HEIGHT - 2 * MARGIN) // LEADING
+CHAR_WIDTH = FONT_SIZE * 0.55  # generous average Helvetica advance
+SIDEBAR_WIDTH = 180
+COLUMN_GAP = 18
+
+FIRST_NAMES = ['James', 'Maria', 'Wei', 'Aisha', 'Carlos', 'Priya', 'Olga', 'Kwame', 'Sofia', 'Liam',
+               'Yuki', 'Fatima', 'Noah', 'Elena', 'Ravi', 'Grace', 'Mateo', 'Hana', 'Omar', 'Chloe']
+LAST_NAMES = ['Smith', 'Garcia', 'Chen', 'Khan', 'Silva', 'Patel', 'Ivanova', 'Mensah', 'Rossi', 'Murphy',
+              'Tanaka', 'Haddad', 'Johnson', 'Popescu', 'Iyer', 'Okafor', 'Lopez', 'Kim', 'Nasser', 'Martin']
+EMAIL_DOMAINS = ['gmail.com', 'outlook.com', 'example.org', 'mail.net', 'email.com']
+SKILLS = ['Python', 'Java', 'JavaScript', 'C++', 'Go', 'Rust', 'SQL', 'PostgreSQL', 'MongoDB', 'Redis',
+          'React', 'Angular', 'Django', 'Flask', 'Docker', 'Kubernetes', 'AWS', 'Azure', 'Linux', 'Git',
+          'Tableau', 'Power BI', 'Machine Learning', 'Data Analysis', 'Pandas', 'NumPy', 'Figma',
+          'Leadership', 'Communication', 'Teamwork']
+TITLES = ['Software Engineer', 'Data Analyst', 'Backend Developer', 'Product Designer', 'DevOps Engineer',
+          'Data Scientist', 'QA Engineer', 'Project Manager', 'Frontend Developer', 'ML Engineer']
+COMPANIES = ['Acme Corp', 'Globex', 'Initech', 'Umbrella Labs', 'Stark Industries', 'Wayne Tech',
+             'Hooli', 'Vandelay Imports', 'Soylent Systems', 'Tyrell Analytics']
+DEGREES = ['Bachelor of Science in Computer Science', 'Master of Science in Data Science',
+           'Bachelor of Engineering in Electronics', 'MBA in Technology Management',
+           'Bachelor of Arts in Economics']
+SCHOOLS = ['State University', 'Institute of Technology', 'City College', 'National University',
+           'Polytechnic University']
+HOBBIES = ['chess', 'hiking', 'photography', 'cycling', 'cooking', 'reading', 'painting', 'music']
+QUALITIES = ['Team player with excellent communication', 'Detail-oriented and highly organized',
+             'Self-motivated problem-solving mindset', 'Strong leadership and mentoring',
+             'Adaptable, creative and results-driven']
+VERBS = ['Built', 'Designed', 'Led', 'Optimized', 'Migrated', 'Automated', 'Shipped', 'Maintained',
+         'Refactored', 'Launched']
+OBJECTS = ['a billing service', 'the data pipeline', 'CI/CD workflows', 'a reporting dashboard',
+           'the search API', 'customer onboarding', 'an internal CLI', 'the mobile backend',
+           'monitoring and alerting', 'a recommendation model']
+OUTCOMES = ['cutting latency by {n}%', 'serving {n}k daily users', 'saving {n} hours per week',
+            'reducing costs by {n}%', 'improving test coverage to {n}%', 'with a team of {n}']
+SECTIONS = ['Summary', 'Education', 'Skills', 'Work Experience', 'Projects', 'Hobbies', 'Qualities']
+SIDEBAR_SECTIONS = {'Skills', 'Hobbies', 'Qualities'}
+
+
+def escape_pdf_text(text):
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def build_pdf(pages):
+    """Serialize pages of (x, y, text) runs into PDF bytes with a correct xref table"""
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(None)
+    pages_id = add(None)
+    font = add(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+
+    page_ids = []
+    for runs in pages:
+        stream = b"".join(
+            f"BT /F1 {FONT_SIZE} Tf {x:.1f} {y:.1f} Td ({escape_pdf_text(text)}) Tj ET\n".encode('latin-1', 'replace')
+            for x, y, text in runs
+        )
+        content = add(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"endstream")
+        page_ids.append(add(
+            f"<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 {PAGE_WIDTH} {PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 {font} 0 R >> >> /Contents {content} 0 R >>".encode('ascii')
+        ))
+
+    objects[catalog - 1] = f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode('ascii')
+    kids = " ".join(f"{page_id} 0 R" for page_id in page_ids)
+    objects[pages_id - 1] = f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>".encode('ascii')
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, catalog, xref_offset)
+    return bytes(out)
+
+
+def add_noise(rng, line, noise):
+    """Degrade a line the way real extractions do"""
+    if not line or rng.random() >= noise:
+        return line
+    kind = rng.randrange(4)
+    words = line.split(' ')
+    if kind == 0 and len(words) > 1:
+        i = rng.randrange(len(words) - 1)
+        words[i:i + 2] = [words[i] + words[i + 1]]
+        return ' '.join(words)
+    if kind == 1:
+        return line.replace(' ', '   ', rng.randint(1, 3))
+    if kind == 2:
+        return line + ' ' + rng.choice(['*', '|', '-', '..', '#'])
+    return line.upper() if len(line) < 30 else line.replace(', ', ',')
+
+
+def experience_lines(rng):
+    start = rng.randint(2008, 2021)
+    end = rng.choice([str(rng.randint(start + 1, 2024)), 'Present'])
+    lines = [f"{rng.choice(TITLES)}, {rng.choice(COMPANIES)} {start} - {end}"]
+    for _ in range(rng.randint(2, 4)):
+        outcome = rng.choice(OUTCOMES).format(n=rng.randint(3, 90))
+        lines.append(f"- {rng.choice(VERBS)} {rng.choice(OBJECTS)}, {outcome}")
+    return lines
+
+
+def section_lines(rng, section):
+    if section == 'Summary':
+        return [f"{rng.choice(TITLES)} with {rng.randint(2, 15)} years of experience in "
+                f"{rng.choice(SKILLS)} and {rng.choice(SKILLS)}."]
+    if section == 'Education':
+        lines = []
+        for _ in range(rng.randint(1, 2)):
+            year = rng.randint(2005, 2022)
+            lines += [rng.choice(DEGREES), f"{rng.choice(SCHOOLS)}, {year - 4} - {year}"]
+        return lines
+    if section == 'Skills':
+        skills = rng.sample(SKILLS, rng.randint(5, 12))
+        return [', '.join(skills[i:i + 4]) for i in range(0, len(skills), 4)]
+    if section == 'Work Experience':
+        lines = []
+        for _ in range(rng.randint(1, 3)):
+            lines += experience_lines(rng)
+        return lines
+    if section == 'Projects':
+        return [f"- {rng.choice(OBJECTS).capitalize()} using {rng.choice(SKILLS)} and {rng.choice(SKILLS)}"
+                for _ in range(rng.randint(1, 3))]
+    if section == 'Hobbies':
+        return [', '.join(rng.sample(HOBBIES, rng.randint(2, 4))).capitalize()]
+    return [rng.choice(QUALITIES)]
+
+
+def wrap_lines(lines, width):
+    """Wrap lines to a column `width` in points, keeping blank separator lines"""
+    chars = int(width / CHAR_WIDTH)
+    return [wrapped for line in lines for wrapped in (textwrap.wrap(line, chars) or [''])]
+
+
+def paginate(columns, page_count):
+    """Lay out column line lists onto pages, returning [(x, y, text), ...] per page"""
+    pages = [[] for _ in range(page_count)]
+    for x, lines in columns:
+        for index, text in enumerate(lines):
+            page, row = divmod(index, LINES_PER_PAGE)
+            if page >= page_count or not text:
+                continue
+            pages[page].append((x, PAGE_HEIGHT - MARGIN - row * LEADING, text))
+    return pages
+
+
+def generate_resume(rng, page_count=1, column_count=1, noise=0.0):
+    """Return (pdf bytes, plain text in reading order, metadata) for one synthetic resume"""
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    name = f"{first} {last}"
+    email = f"{first.lower()}.{last.lower()}{rng.randint(1, 99)}@{rng.choice(EMAIL_DOMAINS)}"
+    area, prefix, line_no = rng.randint(200, 989), rng.randint(200, 999), rng.randint(1000, 9999)
+    phone = rng.choice([f"({area}) {prefix}-{line_no}", f"{area}-{prefix}-{line_no}",
+                        f"+1 {area}.{prefix}.{line_no}", f"{area} {prefix} {line_no}"])
+    header = [name, email, phone, '']
+
+    order = SECTIONS[:]
+    rng.shuffle(order)
+    blocks = {section: [section.upper()] + section_lines(rng, section) + [''] for section in order}
+
+    if column_count == 2:
+        sidebar = [s for s in order if s in SIDEBAR_SECTIONS]
+        main = [s for s in order if s not in SIDEBAR_SECTIONS]
+        main_x = MARGIN + SIDEBAR_WIDTH + COLUMN_GAP
+        left = wrap_lines(header + [line for section in sidebar for line in blocks[section]], SIDEBAR_WIDTH)
+        right = wrap_lines([line for section in main for line in blocks[section]], PAGE_WIDTH - MARGIN - main_x)
+        column_specs = [[MARGIN, left], [main_x, right]]
+        fill, fill_width = right, PAGE_WIDTH - MARGIN - main_x
+    else:
+        body = wrap_lines(header + [line for section in order for line in blocks[section]], PAGE_WIDTH - 2 * MARGIN)
+        column_specs = [[MARGIN, body]]
+        fill, fill_width = body, PAGE_WIDTH - 2 * MARGIN
+
+    target_lines = (page_count - 1) * LINES_PER_PAGE + LINES_PER_PAGE // 2
+    while len(fill) < target_lines:
+        fill.extend(wrap_lines(experience_lines(rng) + [''], fill_width))
+    del fill[page_count * LINES_PER_PAGE:]
+
+    for spec in column_specs:
+        spec[1] = [add_noise(rng, line, noise) for line in spec[1]]
+    pages = paginate(column_specs, page_count)
+    if noise and page_count > 1:
+        for number, page in enumerate(pages[1:], 2):
+            page.append((PAGE_WIDTH - MARGIN - 60, MARGIN / 2, f"Page {number} of {page_count}"))
+
+    text = "\n".join("\n".join(text for _, _, text in page) for page in pages)
+    metadata = {'name': name, 'email': email, 'phone': phone, 'pages': page_count,
+                'columns': column_count, 'section_order': order}
+    return build_pdf(pages), text, metadata
+
+
+def parse_range(value):
+    """Parse '3' or '1-4' into an inclusive (low, high) pair"""
+    low, _, high = str(value).partition('-')
+    return int(low), int(high or low)
+
+
+def iter_corpus(count, seed=0, pages=(1, 3), columns=(1, 2), noise=0.1):
+    """Yield (file name, pdf bytes, text, metadata) for `count` deterministic synthetic resumes"""
+    rng = random.Random(seed)
+    for index in range(count):
+        resume_rng = random.Random(rng.getrandbits(64))
+        pdf, text, metadata = generate_resume(
+            resume_rng,
+            page_count=resume_rng.randint(*pages),
+            column_count=resume_rng.randint(*columns),
+            noise=noise
+        )
+        yield f"synthetic_{index:05d}.pdf", pdf, text, metadata
+
+
+def generate_corpus(output_dir, count, seed=0, pages=(1, 3), columns=(1, 2), noise=0.1):
+    """Write the corpus and a manifest.jsonl with the ground truth; return the PDF paths"""
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    with open(os.path.join(output_dir, 'manifest.jsonl'), 'w', encoding='utf-8') as manifest:
+        for file_name, pdf, _, metadata in iter_corpus(count, seed, pages, columns, noise):
+            path = os.path.join(output_dir, file_name)
+            with open(path, 'wb') as f:
+                f.write(pdf)
+            manifest.write(json.dumps({'file': file_name, **metadata}) + "\n")
+            paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic corpus of text-layer resume PDFs")
+    parser.add_argument('output_dir', help='Directory to write the PDFs and manifest.jsonl into')
+    parser.add_argument('--count', type=int, default=1000, help='Number of resumes')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed; the same seed gives the same corpus')
+    parser.add_argument('--pages', default='1-3', help='Page count or inclusive range per resume')
+    parser.add_argument('--columns', default='1-2', help='Column layouts to use (1, 2 or 1-2)')
+    parser.add_argument('--noise', type=float, default=0.1, help='Fraction of lines with extraction-style noise')
+    args = parser.parse_args()
+
+    paths = generate_corpus(args.output_dir, args.count, args.seed, parse_range(args.pages),
+                            parse_range(args.columns), args.noise)
+    print(f"✅ Wrote {len(paths)} synthetic resumes to {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
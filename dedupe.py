@@ -0,0 +1,245 @@
+import os
+import re
+import time
+import zlib
+import sqlite3
+import hashlib
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 16
+DEFAULT_SHINGLE_SIZE = 3
+DUPLICATE_MODES = ('skip', 'link')
+
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+HASH_CHUNK = 4096
+WORD_PATTERN = re.compile(r"\w+")
+
+# Extra output columns in 'link' mode
+LINK_COLUMNS = ['Duplicate Of', 'Duplicate Similarity']
+
+# Marks the placeholder record returned for a duplicate whose extraction was skipped
+SKIPPED_KEY = '_duplicate_skipped'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL,
+    canonical_id INTEGER,
+    similarity REAL,
+    signature BLOB NOT NULL,
+    added REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS buckets (band INTEGER NOT NULL, bucket INTEGER NOT NULL, doc_id INTEGER NOT NULL);
+CREATE INDEX IF NOT EXISTS buckets_lookup ON buckets (band, bucket);
+CREATE INDEX IF NOT EXISTS buckets_doc ON buckets (doc_id);
+"""
+
+# One connection and one set of hash permutations per process; worker
+# processes receive a pickled store without its connection. Connections are
+# keyed by pid too, since a forked worker must not reuse its parent's.
+_connections: Dict[Tuple[int, str], sqlite3.Connection] = {}
+_permutations = {}
+
+
+def is_skipped_duplicate(record) -> bool:
+    return bool(record) and record.get(SKIPPED_KEY, False)
+
+
+def skipped_duplicate(name: str, canonical: str, similarity: float) -> dict:
+    return {'Resume Name': name, 'Duplicate Of': canonical, 'Duplicate Similarity': round(similarity, 3),
+            SKIPPED_KEY: True}
+
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> set:
+    """Overlapping `size`-word shingles of the lower-cased text"""
+    words = WORD_PATTERN.findall(text.lower())
+    if len(words) <= size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def permutations(num_perm: int, seed: int = 1):
+    """Random (a, b) coefficients of the universal hashes a*x + b mod p.
+
+    Both are below 2**32, like the 32-bit shingle hashes, so a*x + b fits
+    in uint64 without overflow.
+    """
+    import numpy as np
+
+    key = (num_perm, seed)
+    if key not in _permutations:
+        rng = np.random.RandomState(seed)
+        _permutations[key] = (rng.randint(1, MAX_HASH, size=num_perm, dtype=np.uint64),
+                              rng.randint(0, MAX_HASH, size=num_perm, dtype=np.uint64))
+    return _permutations[key]
+
+
+def minhash_signature(text: str, num_perm: int = DEFAULT_NUM_PERM, shingle_size: int = DEFAULT_SHINGLE_SIZE):
+    """MinHash signature (uint32 array of length `num_perm`) of the text's word shingles"""
+    import numpy as np
+
+    shingle_set = shingles(text, shingle_size)
+    a, b = permutations(num_perm)
+    signature = np.full(num_perm, MAX_HASH, dtype=np.uint64)
+    hashes = np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingle_set), dtype=np.uint64,
+                         count=len(shingle_set))
+    for start in range(0, len(hashes), HASH_CHUNK):
+        chunk = hashes[start:start + HASH_CHUNK]
+        permuted = (np.outer(a, chunk) + b[:, None]) % np.uint64(MERSENNE_PRIME) & np.uint64(MAX_HASH)
+        np.minimum(signature, permuted.min(axis=1), out=signature)
+    return signature.astype(np.uint32)
+
+
+def estimate_similarity(signature, other) -> float:
+    """Estimated Jaccard similarity: the fraction of equal MinHash values"""
+    return float((signature == other).mean())
+
+
+class DuplicateStore:
+    """Persisted MinHash signatures with LSH band buckets for near-duplicate lookup.
+
+    Signatures are split into `bands` bands; documents sharing any band
+    bucket become candidates, and only those are compared, so a lookup does
+    not scan the whole store. A candidate whose estimated Jaccard similarity
+    reaches `threshold` makes the new document a duplicate of the candidate's
+    canonical document. The SQLite file can be shared by worker processes;
+    each lookup-and-insert runs in one write transaction.
+
+    The number of permutations, bands and the shingle size are fixed when
+    the store is created; `threshold` and `mode` may change between runs.
+    """
+
+    def __init__(self, path: str, threshold: float = DEFAULT_THRESHOLD, mode: str = 'skip',
+                 num_perm: int = DEFAULT_NUM_PERM, bands: int = DEFAULT_BANDS,
+                 shingle_size: int = DEFAULT_SHINGLE_SIZE):
+        if mode not in DUPLICATE_MODES:
+            raise ValueError(f"❌ Unknown duplicate mode '{mode}' (expected {' or '.join(DUPLICATE_MODES)})")
+        if not 0 < threshold <= 1:
+            raise ValueError(f"❌ Duplicate threshold must be between 0 and 1, got {threshold}")
+        if num_perm % bands:
+            raise ValueError(f"❌ {num_perm} permutations cannot be split into {bands} bands")
+        self.path = os.path.abspath(path)
+        self.threshold = threshold
+        self.mode = mode
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.opened_at = time.time()
+        self.meta_loaded = False
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        key = (os.getpid(), self.path)
+        connection = _connections.get(key)
+        if connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                for statement in SCHEMA.split(';'):
+                    if statement.strip():
+                        connection.execute(statement)
+                for meta_key in ('num_perm', 'bands', 'shingle_size'):
+                    connection.execute("INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)",
+                                       (meta_key, str(getattr(self, meta_key))))
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                connection.close()
+                raise
+            _connections[key] = connection
+        if not self.meta_loaded:
+            meta = dict(connection.execute("SELECT key, value FROM meta"))
+            self.num_perm, self.bands, self.shingle_size = (int(meta[meta_key]) for meta_key in ('num_perm', 'bands', 'shingle_size'))
+            self.meta_loaded = True
+        return connection
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def band_keys(self, signature) -> List[int]:
+        rows = self.num_perm // self.bands
+        return [int.from_bytes(hashlib.blake2b(signature[band * rows:(band + 1) * rows].tobytes(),
+                                               digest_size=8).digest(), 'little', signed=True)
+                for band in range(self.bands)]
+
+    def check(self, name: str, text: str) -> Optional[Tuple[str, float]]:
+        """Record `name` and return (canonical name, similarity) if it near-duplicates a stored resume.
+
+        A resume that was stored before under the same name is updated in
+        place and is never reported as a duplicate of itself.
+        """
+        import numpy as np
+
+        connection = self.connection
+        signature = minhash_signature(text, self.num_perm, self.shingle_size)
+        keys = self.band_keys(signature)
+
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            candidates = set()
+            for band, key in enumerate(keys):
+                candidates.update(row[0] for row in connection.execute(
+                    "SELECT doc_id FROM buckets WHERE band = ? AND bucket = ?", (band, key)))
+
+            best = None
+            if candidates:
+                placeholders = ','.join('?' * len(candidates))
+                rows = connection.execute(
+                    f"SELECT id, canonical_id, signature FROM documents WHERE id IN ({placeholders}) AND name != ?",
+                    (*candidates, name))
+                for doc_id, canonical_id, blob in rows:
+                    similarity = estimate_similarity(signature, np.frombuffer(blob, dtype='<u4'))
+                    if similarity >= self.threshold and (best is None or similarity > best[1]):
+                        best = (canonical_id or doc_id, similarity)
+
+            canonical_id, similarity = best if best else (None, None)
+            existing = connection.execute("SELECT id FROM documents WHERE name = ?", (name,)).fetchone()
+            if existing:
+                doc_id = existing[0]
+                if canonical_id == doc_id:
+                    canonical_id, similarity = None, None
+                connection.execute("UPDATE documents SET canonical_id = ?, similarity = ?, signature = ?, added = ? "
+                                   "WHERE id = ?", (canonical_id, similarity, signature.astype('<u4').tobytes(),
+                                                    time.time(), doc_id))
+                connection.execute("DELETE FROM buckets WHERE doc_id = ?", (doc_id,))
+            else:
+                doc_id = connection.execute(
+                    "INSERT INTO documents (name, canonical_id, similarity, signature, added) VALUES (?, ?, ?, ?, ?)",
+                    (name, canonical_id, similarity, signature.astype('<u4').tobytes(), time.time())).lastrowid
+            connection.executemany("INSERT INTO buckets (band, bucket, doc_id) VALUES (?, ?, ?)",
+                                   [(band, key, doc_id) for band, key in enumerate(keys)])
+
+            match = None
+            if canonical_id is not None:
+                canonical_name = connection.execute("SELECT name FROM documents WHERE id = ?",
+                                                    (canonical_id,)).fetchone()[0]
+                match = (canonical_name, similarity)
+            connection.execute("COMMIT")
+            return match
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+    def clusters(self, since: Optional[float] = None) -> List[Tuple[str, List[Tuple[str, float]]]]:
+        """(canonical name, [(duplicate name, similarity), ...]) for duplicates added since `since`"""
+        rows = self.connection.execute(
+            "SELECT c.name, d.name, d.similarity FROM documents d JOIN documents c ON c.id = d.canonical_id "
+            "WHERE d.added >= ? ORDER BY c.name, d.similarity DESC, d.name", (since or 0,))
+        clusters = {}
+        for canonical, name, similarity in rows:
+            clusters.setdefault(canonical, []).append((name, similarity))
+        return sorted(clusters.items(), key=lambda item: (-len(item[1]), item[0]))
+
+    def close(self):
+        connection = _connections.pop((os.getpid(), self.path), None)
+        if connection is not None:
+            connection.close()
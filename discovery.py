@@ -0,0 +1,204 @@
+import os
+import time
+import fnmatch
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+SIZE_UNITS = {'': 1, 'B': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+AGE_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+
+def parse_size(value: Optional[str]) -> Optional[int]:
+    """Parse a size such as '500', '200K' or '10M' into bytes"""
+    if value is None:
+        return None
+    value = str(value).strip().upper().rstrip('B') or '0'
+    unit = value[-1] if value[-1] in SIZE_UNITS else ''
+    number = value[:-1] if unit else value
+    try:
+        return int(float(number) * SIZE_UNITS[unit])
+    except ValueError:
+        raise ValueError(f"❌ Invalid size '{value}', expected e.g. 500K or 10M")
+
+
+def parse_time(value: Optional[str]) -> Optional[float]:
+    """Parse an ISO date/time or a relative age such as '12h' or '7d' into a timestamp"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    if value and value[-1] in AGE_UNITS and value[:-1].replace('.', '', 1).isdigit():
+        return time.time() - float(value[:-1]) * AGE_UNITS[value[-1]]
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        raise ValueError(f"❌ Invalid time '{value}', expected an ISO date or an age like 7d")
+
+
+class PathFilter:
+    """Include/exclude globs plus size and modification-time bounds"""
+
+    def __init__(self, include: Optional[List[str]] = None, exclude: Optional[List[str]] = None,
+                 min_size: Optional[int] = None, max_size: Optional[int] = None,
+                 newer_than: Optional[float] = None, older_than: Optional[float] = None):
+        self.include = include or []
+        self.exclude = exclude or []
+        self.min_size = min_size
+        self.max_size = max_size
+        self.newer_than = newer_than
+        self.older_than = older_than
+
+    @property
+    def needs_stat(self) -> bool:
+        return any(bound is not None for bound in (self.min_size, self.max_size, self.newer_than, self.older_than))
+
+    def _glob_match(self, rel_path: str, patterns: List[str]) -> bool:
+        rel_path = rel_path.replace(os.sep, '/')
+        name = rel_path.rsplit('/', 1)[-1]
+        return any(fnmatch.fnmatch(rel_path, pattern) or fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+    def matches_name(self, rel_path: str) -> bool:
+        if not rel_path.lower().endswith('.pdf'):
+            return False
+        if self.include and not self._glob_match(rel_path, self.include):
+            return False
+        return not (self.exclude and self._glob_match(rel_path, self.exclude))
+
+    def excludes_directory(self, rel_path: str) -> bool:
+        return bool(self.exclude) and self._glob_match(rel_path, self.exclude)
+
+    def matches_stat(self, stat: os.stat_result) -> bool:
+        if self.min_size is not None and stat.st_size < self.min_size:
+            return False
+        if self.max_size is not None and stat.st_size > self.max_size:
+            return False
+        if self.newer_than is not None and stat.st_mtime < self.newer_than:
+            return False
+        if self.older_than is not None and stat.st_mtime > self.older_than:
+            return False
+        return True
+
+
+def iter_pdf_files(root: str, recursive: bool = False,
+                   path_filter: Optional[PathFilter] = None) -> Iterator[Tuple[str, str]]:
+    """Lazily yield (path, name relative to root) for PDFs under `root` using os.scandir"""
+    path_filter = path_filter or PathFilter()
+    pending = [root]
+
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirectories = []
+                for entry in entries:
+                    rel_path = os.path.relpath(entry.path, root)
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive and not path_filter.excludes_directory(rel_path):
+                                subdirectories.append(entry.path)
+                            continue
+                        if not entry.is_file() or not path_filter.matches_name(rel_path):
+                            continue
+                        if path_filter.needs_stat and not path_filter.matches_stat(entry.stat()):
+                            continue
+                    except OSError:
+                        continue
+                    yield entry.path, rel_path
+        except OSError as e:
+            print(f"⚠️ Cannot read directory '{directory}': {e}")
+            continue
+        pending.extend(reversed(subdirectories))
+
+
+def iter_listed_files(list_path: str, path_filter: Optional[PathFilter] = None) -> Iterator[Tuple[str, str]]:
+    """Yield (path, path) for each PDF named in a file list ('-' reads stdin)"""
+    import sys
+
+    path_filter = path_filter or PathFilter()
+    handle = sys.stdin if list_path == '-' else open(list_path, encoding='utf-8')
+    try:
+        for line in handle:
+            path = line.strip()
+            if not path or path.startswith('#') or not path_filter.matches_name(path):
+                continue
+            if path_filter.needs_stat:
+                try:
+                    if not path_filter.matches_stat(os.stat(path)):
+                        continue
+                except OSError:
+                    print(f"⚠️ Listed file not found: {path}")
+                    continue
+            yield path, path
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+def is_archive(path: str) -> bool:
+    return os.path.isfile(path) and path.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def iter_archive_members(archive_path: str, path_filter: Optional[PathFilter] = None) -> Iterator[Tuple[bytes, str]]:
+    """Yield (PDF bytes, member name) for PDFs inside a zip or tar archive, without extracting to disk.
+
+    Tar archives (including .tar.gz) are read as a stream in a single
+    sequential pass; zip members are read through the central directory.
+    """
+    path_filter = path_filter or PathFilter()
+
+    if archive_path.lower().endswith('.zip'):
+        import zipfile
+
+        with zipfile.ZipFile(archive_path) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or not path_filter.matches_name(info.filename):
+                    continue
+                if path_filter.needs_stat and not path_filter.matches_stat(_member_stat(info.file_size, time.mktime(info.date_time + (0, 0, -1)))):
+                    continue
+                yield archive.read(info), info.filename
+        return
+
+    import tarfile
+
+    with tarfile.open(archive_path, mode='r|*') as archive:
+        for member in archive:
+            if not member.isfile() or not path_filter.matches_name(member.name):
+                continue
+            if path_filter.needs_stat and not path_filter.matches_stat(_member_stat(member.size, member.mtime)):
+                continue
+            handle = archive.extractfile(member)
+            if handle is not None:
+                yield handle.read(), member.name
+
+
+def _member_stat(size: int, mtime: float) -> os.stat_result:
+    """Fake just enough of a stat result for PathFilter.matches_stat"""
+    return os.stat_result((0, 0, 0, 0, 0, 0, size, mtime, mtime, mtime))
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse 'I/N' (0 <= I < N) into (index, count)"""
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"❌ Invalid shard '{value}', expected I/N such as 0/4")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"❌ Invalid shard '{value}', index must satisfy 0 <= I < N")
+    return index, count
+
+
+def shard_for(key: str, count: int) -> int:
+    """Stable shard number for a path, identical on every machine and Python run"""
+    import hashlib
+
+    digest = hashlib.blake2b(key.replace(os.sep, '/').encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % count
+
+
+def iter_shard(inputs: Iterator[Tuple[object, str]], index: int, count: int) -> Iterator[Tuple[object, str]]:
+    """Keep only the inputs whose resume name hashes to shard `index` of `count`"""
+    for source, name in inputs:
+        if shard_for(name, count) == index:
+            yield source, name
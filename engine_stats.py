@@ -0,0 +1,137 @@
+import os
+import re
+import time
+import random
+import sqlite3
+from typing import Dict, List, Optional, Tuple
+
+ENGINES = ('pdfplumber', 'pypdf2')
+EXPLORATION_RATE = float(os.environ.get('RESUME_PARSER_ENGINE_EXPLORATION', 0.1))
+MIN_SAMPLES = 3
+SUCCESS_RATE_REQUIRED = 0.5
+# Weight of the newest timing in each engine's moving average
+RECENT_WEIGHT = 0.2
+VERSION_PATTERN = re.compile(r"\d+(?:[.\-_]\d+)*")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS engine_stats (
+    producer TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    successes INTEGER NOT NULL DEFAULT 0,
+    mean_seconds REAL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (producer, engine)
+)
+"""
+
+_connections: Dict[Tuple[int, str], sqlite3.Connection] = {}
+
+
+def producer_key(metadata) -> str:
+    """'Producer | Creator' with version numbers masked, so upgrades of one tool share their history"""
+    metadata = metadata or {}
+    parts = []
+    for field in ('/Producer', '/Creator'):
+        value = str(metadata.get(field) or '').strip()
+        parts.append(VERSION_PATTERN.sub('#', value)[:100])
+    return ' | '.join(parts) if any(parts) else 'unknown'
+
+
+def read_producer(pdf_source) -> str:
+    """Read the producer key from the document information dictionary (only the trailer is parsed)"""
+    import PyPDF2
+    from pdf_parser import open_pdf_source
+
+    with open_pdf_source(pdf_source) as stream:
+        try:
+            return producer_key(PyPDF2.PdfReader(stream, strict=False).metadata)
+        except Exception:
+            return 'unknown'
+
+
+class EngineStats:
+    """Which extraction engine succeeds, and how fast, for each PDF producer.
+
+    `choose` orders the engines for a document: the fastest engine that
+    has worked for the producer goes first, engines with fewer than
+    MIN_SAMPLES attempts are tried first until they have them, and with
+    probability `exploration` the order is flipped so a stale choice gets
+    re-measured. Stored in SQLite so that worker processes can share it.
+    """
+
+    def __init__(self, path: str, exploration: float = EXPLORATION_RATE):
+        self.path = os.path.abspath(path)
+        self.exploration = exploration
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        key = (os.getpid(), self.path)
+        connection = _connections.get(key)
+        if connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(SCHEMA)
+            _connections[key] = connection
+        return connection
+
+    def engine_history(self, producer: str) -> Dict[str, dict]:
+        rows = self.connection.execute(
+            "SELECT engine, attempts, successes, mean_seconds FROM engine_stats WHERE producer = ?", (producer,))
+        return {engine: {'attempts': attempts, 'successes': successes, 'mean_seconds': mean_seconds}
+                for engine, attempts, successes, mean_seconds in rows}
+
+    def choose(self, producer: str) -> List[str]:
+        """Return the engines in the order to try them for a document from `producer`"""
+        history = self.engine_history(producer)
+
+        def attempts(engine):
+            return history.get(engine, {}).get('attempts', 0)
+
+        untried = [engine for engine in ENGINES if attempts(engine) < MIN_SAMPLES]
+        if untried:
+            first = min(untried, key=lambda engine: (attempts(engine), ENGINES.index(engine)))
+        else:
+            working = [engine for engine in ENGINES
+                       if history[engine]['successes'] / history[engine]['attempts'] >= SUCCESS_RATE_REQUIRED
+                       and history[engine]['mean_seconds'] is not None]
+            if not working:
+                return list(ENGINES)
+            first = min(working, key=lambda engine: history[engine]['mean_seconds'])
+            if random.random() < self.exploration:
+                first = random.choice([engine for engine in ENGINES if engine != first])
+        return [first] + [engine for engine in ENGINES if engine != first]
+
+    def record(self, producer: str, engine: str, success: bool, seconds: float):
+        """Count an attempt; successful attempts also update the engine's moving average time"""
+        self.connection.execute(
+            """
+            INSERT INTO engine_stats (producer, engine, attempts, successes, mean_seconds, updated)
+            VALUES (?, ?, 1, ?, ?, ?)
+            ON CONFLICT (producer, engine) DO UPDATE SET
+                attempts = attempts + 1,
+                successes = successes + excluded.successes,
+                mean_seconds = CASE
+                    WHEN excluded.successes = 0 THEN mean_seconds
+                    WHEN mean_seconds IS NULL THEN excluded.mean_seconds
+                    ELSE mean_seconds * (1 - ?) + excluded.mean_seconds * ?
+                END,
+                updated = excluded.updated
+            """,
+            (producer, engine, int(success), seconds if success else None, time.time(), RECENT_WEIGHT, RECENT_WEIGHT))
+
+    def summary(self) -> List[Tuple[str, str, int, int, Optional[float]]]:
+        """(producer, engine, attempts, successes, mean seconds) rows, busiest producers first"""
+        return self.connection.execute(
+            """
+            SELECT producer, engine, attempts, successes, mean_seconds FROM engine_stats
+            ORDER BY SUM(attempts) OVER (PARTITION BY producer) DESC, producer, engine
+            """).fetchall()
+
+    def close(self):
+        connection = _connections.pop((os.getpid(), self.path), None)
+        if connection is not None:
+            connection.close()
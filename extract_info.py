@@ -1,10 +1,14 @@
 import regex as re
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 class ResumeInfoExtractor:
     def __init__(self):
         self.email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
         self.phone_pattern = r'(\+?1[-.\s]?)?\(?([0-9]{3})\)?[-.\s]?([0-9]{3})[-.\s]?([0-9]{4})'
+        self.email_regex = re.compile(self.email_pattern, re.IGNORECASE)
+        # Every phone match starts with '+', '(' or a digit; the lookahead lets the
+        # search skip other positions without trying the optional country code
+        self.phone_regex = re.compile(r'(?=[+(0-9])' + self.phone_pattern)
         self.date_pattern = r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}|\b\d{4}\s*[-–]\s*\d{4}|\b\d{4}\s*[-–]\s*(?:current|present)\b'
         
         self.name_indicators = [
@@ -74,19 +78,47 @@ class ResumeInfoExtractor:
         return ""
 
     def extract_email(self, text: str) -> Optional[str]:
-        matches = re.findall(self.email_pattern, text, re.IGNORECASE)
-        valid_emails = [email for email in matches if 'email.com' not in email.lower()]
-        return valid_emails[0] if valid_emails else (matches[0] if matches else None)
+        # First address outside email.com (placeholder addresses), else the first address
+        first = None
+        if '@' in text:
+            for match in self.email_regex.finditer(text):
+                email = match.group()
+                if 'email.com' not in email.lower():
+                    return email
+                if first is None:
+                    first = email
+        return first
+
+    def format_phone_number(self, match) -> str:
+        groups = match.groups()
+        if groups[0]:  
+            return f"{groups[0]}({groups[1]}) {groups[2]}-{groups[3]}"
+        else:
+            return f"({groups[1]}) {groups[2]}-{groups[3]}"
 
     def extract_phone_number(self, text: str) -> Optional[str]:
-        match = re.search(self.phone_pattern, text)
-        if match:
-            groups = match.groups()
-            if groups[0]:  
-                return f"{groups[0]}({groups[1]}) {groups[2]}-{groups[3]}"
-            else:
-                return f"({groups[1]}) {groups[2]}-{groups[3]}"
-        return None
+        match = self.phone_regex.search(text)
+        return self.format_phone_number(match) if match else None
+
+    def extract_contacts(self, texts: Iterable[str]) -> Dict[str, List[Optional[str]]]:
+        """Email and Phone of many texts at once, as {'Email': [...], 'Phone': [...]} columns.
+
+        Accepts any sequence of texts, including a pandas Series (wrap the
+        result in a DataFrame with the Series' index to keep it aligned).
+        Entries that are not strings, such as NaN, give None. Values are the
+        same as extract_email and extract_phone_number return one by one.
+        """
+        emails, phones = [], []
+        extract_email, phone_search, format_phone = self.extract_email, self.phone_regex.search, self.format_phone_number
+        for text in texts:
+            if not isinstance(text, str):
+                emails.append(None)
+                phones.append(None)
+                continue
+            emails.append(extract_email(text))
+            match = phone_search(text)
+            phones.append(format_phone(match) if match else None)
+        return {'Email': emails, 'Phone': phones}
 
     def is_valid_name_token(self, token: str) -> bool:
         token_upper = token.upper()
@@ -351,34 +383,49 @@ class ResumeInfoExtractor:
         
         return ', '.join(sorted(found_qualities))
 
-extractor = ResumeInfoExtractor()
+_extractor = None
+
+def get_extractor() -> ResumeInfoExtractor:
+    """Return the shared extractor, building it on first use"""
+    global _extractor
+    if _extractor is None:
+        _extractor = ResumeInfoExtractor()
+    return _extractor
+
+def __getattr__(name):
+    if name == 'extractor':
+        return get_extractor()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def extract_email(text):
-    return extractor.extract_email(text)
+    return get_extractor().extract_email(text)
 
 def extract_phone_number(text):
-    return extractor.extract_phone_number(text)
+    return get_extractor().extract_phone_number(text)
+
+def extract_contacts(texts):
+    return get_extractor().extract_contacts(texts)
 
 def extract_name(text):
-    return extractor.extract_name(text)
+    return get_extractor().extract_name(text)
 
 def extract_education(text):
-    return extractor.extract_education(text)
+    return get_extractor().extract_education(text)
 
 def extract_skills(text):
-    return extractor.extract_skills(text)
+    return get_extractor().extract_skills(text)
 
 def extract_projects(text):
-    return extractor.extract_projects(text)
+    return get_extractor().extract_projects(text)
 
 def extract_work_experience(text):
-    return extractor.extract_work_experience(text)
+    return get_extractor().extract_work_experience(text)
 
 def extract_hobbies(text):
-    return extractor.extract_hobbies(text)
+    return get_extractor().extract_hobbies(text)
 
 def extract_qualities(text):
-    return extractor.extract_qualities(text)
+    return get_extractor().extract_qualities(text)
 
 def extract_information(text):
     return {
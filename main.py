@@ -1,46 +1,148 @@
 import os
 import sys
+import time
 import argparse
-from pdf_parser import extract_text_from_pdf
-from extract_info import extract_information
-from utils import save_to_csv, save_to_excel, create_output_directory
+from stats import ExtractionStats
+
+# The parsing, extraction and output modules pull in pdfplumber, PyPDF2,
+# regex, pandas and openpyxl, so they are imported where they are first
+# needed rather than before argument parsing. The discovery, metrics, dedupe
+# and text corpus modules are also imported by the code paths that use them,
+# so importing main (as every worker process does) stays cheap; workers still
+# load metrics through pdf_parser and text_corpus for TEXT_KEY, both of which
+# are stdlib-only.
 
 def validate_folder_path(folder_path):
-    """Validate if the folder path exists and contains PDF files"""
+    """Validate if the folder path exists (PDFs are discovered lazily while processing)"""
     if not os.path.exists(folder_path):
         raise FileNotFoundError(f"❌ The folder '{folder_path}' does not exist.")
     
-    pdf_files = [f for f in os.listdir(folder_path) if f.lower().endswith('.pdf')]
-    if not pdf_files:
-        raise ValueError(f"❌ No PDF files found in the folder '{folder_path}'.")
+    if not os.path.isdir(folder_path):
+        raise ValueError(f"❌ '{folder_path}' is not a folder.")
+
+def build_path_filter(args):
+    """Build the discovery filter from command line arguments"""
+    from discovery import PathFilter, parse_size, parse_time
     
-    print(f"📁 Found {len(pdf_files)} PDF files in '{folder_path}'")
-    return pdf_files
+    return PathFilter(
+        include=args.include,
+        exclude=args.exclude,
+        min_size=parse_size(args.min_size),
+        max_size=parse_size(args.max_size),
+        newer_than=parse_time(args.newer_than),
+        older_than=parse_time(args.older_than)
+    )
 
-def process_single_resume(pdf_path, file_name):
-    """Process a single resume and return extracted data"""
+def iter_inputs(args):
+    """Yield (path or PDF bytes, resume name) pairs from --from-list, an archive or the input folder"""
+    from discovery import iter_pdf_files, iter_listed_files, iter_archive_members, iter_shard, is_archive, parse_shard
+    
+    path_filter = build_path_filter(args)
+    
+    if args.from_list:
+        inputs = iter_listed_files(args.from_list, path_filter)
+    elif is_archive(args.folder_path):
+        inputs = iter_archive_members(args.folder_path, path_filter)
+    else:
+        validate_folder_path(args.folder_path)
+        inputs = iter_pdf_files(args.folder_path, recursive=args.recursive, path_filter=path_filter)
+    
+    if args.shard:
+        index, count = parse_shard(args.shard)
+        inputs = iter_shard(inputs, index, count)
+    return inputs
+
+def count_inputs(args):
+    """Count the inputs for the ETA, when that does not mean reading them twice"""
+    from discovery import is_archive
+    
+    if args.from_list == '-' or (not args.from_list and is_archive(args.folder_path)):
+        return None
+    try:
+        return sum(1 for _ in iter_inputs(args))
+    except (OSError, ValueError):
+        return None
+
+def count_inputs_in_background(args, metrics):
+    """Fill in metrics.total once a background scan has counted the inputs, so processing starts at once"""
+    import threading
+
+    def count():
+        metrics.total = count_inputs(args)
+
+    threading.Thread(target=count, name='count-inputs', daemon=True).start()
+
+def process_single_resume(pdf_path, file_name, verbose=True, timings=None,
+                          page_workers=None, page_parallel_min_pages=None, dedupe=None,
+                          bounded_memory=None, memory_budget_mb=None, engine_stats=None, keep_text=False):
+    """Process a single resume and return extracted data.
+    
+    With `verbose=False` only errors are printed. When a `timings` dict is
+    given, seconds spent reading, parsing, cleaning and extracting are added to it.
+    Long PDFs are split across `page_workers` processes, and `bounded_memory` /
+    `memory_budget_mb` cap the memory one document may use, and `engine_stats`
+    picks the PDF engine by producer (see extract_text_from_pdf).
+    With a `dedupe` store, near-duplicates of earlier resumes are either
+    returned as a skipped placeholder (see is_skipped_duplicate) or extracted
+    and linked to their canonical resume, depending on the store's mode.
+    With `keep_text`, the cleaned text is returned under TEXT_KEY for saving
+    to a text corpus (see save_record_text).
+    """
+    from pdf_parser import extract_text_from_pdf
+    from extract_info import extract_information
+    from text_corpus import TEXT_KEY
+    
     try:
-        print(f"🔄 Processing: {file_name}")
+        if verbose:
+            print(f"🔄 Processing: {file_name}")
         
-        text = extract_text_from_pdf(pdf_path)
+        # A path is read by the parser itself, so page workers and bounded-memory
+        # mode open the file on their own; the 'read' stage is only timed where
+        # the pipeline reads the bytes
+        text = extract_text_from_pdf(pdf_path, timings=timings, page_workers=page_workers,
+                                     page_parallel_min_pages=page_parallel_min_pages,
+                                     bounded_memory=bounded_memory, memory_budget_mb=memory_budget_mb,
+                                     engine_stats=engine_stats)
         
         if not text or len(text.strip()) < 50:
-            print(f"⚠️ Warning: Little or no text extracted from {file_name}")
+            if verbose:
+                print(f"⚠️ Warning: Little or no text extracted from {file_name}")
             return None
         
+        duplicate = None
+        if dedupe is not None:
+            start_time = time.perf_counter()
+            duplicate = dedupe.check(file_name, text)
+            if timings is not None:
+                timings['dedupe'] = time.perf_counter() - start_time
+            if duplicate and dedupe.mode == 'skip':
+                from dedupe import skipped_duplicate
+                if verbose:
+                    print(f"♻️ {file_name}: near-duplicate of {duplicate[0]} ({duplicate[1]:.0%} similar), skipped")
+                return skipped_duplicate(file_name, *duplicate)
+        
+        start_time = time.perf_counter()
         extracted_data = extract_information(text)
+        if timings is not None:
+            timings['extract'] = time.perf_counter() - start_time
+        if dedupe is not None:
+            extracted_data['Duplicate Of'] = duplicate[0] if duplicate else ''
+            extracted_data['Duplicate Similarity'] = round(duplicate[1], 3) if duplicate else ''
         extracted_data['Resume Name'] = file_name
+        if keep_text:
+            extracted_data[TEXT_KEY] = text
         
-        missing_fields = []
-        important_fields = ['Name', 'Email', 'Skills', 'Work Experience']
-        for field in important_fields:
-            if not extracted_data.get(field):
-                missing_fields.append(field)
-        
-        if missing_fields:
-            print(f"⚠️ {file_name}: Missing {', '.join(missing_fields)}")
-        else:
-            print(f"✅ {file_name}: Successfully extracted all key information")
+        if verbose:
+            missing_fields = []
+            important_fields = ['Name', 'Email', 'Skills', 'Work Experience']
+            for field in important_fields:
+                if not extracted_data.get(field):
+                    missing_fields.append(field)
+            
+            if missing_fields:
+                print(f"⚠️ {file_name}: Missing {', '.join(missing_fields)}")
+            else:
+                print(f"✅ {file_name}: Successfully extracted all key information")
         
         return extracted_data
         
@@ -48,13 +150,137 @@ def process_single_resume(pdf_path, file_name):
         print(f"❌ Error processing {file_name}: {str(e)}")
         return None
 
-def process_resumes(folder_path, output_format='both', output_dir=None):
-    """Process all resume PDFs in a folder"""
+def save_excel_output(processed_data, excel_path, excel_rows_per_part=None, excel_split='files'):
+    """Write the Excel output, in parts when `excel_rows_per_part` is set, and list the workbooks written"""
+    from utils import save_to_excel, save_to_excel_chunked
     
-    pdf_files = validate_folder_path(folder_path)
+    if not excel_rows_per_part:
+        save_to_excel(processed_data, excel_path)
+        return
     
-    if output_dir is None:
-        output_dir = create_output_directory()
+    index = save_to_excel_chunked(processed_data, excel_path, rows_per_part=excel_rows_per_part, split=excel_split)
+    if index:
+        # 'files' mode writes only the _partNNN workbooks, never excel_path itself
+        for file_name in dict.fromkeys(part['file'] for part in index['parts']):
+            print(f"✅ Excel saved: {os.path.join(os.path.dirname(excel_path), file_name)}")
+
+def finalize_outputs(processed_data, stats, output_dir, output_format='both', partial_paths=None,
+                     excel_rows_per_part=None, excel_split='files', duplicate_clusters=None,
+                     empty_message="Please check your PDF files."):
+    """Write the end-of-run output files and the summary report; returns False if nothing was extracted.
+    
+    Formats that were streamed during the run are given in `partial_paths`
+    ({format: partial file}) and are only renamed into place, or removed when
+    nothing was extracted. The other formats are written from `processed_data`.
+    """
+    from utils import create_summary_report
+    
+    partial_paths = partial_paths or {}
+    base_filename = f"extracted_resume_data_{stats.total}_resumes"
+    for fmt, path in partial_paths.items():
+        if stats.total:
+            final_path = os.path.join(output_dir, f"{base_filename}.{fmt}")
+            os.replace(path, final_path)
+            print(f"✅ {fmt.upper()} saved: {final_path}")
+        else:
+            os.remove(path)
+    
+    if not stats.total:
+        print(f"\n⚠️ No data extracted. {empty_message}")
+        return False
+    
+    if output_format in ['csv', 'both'] and 'csv' not in partial_paths:
+        from utils import save_to_csv
+        
+        csv_path = os.path.join(output_dir, f"{base_filename}.csv")
+        save_to_csv(processed_data, csv_path)
+        print(f"✅ CSV saved: {csv_path}")
+    
+    if output_format == 'jsonl' and 'jsonl' not in partial_paths:
+        from utils import save_to_jsonl
+        
+        jsonl_path = os.path.join(output_dir, f"{base_filename}.jsonl")
+        save_to_jsonl(processed_data, jsonl_path)
+        print(f"✅ JSONL saved: {jsonl_path}")
+    
+    if output_format == 'parquet':
+        from utils import save_to_parquet
+        
+        parquet_path = os.path.join(output_dir, f"{base_filename}.parquet")
+        save_to_parquet(processed_data, parquet_path)
+        print(f"✅ Parquet saved: {parquet_path}")
+    
+    if output_format in ['excel', 'both']:
+        excel_path = os.path.join(output_dir, f"{base_filename}.xlsx")
+        save_excel_output(processed_data, excel_path, excel_rows_per_part, excel_split)
+    
+    create_summary_report(processed_data, output_dir, stats=stats, duplicate_clusters=duplicate_clusters)
+    return True
+
+def print_processing_summary(total_files, successful_count, failed_count, duplicate_count=0):
+    """Print the end-of-run processing summary"""
+    print("\n" + "=" * 60)
+    print("📊 PROCESSING SUMMARY")
+    print("=" * 60)
+    print(f"Total files processed: {total_files}")
+    print(f"✅ Successful extractions: {successful_count}")
+    print(f"❌ Failed extractions: {failed_count}")
+    if duplicate_count:
+        print(f"♻️ Near-duplicates skipped: {duplicate_count}")
+    print(f"Success rate: {(successful_count/total_files*100):.1f}%")
+
+def report_worker_utilization(utilization, max_workers=16):
+    """Print each parse worker's busy share of the wall-clock time, against an even spread of the work"""
+    workers = utilization.per_worker()
+    if not workers:
+        return
+    
+    print(f"⚖️ Wall-clock {utilization.wall:.1f}s, busy time / {utilization.workers} worker(s) "
+          f"{utilization.ideal:.1f}s ({utilization.ideal / (utilization.wall or 1.0):.0%} utilization)")
+    for worker, busy, documents, share in workers[:max_workers]:
+        print(f"  worker {worker}: {busy:.1f}s busy ({share:.0%}), {documents} file(s)")
+    if len(workers) > max_workers:
+        print(f"  ... and {len(workers) - max_workers} more worker(s)")
+
+def report_duplicate_clusters(dedupe, max_clusters=10):
+    """Print the near-duplicate clusters found in this run and return all of them"""
+    if dedupe is None:
+        return None
+    
+    clusters = dedupe.clusters(since=dedupe.opened_at)
+    if not clusters:
+        print(f"♻️ No near-duplicates found ({len(dedupe)} resumes in {dedupe.path})")
+        return clusters
+    
+    duplicate_total = sum(len(duplicates) for _, duplicates in clusters)
+    print(f"\n♻️ {duplicate_total} near-duplicate(s) in {len(clusters)} cluster(s):")
+    for canonical, duplicates in clusters[:max_clusters]:
+        print(f"  {canonical}")
+        for name, similarity in duplicates:
+            print(f"    ~ {name} ({similarity:.0%} similar)")
+    if len(clusters) > max_clusters:
+        print(f"  ... and {len(clusters) - max_clusters} more cluster(s), see extraction_summary.txt")
+    return clusters
+
+def process_resumes(folder_path, output_format='both', output_dir=None,
+                    excel_rows_per_part=None, excel_split='files', inputs=None,
+                    verbose=True, metrics=None, page_workers=None, page_parallel_min_pages=None, dedupe=None,
+                    bounded_memory=None, memory_budget_mb=None, engine_stats=None, save_corpus=None):
+    """Process all resume PDFs in a folder, or the (path, name) pairs yielded by `inputs`.
+    
+    With `save_corpus`, the cleaned text of every extracted resume is also
+    appended to that text corpus file, for re-extraction with reextract_corpus.
+    """
+    from utils import create_output_directory
+    from discovery import iter_pdf_files
+    from dedupe import is_skipped_duplicate
+    from text_corpus import TextCorpus, save_record_text
+    
+    if inputs is None:
+        validate_folder_path(folder_path)
+        inputs = iter_pdf_files(folder_path)
+    
+    output_dir = create_output_directory(output_dir) if output_dir else create_output_directory()
     
     print(f"\n🚀 Starting resume processing...")
     print(f"📂 Input folder: {folder_path}")
@@ -63,28 +289,54 @@ def process_resumes(folder_path, output_format='both', output_dir=None):
     print("-" * 60)
     
     processed_data = []
+    stats = ExtractionStats()
     successful_count = 0
     failed_count = 0
+    duplicate_count = 0
+    corpus = TextCorpus(save_corpus) if save_corpus else None
     
-    for i, pdf_file in enumerate(pdf_files, 1):
-        print(f"\n[{i}/{len(pdf_files)}]", end=" ")
-        pdf_path = os.path.join(folder_path, pdf_file)
-        
-        result = process_single_resume(pdf_path, pdf_file)
-        
-        if result:
-            processed_data.append(result)
-            successful_count += 1
-        else:
-            failed_count += 1
+    total_files = 0
+    try:
+        for total_files, (pdf_path, pdf_file) in enumerate(inputs, 1):
+            if verbose:
+                print(f"\n[{total_files}]", end=" ")
+            
+            timings = {} if metrics else None
+            start_time = time.perf_counter()
+            result = process_single_resume(pdf_path, pdf_file, verbose=verbose, timings=timings,
+                                           page_workers=page_workers, page_parallel_min_pages=page_parallel_min_pages,
+                                           dedupe=dedupe, bounded_memory=bounded_memory,
+                                           memory_budget_mb=memory_budget_mb, engine_stats=engine_stats,
+                                           keep_text=corpus is not None)
+            latency = time.perf_counter() - start_time
+            
+            if is_skipped_duplicate(result):
+                stats.add_duplicate(latency)
+                duplicate_count += 1
+            elif result:
+                save_record_text(corpus, result)
+                processed_data.append(result)
+                stats.add_record(result, latency)
+                successful_count += 1
+            else:
+                stats.add_failure(latency)
+                failed_count += 1
+            
+            if metrics:
+                metrics.record_document(bool(result), timings)
+                metrics.report()
+    finally:
+        if corpus is not None:
+            corpus.close()
     
-    print("\n" + "=" * 60)
-    print("📊 PROCESSING SUMMARY")
-    print("=" * 60)
-    print(f"Total files processed: {len(pdf_files)}")
-    print(f"✅ Successful extractions: {successful_count}")
-    print(f"❌ Failed extractions: {failed_count}")
-    print(f"Success rate: {(successful_count/len(pdf_files)*100):.1f}%")
+    if metrics:
+        metrics.report(force=True)
+    
+    if not total_files:
+        raise ValueError(f"❌ No PDF files found in '{folder_path}'.")
+    
+    print_processing_summary(total_files, successful_count, failed_count, duplicate_count)
+    duplicate_clusters = report_duplicate_clusters(dedupe)
     
     if not processed_data:
         print("\n⚠️ No data extracted. Please check your PDF files.")
@@ -92,20 +344,309 @@ def process_resumes(folder_path, output_format='both', output_dir=None):
     
     print(f"\n💾 Saving results to {output_dir}...")
     
-    base_filename = f"extracted_resume_data_{len(processed_data)}_resumes"
+    write_start = time.perf_counter()
+    finalize_outputs(processed_data, stats, output_dir, output_format, excel_rows_per_part=excel_rows_per_part,
+                     excel_split=excel_split, duplicate_clusters=duplicate_clusters)
     
-    if output_format in ['csv', 'both']:
-        csv_path = os.path.join(output_dir, f"{base_filename}.csv")
-        save_to_csv(processed_data, csv_path)
-        print(f"✅ CSV saved: {csv_path}")
-    
-    if output_format in ['excel', 'both']:
-        excel_path = os.path.join(output_dir, f"{base_filename}.xlsx")
-        save_to_excel(processed_data, excel_path)
-        print(f"✅ Excel saved: {excel_path}")
+    if metrics:
+        metrics.record_stage('write', time.perf_counter() - write_start)
+        metrics.report(force=True)
     
     return processed_data
 
+def process_resumes_pipeline(folder_path, inputs, output_format='both', output_dir=None,
+                             excel_rows_per_part=None, excel_split='files', keep_samples=0,
+                             read_concurrency=8, parse_workers=None, read_queue_size=16, result_queue_size=64,
+                             verbose=True, metrics=None, page_workers=None, page_parallel_min_pages=None,
+                             dedupe=None, bounded_memory=None, memory_budget_mb=None, engine_stats=None,
+                             shared_memory=None, schedule='fifo', save_corpus=None):
+    """Process resumes through the staged asyncio pipeline, streaming rows to the output files.
+    
+    Returns (records, stats). Records are only kept in memory when Excel output
+    needs them; otherwise just the first `keep_samples` are kept for preview.
+    
+    With `schedule='lpt'` the inputs are listed and started longest first, by
+    page count or size. Documents longer than an even share of the batch, and
+    long documents started at the end of the run, split their pages across
+    workers, unless `page_workers` fixes that already. `save_corpus` appends
+    the cleaned texts to a text corpus, as in process_resumes.
+    """
+    from functools import partial
+    from utils import create_output_directory, open_sink, canonical_columns, COLUMN_ORDER
+    from pipeline import run_pipeline_sync
+    from scheduler import WorkerUtilization, lpt_schedule
+    from discovery import is_archive
+    from dedupe import LINK_COLUMNS, is_skipped_duplicate
+    from text_corpus import TextCorpus, save_record_text
+    
+    output_dir = create_output_directory(output_dir) if output_dir else create_output_directory()
+    
+    print(f"\n🚀 Starting resume processing (pipeline mode)...")
+    print(f"📂 Input folder: {folder_path}")
+    print(f"📤 Output directory: {output_dir}")
+    print(f"📊 Output format: {output_format}")
+    print(f"⚙️ Readers: {read_concurrency}, parse workers: {parse_workers or os.cpu_count()}, "
+          f"queue depths: read {read_queue_size} / result {result_queue_size}")
+    print("-" * 60)
+    
+    if schedule == 'lpt' and is_archive(folder_path):
+        print("⚠️ Archive members are streamed in archive order; --schedule lpt needs files on disk.")
+        schedule = 'fifo'
+    planned_page_workers = None
+    if schedule == 'lpt':
+        estimate_start = time.perf_counter()
+        inputs, planned_page_workers = lpt_schedule(inputs, parse_workers or os.cpu_count() or 1)
+        if page_workers:
+            planned_page_workers = None
+        print(f"📐 Ordered {len(inputs)} file(s) longest first in {time.perf_counter() - estimate_start:.1f}s"
+              + (f", splitting the pages of {len(planned_page_workers)}" if planned_page_workers else ""))
+    
+    stream_formats = {'csv': ['csv'], 'both': ['csv'], 'jsonl': ['jsonl']}.get(output_format, [])
+    keep_all = output_format in ['excel', 'both', 'parquet']
+    partial_paths = {fmt: os.path.join(output_dir, f"extracted_resume_data.partial.{fmt}") for fmt in stream_formats}
+    columns = canonical_columns(COLUMN_ORDER + LINK_COLUMNS + ['Resume Name']) if dedupe and dedupe.mode == 'link' else None
+    sinks = [open_sink(path, fmt, columns=columns) for fmt, path in partial_paths.items()]
+    
+    processed_data = []
+    stats = ExtractionStats()
+    utilization = WorkerUtilization(parse_workers or os.cpu_count() or 1)
+    corpus = TextCorpus(save_corpus) if save_corpus else None
+    
+    def handle_results(batch):
+        for name, record, latency, error, timings in batch:
+            utilization.record(timings.get('worker'), latency)
+            if is_skipped_duplicate(record):
+                stats.add_duplicate(latency)
+            elif record:
+                save_record_text(corpus, record)
+                stats.add_record(record, latency)
+                write_start = time.perf_counter()
+                for sink in sinks:
+                    sink.write(record)
+                timings['write'] = time.perf_counter() - write_start
+                if keep_all or len(processed_data) < keep_samples:
+                    processed_data.append(record)
+            else:
+                stats.add_failure(latency)
+                if error:
+                    print(f"❌ {error}")
+            if metrics:
+                metrics.record_document(bool(record), timings)
+        for sink in sinks:
+            sink.flush()
+        if metrics:
+            metrics.report()
+    
+    try:
+        run_pipeline_sync(
+            inputs,
+            partial(process_single_resume, verbose=verbose, page_workers=page_workers,
+                    page_parallel_min_pages=page_parallel_min_pages, dedupe=dedupe,
+                    bounded_memory=bounded_memory, memory_budget_mb=memory_budget_mb,
+                    engine_stats=engine_stats, keep_text=corpus is not None),
+            handle_results,
+            read_concurrency=read_concurrency,
+            parse_workers=parse_workers,
+            read_queue_size=read_queue_size,
+            result_queue_size=result_queue_size,
+            on_queue_depths=metrics.set_queue_depths if metrics else None,
+            shared_memory=shared_memory,
+            split_tail=schedule == 'lpt' and not page_workers,
+            page_workers=planned_page_workers
+        )
+    finally:
+        for sink in sinks:
+            sink.close()
+        if corpus is not None:
+            corpus.close()
+        if metrics:
+            metrics.report(force=True)
+    
+    total_files = stats.total + stats.failed + stats.duplicates
+    if not total_files:
+        for path in partial_paths.values():
+            os.remove(path)
+        raise ValueError(f"❌ No PDF files found in '{folder_path}'.")
+    
+    print_processing_summary(total_files, stats.total, stats.failed, stats.duplicates)
+    report_worker_utilization(utilization)
+    duplicate_clusters = report_duplicate_clusters(dedupe)
+    
+    if not finalize_outputs(processed_data, stats, output_dir, output_format, partial_paths,
+                            excel_rows_per_part, excel_split, duplicate_clusters):
+        return None, stats
+    
+    return processed_data, stats
+
+def reextract_corpus(corpus_path, output_format='both', output_dir=None, excel_rows_per_part=None,
+                     excel_split='files', keep_samples=0, parse_workers=None, metrics=None, chunk_size=256):
+    """Run extraction only over the texts saved in a text corpus and write the results like a normal run.
+    
+    PDFs are not touched, so changes to the keyword lists or extractors can be
+    applied to a whole archive quickly. Only the last text saved under each
+    resume name is extracted. Chunks of `chunk_size` records are read and
+    extracted by `parse_workers` processes straight from the corpus file.
+    Returns (records, stats) like process_resumes_pipeline.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from utils import create_output_directory, open_sink
+    from text_corpus import TextCorpus, extract_range
+    
+    if not os.path.exists(corpus_path):
+        raise FileNotFoundError(f"❌ The text corpus '{corpus_path}' does not exist.")
+    
+    corpus = TextCorpus(corpus_path)
+    positions = corpus.latest()
+    corpus.close()
+    if not positions:
+        raise ValueError(f"❌ The text corpus '{corpus_path}' is empty.")
+    
+    output_dir = create_output_directory(output_dir) if output_dir else create_output_directory()
+    parse_workers = parse_workers or os.cpu_count() or 1
+    
+    print(f"\n🚀 Re-extracting {len(positions)} saved text(s)...")
+    print(f"📚 Text corpus: {corpus_path}")
+    print(f"📤 Output directory: {output_dir}")
+    print(f"📊 Output format: {output_format}")
+    print(f"⚙️ Workers: {parse_workers}, {chunk_size} texts per chunk")
+    print("-" * 60)
+    
+    stream_formats = {'csv': ['csv'], 'both': ['csv'], 'jsonl': ['jsonl']}.get(output_format, [])
+    keep_all = output_format in ['excel', 'both', 'parquet']
+    partial_paths = {fmt: os.path.join(output_dir, f"extracted_resume_data.partial.{fmt}") for fmt in stream_formats}
+    sinks = [open_sink(path, fmt) for fmt, path in partial_paths.items()]
+    
+    processed_data = []
+    stats = ExtractionStats()
+    start_time = time.perf_counter()
+    
+    def handle_chunk(results):
+        for record, latency in results:
+            if record:
+                stats.add_record(record, latency)
+                for sink in sinks:
+                    sink.write(record)
+                if keep_all or len(processed_data) < keep_samples:
+                    processed_data.append(record)
+            else:
+                stats.add_failure(latency)
+            if metrics:
+                metrics.record_document(bool(record), {'extract': latency})
+        for sink in sinks:
+            sink.flush()
+        if metrics:
+            metrics.report()
+    
+    try:
+        pending = []
+        with ProcessPoolExecutor(max_workers=parse_workers) as executor:
+            for start in range(0, len(positions), chunk_size):
+                pending.append(executor.submit(extract_range, corpus_path, positions[start:start + chunk_size]))
+                if len(pending) >= parse_workers * 2:
+                    handle_chunk(pending.pop(0).result())
+            for future in pending:
+                handle_chunk(future.result())
+    finally:
+        for sink in sinks:
+            sink.close()
+        if metrics:
+            metrics.report(force=True)
+    
+    elapsed = time.perf_counter() - start_time
+    print_processing_summary(len(positions), stats.total, stats.failed)
+    print(f"⚡ {len(positions) / elapsed:.0f} texts/s ({elapsed:.1f}s)")
+    
+    if not finalize_outputs(processed_data, stats, output_dir, output_format, partial_paths,
+                            excel_rows_per_part, excel_split, empty_message="Please check the text corpus."):
+        return None, stats
+    
+    return processed_data, stats
+
+def watch_resumes(folder_path, output_format='csv', output_dir=None, recursive=False, path_filter=None,
+                  poll_interval=5.0, batch_size=32, settle_time=2.0, parse_workers=None, verbose=True,
+                  page_workers=None, page_parallel_min_pages=None, dedupe=None,
+                  bounded_memory=None, memory_budget_mb=None, engine_stats=None, save_corpus=None):
+    """Watch a folder and append new or changed resumes to the output files until stopped.
+    
+    Parse workers are started once and stay warm between batches. Processed
+    files are remembered by (mtime, size) in a state file in the output
+    directory, so restarting the watcher only picks up what changed.
+    `save_corpus` appends the cleaned texts to a text corpus, as in process_resumes.
+    """
+    from functools import partial
+    from utils import (create_output_directory, create_summary_report, open_sink, save_stats, load_stats,
+                       canonical_columns, COLUMN_ORDER, STATS_FILENAME)
+    from watch import FolderWatcher, watch_folder
+    from dedupe import LINK_COLUMNS
+    from text_corpus import TextCorpus
+    
+    stream_formats = {'csv': ['csv'], 'both': ['csv'], 'jsonl': ['jsonl']}.get(output_format)
+    if not stream_formats:
+        raise ValueError(f"❌ Watch mode appends rows and supports csv or jsonl output, not '{output_format}'.")
+    if output_format == 'both':
+        print("⚠️ Excel output is not appendable; watch mode writes CSV only.")
+    
+    validate_folder_path(folder_path)
+    output_dir = create_output_directory(output_dir) if output_dir else create_output_directory()
+    
+    stats_file = os.path.join(output_dir, STATS_FILENAME)
+    stats = load_stats(stats_file) if os.path.exists(stats_file) else ExtractionStats()
+    watcher = FolderWatcher(folder_path, recursive=recursive, path_filter=path_filter,
+                            state_file=os.path.join(output_dir, '.watch_state.json'), settle_time=settle_time)
+    columns = canonical_columns(COLUMN_ORDER + LINK_COLUMNS + ['Resume Name']) if dedupe and dedupe.mode == 'link' else None
+    sinks = [open_sink(os.path.join(output_dir, f"extracted_resume_data.{fmt}"), fmt, append=True, columns=columns)
+             for fmt in stream_formats]
+    
+    print(f"\n👀 Watching for new resumes (poll every {poll_interval:g}s, batches of {batch_size})...")
+    print(f"📂 Input folder: {folder_path}")
+    print(f"📤 Output directory: {output_dir}")
+    print(f"📝 Already processed: {len(watcher.processed)} file(s)")
+    print("⏹️ Press Ctrl+C to stop after the current batch")
+    print("-" * 60)
+    
+    corpus = TextCorpus(save_corpus) if save_corpus else None
+    try:
+        watch_folder(
+            watcher,
+            partial(process_single_resume, verbose=verbose, page_workers=page_workers,
+                    page_parallel_min_pages=page_parallel_min_pages, dedupe=dedupe,
+                    bounded_memory=bounded_memory, memory_budget_mb=memory_budget_mb,
+                    engine_stats=engine_stats, keep_text=corpus is not None),
+            sinks, stats,
+            interval=poll_interval,
+            batch_size=batch_size,
+            workers=parse_workers,
+            on_batch=lambda stats: save_stats(stats, output_dir),
+            verbose=verbose,
+            corpus=corpus
+        )
+    finally:
+        for sink in sinks:
+            sink.close()
+        if corpus is not None:
+            corpus.close()
+        watcher.save_state()
+    
+    create_summary_report(None, output_dir, stats=stats, duplicate_clusters=report_duplicate_clusters(dedupe))
+    return stats
+
+def report_engine_stats(path, max_producers=5):
+    """Print the engine each of the busiest PDF producers is currently routed to"""
+    from engine_stats import EngineStats
+    
+    producers = {}
+    for producer, engine, attempts, successes, mean_seconds in EngineStats(path).summary():
+        producers.setdefault(producer, []).append((engine, attempts, successes, mean_seconds))
+    if not producers:
+        return
+    
+    print(f"\n⚙️ PDF engine statistics for {len(producers)} producer(s):")
+    for producer, engines in list(producers.items())[:max_producers]:
+        details = ", ".join(f"{engine} {successes}/{attempts} ok"
+                            + (f" {mean_seconds * 1000:.0f}ms" if mean_seconds is not None else "")
+                            for engine, attempts, successes, mean_seconds in engines)
+        print(f"  {producer}: {details}")
+
 def display_extraction_preview(data, num_samples=2):
     """Display a preview of extracted data"""
     if not data:
@@ -127,6 +668,8 @@ def display_extraction_preview(data, num_samples=2):
 
 def setup_argument_parser():
     """Setup command line argument parser"""
+    from dedupe import DUPLICATE_MODES, DEFAULT_THRESHOLD
+    
     parser = argparse.ArgumentParser(
         description="📄 Resume Parser - Extract structured data from PDF resumes",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter
@@ -136,12 +679,64 @@ def setup_argument_parser():
         'folder_path',
         nargs='?',
         default='sample_resumes',
-        help='Path to folder containing PDF resume files'
+        help='Path to folder containing PDF resume files, or a .zip/.tar(.gz) archive of them'
+    )
+    
+    parser.add_argument(
+        '--recursive', '-r',
+        action='store_true',
+        help='Also scan nested folders for PDF files'
+    )
+    
+    parser.add_argument(
+        '--from-list',
+        metavar='FILE',
+        help="Read PDF paths from a file, one per line ('-' for stdin), instead of scanning a folder"
+    )
+    
+    parser.add_argument(
+        '--include',
+        action='append',
+        metavar='GLOB',
+        help='Only process files whose relative path or name matches this glob (repeatable)'
+    )
+    
+    parser.add_argument(
+        '--exclude',
+        action='append',
+        metavar='GLOB',
+        help='Skip files and folders matching this glob (repeatable)'
+    )
+    
+    parser.add_argument(
+        '--min-size',
+        help='Skip files smaller than this size (e.g. 10K)'
+    )
+    
+    parser.add_argument(
+        '--max-size',
+        help='Skip files larger than this size (e.g. 20M)'
+    )
+    
+    parser.add_argument(
+        '--newer-than',
+        help='Only process files modified after this ISO date or age (e.g. 2024-01-31, 7d)'
+    )
+    
+    parser.add_argument(
+        '--older-than',
+        help='Only process files modified before this ISO date or age'
+    )
+    
+    parser.add_argument(
+        '--shard',
+        metavar='I/N',
+        help='Only process shard I of N (0 <= I < N), chosen by a stable hash of each path'
     )
     
     parser.add_argument(
         '--format', '-f',
-        choices=['csv', 'excel', 'both'],
+        choices=['csv', 'excel', 'both', 'jsonl', 'parquet'],
         default='both',
         help='Output format for extracted data'
     )
@@ -152,6 +747,182 @@ def setup_argument_parser():
         help='Output directory for results (default: creates timestamped folder)'
     )
     
+    parser.add_argument(
+        '--excel-rows-per-part',
+        type=int,
+        help='Roll Excel output over to a new part every N rows (enables chunked Excel writer)'
+    )
+    
+    parser.add_argument(
+        '--excel-split',
+        choices=['files', 'sheets'],
+        default='files',
+        help='Write Excel parts as separate workbooks (in parallel) or as sheets of one workbook'
+    )
+    
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        help='Use the staged pipeline: async file reads, a process pool for parsing and a streaming writer'
+    )
+    
+    parser.add_argument(
+        '--read-concurrency',
+        type=int,
+        default=8,
+        help='Concurrent file reads in pipeline mode'
+    )
+    
+    parser.add_argument(
+        '--parse-workers',
+        type=int,
+        help='Worker processes for parsing and extraction in pipeline mode (default: CPU count)'
+    )
+    
+    parser.add_argument(
+        '--schedule',
+        choices=['fifo', 'lpt'],
+        default='fifo',
+        help="Order of files in pipeline mode: as discovered, or 'lpt' to list them first, start the longest "
+             "(by page count, else size) first and split outsized or late long documents across workers"
+    )
+    
+    parser.add_argument(
+        '--shared-memory',
+        action='store_true',
+        help='Hand large PDFs (512 KB and up) to parse workers through shared memory instead of pickling them'
+    )
+    
+    parser.add_argument(
+        '--read-queue',
+        type=int,
+        default=16,
+        help='Maximum files read into memory and waiting for a parse worker'
+    )
+    
+    parser.add_argument(
+        '--result-queue',
+        type=int,
+        default=64,
+        help='Maximum extracted results waiting for the writer'
+    )
+    
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running and append new or changed PDFs in the folder to the output (csv/jsonl)'
+    )
+    
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=5.0,
+        help='Seconds between folder scans in watch mode'
+    )
+    
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=32,
+        help='Maximum files processed per micro-batch in watch mode'
+    )
+    
+    parser.add_argument(
+        '--settle-time',
+        type=float,
+        default=2.0,
+        help='Seconds a file must stay unchanged before watch mode picks it up'
+    )
+    
+    parser.add_argument(
+        '--page-workers',
+        type=int,
+        help='Processes that split the pages of one long PDF (default: 1, no splitting; --schedule lpt assigns them per document)'
+    )
+    
+    parser.add_argument(
+        '--page-threshold',
+        type=int,
+        help='Minimum page count before a PDF is split across page workers (default: 50)'
+    )
+    
+    parser.add_argument(
+        '--bounded-memory',
+        action='store_true',
+        help='Release each PDF page as soon as its text is read, keeping memory flat on very long documents'
+    )
+    
+    parser.add_argument(
+        '--memory-budget',
+        type=float,
+        metavar='MB',
+        help='Fail a document whose extraction grows memory by more than MB (implies --bounded-memory)'
+    )
+    
+    parser.add_argument(
+        '--save-corpus',
+        metavar='FILE',
+        help='Also append the cleaned text of every extracted resume to this compressed text corpus'
+    )
+    
+    parser.add_argument(
+        '--reextract',
+        metavar='CORPUS',
+        help='Skip PDF parsing and run extraction over the texts saved with --save-corpus'
+    )
+    
+    parser.add_argument(
+        '--engine-stats',
+        metavar='FILE',
+        default=os.environ.get('RESUME_PARSER_ENGINE_STATS'),
+        help='Learn per PDF producer whether pdfplumber or PyPDF2 works faster, in this SQLite file, and route documents accordingly'
+    )
+    
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Drop the per-file messages and keep only the progress line, errors and summary'
+    )
+    
+    parser.add_argument(
+        '--metrics-file',
+        metavar='FILE',
+        help='Periodically rewrite live metrics to this file (Prometheus text format if it ends in .prom, else JSON)'
+    )
+    
+    parser.add_argument(
+        '--metrics-interval',
+        type=float,
+        default=5.0,
+        help='Seconds between progress line and metrics file updates'
+    )
+    
+    parser.add_argument(
+        '--eta',
+        action='store_true',
+        help='Count the inputs in the background to show progress out of the total and an ETA (scans the folder or list a second time)'
+    )
+    
+    parser.add_argument(
+        '--dedupe',
+        metavar='STORE',
+        help='Detect near-duplicate resumes with MinHash/LSH, remembering signatures in this SQLite file across runs'
+    )
+    
+    parser.add_argument(
+        '--dedupe-mode',
+        choices=DUPLICATE_MODES,
+        default='skip',
+        help='skip: do not extract near-duplicates; link: extract them and add a Duplicate Of column'
+    )
+    
+    parser.add_argument(
+        '--dedupe-threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='Estimated Jaccard similarity of the text above which resumes count as near-duplicates'
+    )
+    
     parser.add_argument(
         '--preview', '-p',
         action='store_true',
@@ -189,22 +960,144 @@ def create_sample_folder_if_needed(folder_path, create_if_missing=False):
 
 def main():
     """Main function with enhanced command line interface"""
+    if len(sys.argv) > 1 and sys.argv[1] == 'merge':
+        from merge_results import main as merge_main
+        return merge_main(sys.argv[2:])
+    if len(sys.argv) > 1 and sys.argv[1] == 'index':
+        from skill_index import main as index_main
+        return index_main(sys.argv[2:])
+    
     parser = setup_argument_parser()
     args = parser.parse_args()
     
+    from metrics import RunMetrics, memory_summary
+    from dedupe import DuplicateStore
+    from discovery import is_archive
+    
     print("🎯 Resume-Parser")
     print("=" * 60)
     
     try:
-        if not create_sample_folder_if_needed(args.folder_path, args.create_folder):
+        if args.reextract:
+            metrics = RunMetrics(
+                total=None,
+                metrics_file=args.metrics_file,
+                interval=args.metrics_interval,
+                overwrite_line=True
+            )
+            extracted_data, stats = reextract_corpus(
+                args.reextract,
+                output_format=args.format,
+                output_dir=args.output_dir,
+                excel_rows_per_part=args.excel_rows_per_part,
+                excel_split=args.excel_split,
+                keep_samples=args.samples if args.preview else 0,
+                parse_workers=args.parse_workers,
+                metrics=metrics
+            )
+            if extracted_data is None:
+                sys.exit(1)
+            if args.preview:
+                display_extraction_preview(extracted_data, args.samples)
+            print(f"\n🎉 Re-extraction completed: {stats.total} resume(s)")
+            return
+        
+        if not args.from_list and not create_sample_folder_if_needed(args.folder_path, args.create_folder):
             sys.exit(1)
         
-        print(f"\n🔍 Scanning folder: {args.folder_path}")
-        extracted_data = process_resumes(
-            folder_path=args.folder_path,
-            output_format=args.format,
-            output_dir=args.output_dir
+        archive_input = not args.from_list and is_archive(args.folder_path)
+        
+        dedupe = None
+        if args.dedupe:
+            dedupe = DuplicateStore(args.dedupe, threshold=args.dedupe_threshold, mode=args.dedupe_mode)
+            print(f"♻️ Near-duplicate detection: {len(dedupe)} known resume(s) in {args.dedupe}, "
+                  f"{args.dedupe_mode} at {args.dedupe_threshold:.0%} similarity")
+        
+        if args.watch:
+            if args.from_list or archive_input or args.shard:
+                raise ValueError("❌ --watch needs a folder and cannot be combined with --from-list, archives or --shard.")
+            stats = watch_resumes(
+                folder_path=args.folder_path,
+                output_format=args.format,
+                output_dir=args.output_dir,
+                recursive=args.recursive,
+                path_filter=build_path_filter(args),
+                poll_interval=args.poll_interval,
+                batch_size=args.batch_size,
+                settle_time=args.settle_time,
+                parse_workers=args.parse_workers,
+                verbose=not args.quiet,
+                page_workers=args.page_workers,
+                page_parallel_min_pages=args.page_threshold,
+                dedupe=dedupe,
+                bounded_memory=args.bounded_memory or None,
+                memory_budget_mb=args.memory_budget,
+                engine_stats=args.engine_stats,
+                save_corpus=args.save_corpus
+            )
+            print(f"\n👋 Watch mode stopped. Total resumes processed: {stats.total}")
+            print(memory_summary())
+            return
+        
+        if args.from_list:
+            print(f"\n🔍 Reading file list: {args.from_list}")
+        elif archive_input:
+            print(f"\n📦 Streaming archive members: {args.folder_path}")
+        else:
+            print(f"\n🔍 Scanning folder: {args.folder_path}{' (recursive)' if args.recursive else ''}")
+        
+        metrics = RunMetrics(
+            metrics_file=args.metrics_file,
+            interval=args.metrics_interval,
+            overwrite_line=args.quiet
         )
+        if args.eta:
+            count_inputs_in_background(args, metrics)
+        if args.pipeline or archive_input:
+            extracted_data, stats = process_resumes_pipeline(
+                folder_path=args.from_list or args.folder_path,
+                inputs=iter_inputs(args),
+                output_format=args.format,
+                output_dir=args.output_dir,
+                excel_rows_per_part=args.excel_rows_per_part,
+                excel_split=args.excel_split,
+                keep_samples=args.samples if args.preview else 0,
+                read_concurrency=args.read_concurrency,
+                parse_workers=args.parse_workers,
+                read_queue_size=args.read_queue,
+                result_queue_size=args.result_queue,
+                verbose=not args.quiet,
+                metrics=metrics,
+                page_workers=args.page_workers,
+                page_parallel_min_pages=args.page_threshold,
+                dedupe=dedupe,
+                bounded_memory=args.bounded_memory or None,
+                memory_budget_mb=args.memory_budget,
+                engine_stats=args.engine_stats,
+                shared_memory=args.shared_memory or None,
+                schedule=args.schedule,
+                save_corpus=args.save_corpus
+            )
+            total_processed = stats.total
+        else:
+            extracted_data = process_resumes(
+                folder_path=args.from_list or args.folder_path,
+                inputs=iter_inputs(args),
+                output_format=args.format,
+                output_dir=args.output_dir,
+                excel_rows_per_part=args.excel_rows_per_part,
+                excel_split=args.excel_split,
+                verbose=not args.quiet,
+                metrics=metrics,
+                page_workers=args.page_workers,
+                page_parallel_min_pages=args.page_threshold,
+                dedupe=dedupe,
+                bounded_memory=args.bounded_memory or None,
+                memory_budget_mb=args.memory_budget,
+                engine_stats=args.engine_stats,
+                save_corpus=args.save_corpus
+            )
+            total_processed = len(extracted_data) if extracted_data else 0
         
         if extracted_data is None:
             print("\n❌ No data was extracted. Exiting.")
@@ -216,7 +1109,10 @@ def main():
         print("\n" + "=" * 60)
         print("🎉 PROCESSING COMPLETED SUCCESSFULLY!")
         print("=" * 60)
-        print(f"📊 Total resumes processed: {len(extracted_data)}")
+        print(f"📊 Total resumes processed: {total_processed}")
+        print(metrics.memory_summary())
+        if args.engine_stats:
+            report_engine_stats(args.engine_stats)
         print("💡 Check the output directory for your results.")
         
     except FileNotFoundError as e:
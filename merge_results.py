@@ -0,0 +1,139 @@
+import os
+import re
+import csv
+import sys
+import json
+import glob
+import argparse
+
+RESULT_PATTERN = re.compile(r'^extracted_resume_data_\d+_resumes\.(csv|jsonl|parquet)$')
+
+
+def find_result_files(shard_dirs, output_format):
+    """Return the per-shard result files of one format, in shard directory order"""
+    files = []
+    for shard_dir in shard_dirs:
+        for path in sorted(glob.glob(os.path.join(shard_dir, f"extracted_resume_data_*_resumes.{output_format}"))):
+            if RESULT_PATTERN.match(os.path.basename(path)):
+                files.append(path)
+    return files
+
+
+def merge_csv(files, output_file):
+    """Concatenate CSV shards with the canonical column order, streaming row by row"""
+    from utils import canonical_columns
+
+    columns = []
+    for path in files:
+        with open(path, newline='', encoding='utf-8') as f:
+            for column in next(csv.reader(f), []):
+                if column not in columns:
+                    columns.append(column)
+    columns = canonical_columns(columns)
+
+    rows = 0
+    with open(output_file, 'w', newline='', encoding='utf-8') as out:
+        writer = csv.DictWriter(out, fieldnames=columns)
+        writer.writeheader()
+        for path in files:
+            with open(path, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    writer.writerow(row)
+                    rows += 1
+    return rows
+
+
+def merge_jsonl(files, output_file):
+    """Concatenate JSONL shards, re-emitting each record in canonical key order"""
+    from utils import JsonlSink
+
+    with JsonlSink(output_file) as sink:
+        for path in files:
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        sink.write(json.loads(line))
+        return sink.count
+
+
+def merge_parquet(files, output_file):
+    """Concatenate Parquet shards (requires pandas and pyarrow)"""
+    import pandas as pd
+    from utils import order_columns
+
+    df = pd.concat([pd.read_parquet(path) for path in files], ignore_index=True)
+    order_columns(df).to_parquet(output_file, index=False)
+    return len(df)
+
+
+MERGERS = {'csv': merge_csv, 'jsonl': merge_jsonl, 'parquet': merge_parquet}
+
+
+def merge_stats(shard_dirs):
+    """Merge the extraction_stats.json of every shard that has one"""
+    from utils import STATS_FILENAME, load_stats
+
+    merged = None
+    for shard_dir in shard_dirs:
+        stats_file = os.path.join(shard_dir, STATS_FILENAME)
+        if not os.path.exists(stats_file):
+            print(f"⚠️ No statistics found in '{shard_dir}'")
+            continue
+        stats = load_stats(stats_file)
+        merged = stats if merged is None else merged.merge(stats)
+    return merged
+
+
+def merge_results(shard_dirs, output_dir, formats=('csv', 'jsonl', 'parquet')):
+    """Combine per-shard outputs and statistics from `shard_dirs` into `output_dir`"""
+    from utils import create_output_directory, create_summary_report
+
+    output_dir = create_output_directory(output_dir)
+    stats = merge_stats(shard_dirs)
+    merged_any = False
+
+    for output_format in formats:
+        files = find_result_files(shard_dirs, output_format)
+        if not files:
+            continue
+        temp_file = os.path.join(output_dir, f"extracted_resume_data.merging.{output_format}")
+        try:
+            rows = MERGERS[output_format](files, temp_file)
+        except ImportError as e:
+            print(f"❌ Cannot merge {output_format} shards: {str(e)}")
+            continue
+        final_file = os.path.join(output_dir, f"extracted_resume_data_{rows}_resumes.{output_format}")
+        os.replace(temp_file, final_file)
+        print(f"✅ Merged {len(files)} {output_format.upper()} shard(s), {rows} rows: {final_file}")
+        merged_any = True
+
+    if stats is not None:
+        create_summary_report(None, output_dir, stats=stats)
+
+    return merged_any
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="main.py merge",
+        description="📄 Merge per-shard Resume Parser outputs into one result",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument('shard_dirs', nargs='+', help='Output directories written by each --shard run')
+    parser.add_argument('--output-dir', '-o', required=True, help='Directory for the merged result')
+    parser.add_argument('--format', '-f', action='append', choices=sorted(MERGERS),
+                        help='Formats to merge (default: every format found)')
+    args = parser.parse_args(argv)
+
+    missing = [shard_dir for shard_dir in args.shard_dirs if not os.path.isdir(shard_dir)]
+    if missing:
+        print(f"❌ Shard directories not found: {', '.join(missing)}")
+        sys.exit(1)
+
+    if not merge_results(args.shard_dirs, args.output_dir, args.format or tuple(MERGERS)):
+        print("❌ No shard outputs found to merge.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+import os
+import sys
+import json
+import time
+from typing import Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+STAGES = ('read', 'pdfplumber', 'pypdf2_fallback', 'clean', 'dedupe', 'extract', 'write')
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """Format seconds as e.g. '42s', '3m05s' or '1h12m'"""
+    if seconds is None:
+        return '--'
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+
+
+def current_rss() -> Optional[int]:
+    """Resident set size of this process in bytes, or its peak where /proc is unavailable"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return peak_rss()
+
+
+def peak_rss(children: bool = False) -> Optional[int]:
+    """Peak RSS in bytes of this process, or of its largest finished child process"""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    return usage.ru_maxrss if sys.platform == 'darwin' else usage.ru_maxrss * 1024
+
+
+def format_bytes(size: Optional[int]) -> str:
+    return '--' if size is None else f"{size / (1024 * 1024):.0f} MB"
+
+
+def memory_summary(worker_peak: int = 0) -> str:
+    """Peak RSS of this process and of the largest worker, for sizing worker counts"""
+    parts = [f"main process {format_bytes(peak_rss())}"]
+    worker_peak = max(peak_rss(children=True) or 0, worker_peak)
+    if worker_peak:
+        parts.append(f"largest worker {format_bytes(worker_peak)}")
+    return "🧠 Peak RSS: " + ", ".join(parts)
+
+
+class StageStats:
+    """Count, total and maximum seconds spent in one processing stage"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict:
+        return {'count': self.count, 'total_seconds': round(self.total, 6),
+                'mean_seconds': round(self.mean, 6), 'max_seconds': round(self.max, 6)}
+
+
+class RunMetrics:
+    """Live throughput, ETA, queue depths and per-stage latency for a batch run.
+
+    Call `record_document` once per input with the timings collected by
+    `process_single_resume`, and `report` whenever convenient; the progress
+    line and the metrics file are refreshed at most every `interval` seconds.
+    A `metrics_file` ending in `.prom` is written in the Prometheus text
+    format (for the node exporter textfile collector), anything else as JSON.
+    """
+
+    def __init__(self, total: Optional[int] = None, metrics_file: Optional[str] = None,
+                 interval: float = 5.0, overwrite_line: bool = False):
+        self.total = total
+        self.metrics_file = metrics_file
+        self.interval = interval
+        self.overwrite_line = overwrite_line
+        self.started = time.monotonic()
+        self.last_report = 0.0
+        self.documents = 0
+        self.failed = 0
+        self.pages = 0
+        self.stages: Dict[str, StageStats] = {stage: StageStats() for stage in STAGES}
+        self.queue_depths: Dict[str, int] = {}
+        self.document_peak_rss = 0
+
+    def record_document(self, ok: bool, timings: Optional[dict] = None):
+        self.documents += 1
+        if not ok:
+            self.failed += 1
+        for stage, seconds in (timings or {}).items():
+            if stage == 'pages':
+                self.pages += seconds or 0
+            elif stage == 'peak_rss':
+                self.document_peak_rss = max(self.document_peak_rss, seconds)
+            elif stage in self.stages:
+                self.stages[stage].add(seconds)
+
+    def record_stage(self, stage: str, seconds: float):
+        self.stages[stage].add(seconds)
+
+    def set_queue_depths(self, depths: Dict[str, int]):
+        self.queue_depths = dict(depths)
+
+    def memory_summary(self) -> str:
+        return memory_summary(self.document_peak_rss)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def snapshot(self) -> dict:
+        elapsed = self.elapsed
+        docs_per_sec = self.documents / elapsed if elapsed else 0.0
+        eta = None
+        if self.total is not None and docs_per_sec:
+            eta = max(self.total - self.documents, 0) / docs_per_sec
+        return {
+            'timestamp': time.time(),
+            'elapsed_seconds': round(elapsed, 3),
+            'documents': self.documents,
+            'documents_total': self.total,
+            'failed': self.failed,
+            'pages': self.pages,
+            'docs_per_sec': round(docs_per_sec, 3),
+            'pages_per_sec': round(self.pages / elapsed if elapsed else 0.0, 3),
+            'eta_seconds': None if eta is None else round(eta, 1),
+            'queue_depths': dict(self.queue_depths),
+            'peak_rss_bytes': peak_rss(),
+            'worker_peak_rss_bytes': max(peak_rss(children=True) or 0, self.document_peak_rss) or None,
+            'stages': {stage: stats.to_dict() for stage, stats in self.stages.items()},
+        }
+
+    def progress_line(self, snapshot: Optional[dict] = None) -> str:
+        snapshot = snapshot or self.snapshot()
+        done = f"{snapshot['documents']}/{self.total}" if self.total is not None else str(snapshot['documents'])
+        parts = [f"⏱️ {done} docs", f"{snapshot['docs_per_sec']:.1f} docs/s",
+                 f"{snapshot['pages_per_sec']:.1f} pages/s", f"ETA {format_duration(snapshot['eta_seconds'])}"]
+        if self.queue_depths:
+            parts.append("queues " + " ".join(f"{name} {depth}" for name, depth in self.queue_depths.items()))
+        busiest = max(self.stages.items(), key=lambda item: item[1].total)
+        if busiest[1].count:
+            parts.append(f"most time in {busiest[0]} ({busiest[1].mean * 1000:.0f}ms avg)")
+        process_peak = max(snapshot['peak_rss_bytes'] or 0, snapshot['worker_peak_rss_bytes'] or 0)
+        if process_peak:
+            parts.append(f"peak RSS {format_bytes(process_peak)}")
+        if self.failed:
+            parts.append(f"❌ {self.failed}")
+        return " | ".join(parts)
+
+    def report(self, force: bool = False):
+        """Print the progress line and rewrite the metrics file if `interval` has passed"""
+        now = time.monotonic()
+        if not force and now - self.last_report < self.interval:
+            return
+        self.last_report = now
+        snapshot = self.snapshot()
+        if self.overwrite_line:
+            print("\r" + self.progress_line(snapshot), end="\n" if force else "", flush=True)
+        else:
+            print(self.progress_line(snapshot), flush=True)
+        if self.metrics_file:
+            self.write_metrics_file(snapshot)
+
+    def write_metrics_file(self, snapshot: Optional[dict] = None):
+        """Atomically rewrite the metrics file so scrapers never see a partial file"""
+        snapshot = snapshot or self.snapshot()
+        if self.metrics_file.endswith('.prom'):
+            content = self.to_prometheus(snapshot)
+        else:
+            content = json.dumps(snapshot, indent=2)
+        temp_file = f"{self.metrics_file}.tmp"
+        try:
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(temp_file, self.metrics_file)
+        except OSError as e:
+            print(f"⚠️ Could not write metrics file {self.metrics_file}: {e}")
+
+    def to_prometheus(self, snapshot: dict) -> str:
+        lines = []
+
+        def metric(name, metric_type, help_text, samples):
+            lines.append(f"# HELP resume_parser_{name} {help_text}")
+            lines.append(f"# TYPE resume_parser_{name} {metric_type}")
+            for labels, value in samples:
+                lines.append(f"resume_parser_{name}{labels} {value}")
+
+        metric('documents_total', 'counter', 'Documents processed so far.', [('', snapshot['documents'])])
+        metric('documents_failed_total', 'counter', 'Documents that yielded no record.', [('', snapshot['failed'])])
+        metric('pages_total', 'counter', 'PDF pages processed so far.', [('', snapshot['pages'])])
+        if self.total is not None:
+            metric('documents_expected', 'gauge', 'Documents in this run.', [('', self.total)])
+        metric('docs_per_second', 'gauge', 'Average documents per second.', [('', snapshot['docs_per_sec'])])
+        metric('pages_per_second', 'gauge', 'Average pages per second.', [('', snapshot['pages_per_sec'])])
+        if snapshot['eta_seconds'] is not None:
+            metric('eta_seconds', 'gauge', 'Estimated seconds until the run completes.', [('', snapshot['eta_seconds'])])
+        rss_samples = [(f'{{process="{process}"}}', snapshot[key]) for process, key in
+                       (('main', 'peak_rss_bytes'), ('worker', 'worker_peak_rss_bytes')) if snapshot[key]]
+        if rss_samples:
+            metric('peak_rss_bytes', 'gauge', 'Peak resident set size of the main process and the largest worker.',
+                   rss_samples)
+        if snapshot['queue_depths']:
+            metric('queue_depth', 'gauge', 'Items waiting in each pipeline queue.',
+                   [(f'{{queue="{name}"}}', depth) for name, depth in snapshot['queue_depths'].items()])
+        stages = snapshot['stages']
+        metric('stage_seconds_sum', 'counter', 'Seconds spent per processing stage.',
+               [(f'{{stage="{stage}"}}', stats['total_seconds']) for stage, stats in stages.items()])
+        metric('stage_seconds_count', 'counter', 'Timed calls per processing stage.',
+               [(f'{{stage="{stage}"}}', stats['count']) for stage, stats in stages.items()])
+        metric('stage_seconds_max', 'gauge', 'Slowest single call per processing stage.',
+               [(f'{{stage="{stage}"}}', stats['max_seconds']) for stage, stats in stages.items()])
+        return "\n".join(lines) + "\n"
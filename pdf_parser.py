@@ -1,39 +1,287 @@
-import pdfplumber
-import PyPDF2
+import io
+import os
+import gc
+import time
 import regex as re
 
-def extract_text_from_pdf(pdf_path):
+from metrics import current_rss, format_bytes
+
+# With more than one page worker, documents with at least this many pages have
+# their page range split across worker processes that each open the PDF
+# independently; shorter documents are read serially so they don't pay the
+# process start-up cost. Off by default: callers that already run documents
+# in a process pool would otherwise start a nested pool per long PDF.
+PAGE_PARALLEL_MIN_PAGES = int(os.environ.get('RESUME_PARSER_PAGE_PARALLEL_MIN_PAGES', 50))
+PAGE_WORKERS = int(os.environ.get('RESUME_PARSER_PAGE_WORKERS', 1))
+MIN_PAGES_PER_RANGE = 4
+
+# Bounded-memory mode drops each page's parsed objects as soon as its text is
+# taken, and a non-zero budget fails a document whose extraction grows the
+# process RSS by more than that many MB.
+BOUNDED_MEMORY = os.environ.get('RESUME_PARSER_BOUNDED_MEMORY', '').lower() in ('1', 'true', 'yes')
+MEMORY_BUDGET_MB = float(os.environ.get('RESUME_PARSER_MEMORY_BUDGET_MB', 0))
+
+# SQLite file in which engine_stats learns the best engine per PDF producer
+ENGINE_STATS_PATH = os.environ.get('RESUME_PARSER_ENGINE_STATS')
+ENGINE_LABELS = {'pdfplumber': 'pdfplumber', 'pypdf2': 'PyPDF2'}
+ENGINE_STAGES = {'pdfplumber': 'pdfplumber', 'pypdf2': 'pypdf2_fallback'}
+# pdfplumber output shorter than this counts as a failure and falls back to PyPDF2
+MIN_TEXT_LENGTH = 100
+
+class MemoryBudgetExceeded(MemoryError):
+    """Raised when extracting a document grows RSS past its memory budget"""
+
+class MemoryGuard:
+    """Sample RSS after each page; record the peak and enforce the per-document budget"""
+    
+    def __init__(self, budget_mb=None, timings=None):
+        self.budget_mb = budget_mb
+        self.timings = timings
+        self.baseline = current_rss()
+    
+    def check(self, page_number):
+        rss = current_rss()
+        if rss is None:
+            return
+        if self.timings is not None:
+            self.timings['peak_rss'] = max(self.timings.get('peak_rss', 0), rss)
+        if self.budget_mb and self.baseline is not None and rss - self.baseline > self.budget_mb * 1024 * 1024:
+            raise MemoryBudgetExceeded(f"memory budget of {self.budget_mb:g} MB exceeded at page {page_number} "
+                                       f"(RSS grew by {format_bytes(rss - self.baseline)})")
+
+class MemoryViewReader(io.RawIOBase):
+    """Seekable read-only file over a memoryview, so a PDF in shared memory is parsed in place.
+    
+    io.BytesIO would copy the whole buffer first. The reader keeps no views
+    of its own, so the owner can release the memoryview once parsing is done.
     """
-    Extract text from PDF using multiple methods for better accuracy
+    
+    def __init__(self, view):
+        self.view = view
+        self.position = 0
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return True
+    
+    def readinto(self, buffer):
+        count = max(0, min(len(buffer), len(self.view) - self.position))
+        buffer[:count] = self.view[self.position:self.position + count]
+        self.position += count
+        return count
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self.position = offset
+        return offset
+    
+    def tell(self):
+        return self.position
+
+def open_pdf_source(pdf_source):
+    """Open a path, PDF bytes or a memoryview of a PDF as a binary file"""
+    if isinstance(pdf_source, memoryview):
+        return io.BufferedReader(MemoryViewReader(pdf_source))
+    if isinstance(pdf_source, (bytes, bytearray)):
+        return io.BytesIO(pdf_source)
+    return open(pdf_source, 'rb')
+
+def pdf_source_stream(pdf_source):
+    """Return something pdfplumber/PyPDF2 can open: the path itself or an in-memory stream"""
+    if isinstance(pdf_source, (bytes, bytearray, memoryview)):
+        return open_pdf_source(pdf_source)
+    return pdf_source
+
+def describe_pdf_source(pdf_source):
+    if isinstance(pdf_source, (bytes, bytearray, memoryview)):
+        return f"<in-memory PDF, {len(pdf_source)} bytes>"
+    return pdf_source
+
+def split_page_ranges(page_count, workers):
+    """Split pages into contiguous (start, stop) ranges, about two per worker for load balancing"""
+    size = max(MIN_PAGES_PER_RANGE, -(-page_count // (workers * 2)))
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+def release_page(pdf, page):
+    """Drop the layout objects pdfplumber cached for a page and pdfminer's parsed object cache"""
+    if hasattr(page, 'close'):
+        page.close()
+    else:
+        page.flush_cache()
+    cached_objects = getattr(pdf.doc, '_cached_objs', None)
+    if cached_objects:
+        cached_objects.clear()
+
+def join_pages(page_texts):
+    """Join the non-empty page texts, each ending in a newline, in one pass instead of growing a string"""
+    return "".join(f"{page_text}\n" for page_text in page_texts if page_text)
+
+def iter_page_texts(pdf, start=0, stop=None, bounded=False, guard=None):
+    """Yield the text of pages [start, stop) of an open pdfplumber document, one page at a time.
+    
+    In bounded mode each page is released as soon as its text is taken, so
+    memory stays flat instead of growing with every page parsed.
+    """
+    for page in pdf.pages[start:stop]:
+        page_text = page.extract_text() or ""
+        if bounded:
+            release_page(pdf, page)
+        if guard is not None:
+            guard.check(page.page_number)
+        yield page_text
+
+def extract_page_range(pdf_source, start, stop, bounded=False, memory_budget_mb=None):
+    """Open the PDF independently and return the text of pages [start, stop)"""
+    import pdfplumber
+    
+    guard = MemoryGuard(memory_budget_mb) if bounded else None
+    with pdfplumber.open(pdf_source_stream(pdf_source)) as pdf:
+        return list(iter_page_texts(pdf, start, stop, bounded, guard))
+
+def extract_pages_parallel(pdf_source, page_count, workers, bounded=False, memory_budget_mb=None):
+    """Extract a long document's pages on `workers` processes and reassemble them in page order"""
+    from concurrent.futures import ProcessPoolExecutor
+    
+    ranges = split_page_ranges(page_count, workers)
+    if isinstance(pdf_source, memoryview):
+        pdf_source = bytes(pdf_source)
+    
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+        futures = [executor.submit(extract_page_range, pdf_source, start, stop, bounded, memory_budget_mb)
+                   for start, stop in ranges]
+        return join_pages(page_text for future in futures for page_text in future.result())
+
+def _record_time(timings, stage, start_time):
+    elapsed = time.perf_counter() - start_time
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + elapsed
+    return elapsed
+
+def extract_with_pdfplumber(pdf_path, timings, page_workers, min_pages, bounded, memory_budget_mb):
+    """Raw text of every page read with pdfplumber, split across page workers for long documents"""
+    import pdfplumber
+    
+    text = ""
+    guard = MemoryGuard(memory_budget_mb, timings) if bounded else None
+    with pdfplumber.open(pdf_source_stream(pdf_path)) as pdf:
+        page_count = len(pdf.pages)
+        if timings is not None:
+            timings['pages'] = page_count
+        parallel = page_workers > 1 and page_count >= min_pages
+        if not parallel:
+            text = join_pages(iter_page_texts(pdf, bounded=bounded, guard=guard))
+    
+    if parallel:
+        text = extract_pages_parallel(pdf_path, page_count, page_workers, bounded, memory_budget_mb)
+    return text
+
+def extract_with_pypdf2(pdf_path, timings, bounded, memory_budget_mb):
+    """Raw text of every page read with PyPDF2"""
+    import PyPDF2
+    
+    with open_pdf_source(pdf_path) as file:
+        guard = MemoryGuard(memory_budget_mb, timings) if bounded else None
+        pdf_reader = PyPDF2.PdfReader(file)
+        if timings is not None and not timings.get('pages'):
+            timings['pages'] = len(pdf_reader.pages)
+        return join_pages(iter_pypdf2_page_texts(pdf_reader, bounded, guard))
+
+def iter_pypdf2_page_texts(pdf_reader, bounded=False, guard=None):
+    """Yield the text of each page of an open PyPDF2 reader, dropping its object cache per page in bounded mode.
+    
+    Pages already handed out re-resolve their objects from the file when the
+    cache is emptied; the cache is private to PyPDF2, so it is only cleared
+    where this version has it.
+    """
+    for page_number, page in enumerate(pdf_reader.pages, 1):
+        yield page.extract_text()
+        if bounded:
+            resolved_objects = getattr(pdf_reader, 'resolved_objects', None)
+            if resolved_objects:
+                resolved_objects.clear()
+            guard.check(page_number)
+
+def get_engine_stats(path=None):
+    """The engine statistics store at `path` (default: ENGINE_STATS_PATH), or None when disabled"""
+    path = ENGINE_STATS_PATH if path is None else path
+    if not path:
+        return None
+    from engine_stats import EngineStats
+    return EngineStats(path)
+
+def extract_text_from_pdf(pdf_path, timings=None, page_workers=None, page_parallel_min_pages=None,
+                          bounded_memory=None, memory_budget_mb=None, engine_stats=None):
+    """
+    Extract text from PDF using multiple methods for better accuracy.
+    `pdf_path` may also be the raw bytes of a PDF already read into memory.
+    When a `timings` dict is given, seconds spent per stage ('pdfplumber',
+    'pypdf2_fallback', 'clean') and the page count ('pages') are added to it.
+    Documents with at least `page_parallel_min_pages` pages are extracted on
+    `page_workers` processes (defaults: PAGE_PARALLEL_MIN_PAGES, PAGE_WORKERS).
+    With `bounded_memory` (implied by a non-zero `memory_budget_mb`) pages
+    are released as they are read, the document fails over to PyPDF2 and
+    then fails outright once RSS grows past the budget, and the peak RSS
+    is recorded as 'peak_rss' (defaults: BOUNDED_MEMORY, MEMORY_BUDGET_MB).
+    pdfplumber is tried first and PyPDF2 is the fallback, unless an
+    `engine_stats` store (default: ENGINE_STATS_PATH) has learned that the
+    document's producer is better served the other way round.
     """
     text = ""
+    page_workers = PAGE_WORKERS if page_workers is None else page_workers
+    min_pages = PAGE_PARALLEL_MIN_PAGES if page_parallel_min_pages is None else page_parallel_min_pages
+    memory_budget_mb = MEMORY_BUDGET_MB if memory_budget_mb is None else memory_budget_mb
+    bounded = (BOUNDED_MEMORY if bounded_memory is None else bounded_memory) or bool(memory_budget_mb)
     
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+    engines = ['pdfplumber', 'pypdf2']
+    stats = get_engine_stats(engine_stats)
+    if stats is not None:
+        from engine_stats import read_producer
         
-        if len(text.strip()) > 100:  
-            return clean_extracted_text(text)
-            
-    except Exception as e:
-        print(f"pdfplumber failed for {pdf_path}: {e}")
-    
-    try:
-        with open(pdf_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        producer = read_producer(pdf_path)
+        engines = stats.choose(producer)
+    
+    for attempt, engine in enumerate(engines):
+        start_time = time.perf_counter()
+        try:
+            if engine == 'pdfplumber':
+                engine_text = extract_with_pdfplumber(pdf_path, timings, page_workers, min_pages,
+                                                      bounded, memory_budget_mb)
+            else:
+                engine_text = extract_with_pypdf2(pdf_path, timings, bounded, memory_budget_mb)
         
-        return clean_extracted_text(text)
+        except Exception as e:
+            elapsed = _record_time(timings, ENGINE_STAGES[engine], start_time)
+            print(f"{ENGINE_LABELS[engine]}{' also' if attempt else ''} failed for {describe_pdf_source(pdf_path)}: {e}")
+            if stats is not None:
+                stats.record(producer, engine, False, elapsed)
+            text = ""
+            if bounded:
+                gc.collect()
+            continue
         
-    except Exception as e:
-        print(f"PyPDF2 also failed for {pdf_path}: {e}")
-        return ""
+        elapsed = _record_time(timings, ENGINE_STAGES[engine], start_time)
+        success = len(engine_text.strip()) > MIN_TEXT_LENGTH
+        if stats is not None:
+            stats.record(producer, engine, success, elapsed)
+        text += engine_text
+        
+        if success or attempt == len(engines) - 1:
+            return _timed_clean(text, timings)
+    
+    return ""
+
+def _timed_clean(text, timings):
+    start_time = time.perf_counter()
+    text = clean_extracted_text(text)
+    _record_time(timings, 'clean', start_time)
+    return text
 
 def clean_extracted_text(text):
     """
@@ -0,0 +1,195 @@
+import os
+import time
+import asyncio
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# (resume name, record or None, latency in seconds, error message or None, per-stage timings)
+PipelineResult = Tuple[str, Optional[dict], float, Optional[str], dict]
+
+_DONE = object()
+
+SHARED_MEMORY = os.environ.get('RESUME_PARSER_SHARED_MEMORY', '').lower() in ('1', 'true', 'yes')
+# Smaller PDFs are cheaper to pickle than to copy through a shared memory slot
+SHARED_MEMORY_MIN_BYTES = 512 * 1024
+
+
+def read_file(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def timed_call(process_fn: Callable, source: Any, name: str) -> Tuple[Optional[dict], float]:
+    """Run the per-resume function in a worker process and time it"""
+    start_time = time.perf_counter()
+    record = process_fn(source, name)
+    return record, time.perf_counter() - start_time
+
+
+def profiled_call(process_fn: Callable, source: Any, name: str,
+                  timings: Optional[dict] = None) -> Tuple[Optional[dict], float, dict]:
+    """Like timed_call, but `process_fn` also fills in its per-stage timings and 'worker' is the worker's pid"""
+    timings = dict(timings or {})
+    timings['worker'] = os.getpid()
+    start_time = time.perf_counter()
+    record = process_fn(source, name, timings=timings)
+    return record, time.perf_counter() - start_time, timings
+
+
+async def run_pipeline(inputs: Iterable[Tuple[Any, str]], process_fn: Callable,
+                       on_results: Callable[[List[PipelineResult]], None],
+                       read_concurrency: int = 8, parse_workers: Optional[int] = None,
+                       read_queue_size: int = 16, result_queue_size: int = 64,
+                       executor: Optional[ProcessPoolExecutor] = None,
+                       on_queue_depths: Optional[Callable[[dict], None]] = None,
+                       shared_memory: Optional[bool] = None, split_tail: bool = False,
+                       page_workers: Optional[Dict[str, int]] = None):
+    """Run discovery → async read → process-pool parse/extract → sink as overlapping stages.
+
+    `inputs` yields (path or PDF bytes, resume name). Stages are connected by
+    bounded queues, so at most `read_queue_size` file bodies wait for a worker
+    and at most `result_queue_size` results wait for the sink; a slow stage
+    applies backpressure to the ones before it. `on_results` runs in a thread
+    with batches of results and is never called concurrently.
+
+    `process_fn(source, name, timings=dict)` records its stage timings into
+    the dict; the time spent reading the file is added as 'read'. If given,
+    `on_queue_depths` receives the current queue sizes before each batch.
+
+    With `shared_memory` (default: SHARED_MEMORY), each parse task owns a
+    reusable shared memory slot: PDFs of at least SHARED_MEMORY_MIN_BYTES
+    are copied into it instead of being pickled to the worker, and the
+    record comes back through the same slot.
+
+    With `split_tail`, once every input has been read and fewer documents
+    are queued than there are workers, the workers that will run out of
+    work are shared between the last documents as their `page_workers`; the
+    last one gets all of them. A long document at the end of the run then
+    has its pages spread over cores that would otherwise wait. `page_workers`
+    maps resume names to page workers planned up front (see
+    scheduler.lpt_schedule); the larger of the two applies. `process_fn`
+    must accept `page_workers` for either.
+    """
+    loop = asyncio.get_running_loop()
+    parse_workers = parse_workers or os.cpu_count() or 1
+    path_queue: asyncio.Queue = asyncio.Queue(maxsize=read_concurrency * 2)
+    read_queue: asyncio.Queue = asyncio.Queue(maxsize=read_queue_size)
+    result_queue: asyncio.Queue = asyncio.Queue(maxsize=result_queue_size)
+    own_executor = executor is None
+    executor = executor or ProcessPoolExecutor(max_workers=parse_workers)
+    transport = None
+    readers_running = read_concurrency
+    queued = 0
+    if SHARED_MEMORY if shared_memory is None else shared_memory:
+        from shm_transport import SharedMemoryTransport
+        transport = SharedMemoryTransport(parse_workers)
+
+    async def discover():
+        iterator = iter(inputs)
+        while True:
+            item = await asyncio.to_thread(next, iterator, _DONE)
+            if item is _DONE:
+                break
+            await path_queue.put(item)
+        for _ in range(read_concurrency):
+            await path_queue.put(_DONE)
+
+    async def reader():
+        nonlocal readers_running
+        try:
+            await read_files()
+        finally:
+            readers_running -= 1
+
+    async def read_files():
+        nonlocal queued
+        while (item := await path_queue.get()) is not _DONE:
+            source, name = item
+            timings = {}
+            if not isinstance(source, (bytes, bytearray, memoryview)):
+                start_time = time.perf_counter()
+                try:
+                    source = await asyncio.to_thread(read_file, source)
+                except OSError as e:
+                    await result_queue.put((name, None, 0.0, f"Cannot read {name}: {e}", {}))
+                    continue
+                timings['read'] = time.perf_counter() - start_time
+            await read_queue.put((source, name, timings))
+            queued += 1
+
+    def split_process_fn(name):
+        workers = (page_workers or {}).get(name, 1)
+        # Workers that will find the queue empty, shared between this document and the ones still queued
+        spare = parse_workers - 1 - queued
+        if split_tail and not readers_running and spare > 0:
+            workers = max(workers, 1 + spare // (queued + 1))
+        return partial(process_fn, page_workers=workers) if workers > 1 else process_fn
+
+    async def parser(slot=None):
+        nonlocal queued
+        while (item := await read_queue.get()) is not _DONE:
+            source, name, timings = item
+            queued -= 1
+            call_fn = split_process_fn(name)
+            try:
+                if slot is not None and len(source) >= SHARED_MEMORY_MIN_BYTES:
+                    from shm_transport import shared_call
+                    result, latency, timings = await loop.run_in_executor(
+                        executor, shared_call, call_fn, slot.send(source), name, timings)
+                    record = slot.receive(result)
+                else:
+                    record, latency, timings = await loop.run_in_executor(
+                        executor, profiled_call, call_fn, source, name, timings)
+                await result_queue.put((name, record, latency, None, timings))
+            except Exception as e:
+                await result_queue.put((name, None, 0.0, f"Error processing {name}: {e}", timings))
+
+    async def sink():
+        finished = False
+        while not finished:
+            batch = [await result_queue.get()]
+            while not result_queue.empty():
+                batch.append(result_queue.get_nowait())
+            if batch[-1] is _DONE:
+                batch.pop()
+                finished = True
+            if batch:
+                if on_queue_depths:
+                    on_queue_depths({'paths': path_queue.qsize(), 'read': read_queue.qsize(),
+                                     'result': result_queue.qsize()})
+                await asyncio.to_thread(on_results, batch)
+
+    producer = asyncio.create_task(discover())
+    readers = [asyncio.create_task(reader()) for _ in range(read_concurrency)]
+    parsers = [asyncio.create_task(parser(transport.slots[index] if transport else None))
+               for index in range(parse_workers)]
+    sink_task = asyncio.create_task(sink())
+
+    async def shutdown_stages():
+        await producer
+        await asyncio.gather(*readers)
+        for _ in parsers:
+            await read_queue.put(_DONE)
+        await asyncio.gather(*parsers)
+        await result_queue.put(_DONE)
+        await sink_task
+
+    tasks = [producer, *readers, *parsers, sink_task, asyncio.create_task(shutdown_stages())]
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+    finally:
+        for task in tasks:
+            task.cancel()
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if transport:
+            transport.close()
+
+
+def run_pipeline_sync(*args, **kwargs):
+    """Blocking wrapper around run_pipeline for the CLI"""
+    return asyncio.run(run_pipeline(*args, **kwargs))
@@ -0,0 +1,89 @@
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from session_store import estimate_record_size
+
+
+def hash_file(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Thread-safe LRU cache of extraction results with TTL and size bounds"""
+
+    def __init__(self, max_entries: int = 2000, max_bytes: Optional[int] = None, ttl: Optional[float] = 86400):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _drop(self, key: str):
+        _, size, _ = self._entries.pop(key)
+        self._size -= size
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached record for `key`, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[2] > self.ttl:
+                self._drop(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[0])
+
+    def put(self, key: str, record: Dict[str, Any]):
+        """Store a record, evicting least recently used entries past the bounds"""
+        record = dict(record)
+        size = estimate_record_size(record)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (record, size, time.monotonic())
+            self._size += size
+
+            while self._entries and (len(self._entries) > self.max_entries or
+                                     (self.max_bytes is not None and self._size > self.max_bytes)):
+                self._drop(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return (self.hits / lookups) * 100 if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'entries': len(self._entries),
+            'bytes': self._size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate
+        }
@@ -0,0 +1,91 @@
+import io
+import os
+import math
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SCHEDULES = ('fifo', 'lpt')
+
+# Rough pdfplumber costs of text PDFs; only their ratio matters for ordering.
+# Size is the fallback when the page tree cannot be read.
+SECONDS_PER_PAGE = 0.05
+SECONDS_PER_MB = 20.0
+
+
+def estimate_page_count(source) -> Optional[int]:
+    """/Count of the page tree root: PyPDF2 reads the trailer, the xref and two objects, not the pages"""
+    import PyPDF2
+
+    stream = io.BytesIO(source) if isinstance(source, (bytes, bytearray, memoryview)) else open(source, 'rb')
+    with stream:
+        try:
+            count = PyPDF2.PdfReader(stream, strict=False).trailer['/Root']['/Pages']['/Count']
+            return int(count) if int(count) > 0 else None
+        except Exception:
+            return None
+
+
+def estimate_cost(source) -> float:
+    """Expected extraction seconds, from the page count or else from the file size"""
+    pages = estimate_page_count(source)
+    if pages:
+        return pages * SECONDS_PER_PAGE
+    try:
+        size = len(source) if isinstance(source, (bytes, bytearray, memoryview)) else os.path.getsize(source)
+    except OSError:
+        return 0.0
+    return size / (1024 * 1024) * SECONDS_PER_MB
+
+
+def lpt_schedule(inputs: Iterable[Tuple[Any, str]], workers: int) -> Tuple[List[Tuple[Any, str]], Dict[str, int]]:
+    """Longest processing time first: the inputs sorted by estimated cost, and page workers for the outliers.
+
+    Starting the long documents first leaves only short ones for the end
+    of the run, so workers finish at about the same time. A document
+    estimated to take longer than an even share of the whole batch would
+    still finish last in any order, so it is also given page workers (up
+    to `workers`) to split its pages over. Returns the ordered inputs and
+    {resume name: page workers}.
+    """
+    costed = [(estimate_cost(source), index, (source, name)) for index, (source, name) in enumerate(inputs)]
+    costed.sort(key=lambda item: (-item[0], item[1]))
+    share = sum(cost for cost, _, _ in costed) / max(workers, 1)
+    page_workers = {}
+    for cost, _, (_, name) in costed:
+        if cost <= share or workers < 2:
+            break
+        page_workers[name] = min(workers, math.ceil(cost / share))
+    return [item for _, _, item in costed], page_workers
+
+
+class WorkerUtilization:
+    """Busy seconds per worker process over the wall-clock time of a run"""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.started = time.monotonic()
+        self.finished = self.started
+        self.busy: Dict[int, float] = {}
+        self.documents: Dict[int, int] = {}
+
+    def record(self, worker: Optional[int], seconds: float):
+        self.finished = time.monotonic()
+        if worker is None:
+            return
+        self.busy[worker] = self.busy.get(worker, 0.0) + seconds
+        self.documents[worker] = self.documents.get(worker, 0) + 1
+
+    @property
+    def wall(self) -> float:
+        return self.finished - self.started
+
+    @property
+    def ideal(self) -> float:
+        """Wall-clock time if the busy time were spread evenly over the workers"""
+        return sum(self.busy.values()) / self.workers
+
+    def per_worker(self) -> List[Tuple[int, float, int, float]]:
+        """(pid, busy seconds, documents, share of the wall-clock time), busiest first"""
+        wall = self.wall or 1.0
+        return sorted(((worker, busy, self.documents[worker], busy / wall) for worker, busy in self.busy.items()),
+                      key=lambda row: -row[1])
@@ -0,0 +1,156 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+TEMP_DIR_PREFIX = "resume_parser_"
+
+
+def estimate_record_size(record: Dict[str, Any]) -> int:
+    """Rough in-memory size of one extracted record, in bytes"""
+    return sys.getsizeof(record) + sum(sys.getsizeof(value) for value in record.values())
+
+
+def create_session_temp_directory() -> str:
+    """Create a temporary directory the janitor can recognise as ours"""
+    return tempfile.mkdtemp(prefix=TEMP_DIR_PREFIX)
+
+
+def remove_expired_temp_directories(max_age: float, keep=()) -> int:
+    """Delete our temp directories older than `max_age` seconds that are not in `keep`"""
+    root = tempfile.gettempdir()
+    now = time.time()
+    removed = 0
+    keep = {os.path.abspath(path) for path in keep if path}
+
+    try:
+        entries = list(os.scandir(root))
+    except OSError:
+        return 0
+
+    for entry in entries:
+        if not entry.name.startswith(TEMP_DIR_PREFIX) or not entry.is_dir(follow_symlinks=False):
+            continue
+        if os.path.abspath(entry.path) in keep:
+            continue
+        try:
+            if now - entry.stat(follow_symlinks=False).st_mtime < max_age:
+                continue
+        except OSError:
+            continue
+        shutil.rmtree(entry.path, ignore_errors=True)
+        removed += 1
+
+    return removed
+
+
+class SessionStore:
+    """Per-browser-session state with idle eviction and a per-session memory cap.
+
+    Sessions are created on first use by `factory()` and are expected to
+    expose `temp_dir`, `memory_usage()`, `is_busy()` and `cleanup()`.
+    `memory_cap_bytes` bounds each session on its own; `charge()` records
+    what a session holds once a run on it ends, however it ended.
+    """
+
+    def __init__(self, factory: Callable[[], Any], idle_timeout: float = 3600,
+                 memory_cap_bytes: Optional[int] = None, max_sessions: Optional[int] = None):
+        self.factory = factory
+        self.idle_timeout = idle_timeout
+        self.memory_cap_bytes = memory_cap_bytes
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, Any]" = OrderedDict()
+        self._last_seen: Dict[str, float] = {}
+        self._usage: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._janitor: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def get(self, session_id: str) -> Any:
+        """Return the state for `session_id`, creating it if needed"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self.factory()
+                self._sessions[session_id] = session
+            self._sessions.move_to_end(session_id)
+            self._last_seen[session_id] = time.monotonic()
+
+            if self.max_sessions and len(self._sessions) > self.max_sessions:
+                self._evict_lru(exclude=session_id, until=lambda: len(self._sessions) <= self.max_sessions)
+            return session
+
+    def evict(self, session_id: str):
+        """Drop a session and remove its temporary files"""
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+            self._last_seen.pop(session_id, None)
+            self._usage.pop(session_id, None)
+        if session is not None:
+            session.cleanup()
+
+    def charge(self, session_id: str) -> int:
+        """Record the bytes `session_id` holds against that session alone"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return 0
+            self._usage[session_id] = session.memory_usage()
+            return self._usage[session_id]
+
+    def memory_usage(self, session_id: Optional[str] = None) -> int:
+        """Bytes charged to one session, or to all of them"""
+        with self._lock:
+            if session_id is not None:
+                return self._usage.get(session_id, 0)
+            return sum(self._usage.values())
+
+    def _evict_lru(self, exclude: Optional[str], until: Callable[[], bool]):
+        for session_id in list(self._sessions):
+            if until():
+                return
+            if session_id == exclude or self._sessions[session_id].is_busy():
+                continue
+            self.evict(session_id)
+
+    def evict_idle(self) -> int:
+        """Evict sessions not seen for longer than the idle timeout"""
+        cutoff = time.monotonic() - self.idle_timeout
+        with self._lock:
+            expired = [session_id for session_id, seen in self._last_seen.items()
+                       if seen < cutoff and not self._sessions[session_id].is_busy()]
+        for session_id in expired:
+            self.evict(session_id)
+        return len(expired)
+
+    def run_janitor_once(self):
+        """Evict idle sessions and delete orphaned temp directories"""
+        self.evict_idle()
+        with self._lock:
+            live_dirs = [session.temp_dir for session in self._sessions.values()]
+        remove_expired_temp_directories(self.idle_timeout, keep=live_dirs)
+
+    def start_janitor(self, interval: float = 300):
+        """Run the janitor periodically in a daemon thread"""
+        if self._janitor is not None:
+            return
+
+        def loop():
+            while not self._stop.wait(interval):
+                try:
+                    self.run_janitor_once()
+                except Exception as e:
+                    print(f"⚠️ Session janitor failed: {str(e)}")
+
+        self._janitor = threading.Thread(target=loop, name="session-janitor", daemon=True)
+        self._janitor.start()
+
+    def stop_janitor(self):
+        self._stop.set()
@@ -0,0 +1,186 @@
+import struct
+import pickle
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Union
+
+DEFAULT_SLOT_SIZE = 8 * 1024 * 1024
+# Slots a worker keeps mapped; older mappings (of slots that were replaced
+# by bigger ones) are closed first
+MAX_ATTACHED_SLOTS = 16
+
+# Record encoding: a '<I' field count, then per field a '<cII' header (value
+# kind, key length, value length) followed by the UTF-8 key and value. Strings
+# are stored as UTF-8 ('s'), None as 'n' and anything else pickled ('p').
+COUNT_FORMAT = struct.Struct('<I')
+FIELD_FORMAT = struct.Struct('<cII')
+
+# Per-process mappings of slots created by the main process
+_attached: 'OrderedDict[str, shared_memory.SharedMemory]' = OrderedDict()
+
+
+class SlotHandle(NamedTuple):
+    """Picklable reference to a slot holding a `size`-byte payload"""
+    name: str
+    size: int
+    capacity: int
+
+
+def encode_record(record: Dict[str, Any]) -> Tuple[list, int]:
+    """Return the encoded (kind, key, value) parts of a record and their total size"""
+    parts = []
+    size = COUNT_FORMAT.size
+    for key, value in record.items():
+        if isinstance(value, str):
+            kind, data = b's', value.encode('utf-8')
+        elif value is None:
+            kind, data = b'n', b''
+        else:
+            kind, data = b'p', pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        key_data = key.encode('utf-8')
+        parts.append((kind, key_data, data))
+        size += FIELD_FORMAT.size + len(key_data) + len(data)
+    return parts, size
+
+
+def write_record(buf, parts: list):
+    COUNT_FORMAT.pack_into(buf, 0, len(parts))
+    offset = COUNT_FORMAT.size
+    for kind, key_data, data in parts:
+        FIELD_FORMAT.pack_into(buf, offset, kind, len(key_data), len(data))
+        offset += FIELD_FORMAT.size
+        buf[offset:offset + len(key_data)] = key_data
+        offset += len(key_data)
+        buf[offset:offset + len(data)] = data
+        offset += len(data)
+
+
+def read_record(buf) -> Dict[str, Any]:
+    record = {}
+    count, = COUNT_FORMAT.unpack_from(buf, 0)
+    offset = COUNT_FORMAT.size
+    for _ in range(count):
+        kind, key_size, value_size = FIELD_FORMAT.unpack_from(buf, offset)
+        offset += FIELD_FORMAT.size
+        key = str(buf[offset:offset + key_size], 'utf-8')
+        offset += key_size
+        if kind == b's':
+            record[key] = str(buf[offset:offset + value_size], 'utf-8')
+        elif kind == b'n':
+            record[key] = None
+        else:
+            record[key] = pickle.loads(buf[offset:offset + value_size])
+        offset += value_size
+    return record
+
+
+class SharedSlot:
+    """A reusable shared memory segment that carries one PDF to a worker and its record back.
+
+    The main process owns the slot: it creates the segment, writes the
+    input, reads the result written in place by the worker, and unlinks
+    the segment in `close`. A slot serves one call at a time. Inputs larger
+    than the slot replace it with a bigger segment; records that do not fit
+    come back pickled instead.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_SLOT_SIZE):
+        self.shm = shared_memory.SharedMemory(create=True, size=capacity)
+        self.capacity = capacity
+
+    def _grow(self, size: int):
+        capacity = self.capacity
+        while capacity < size:
+            capacity *= 2
+        self.close()
+        self.shm = shared_memory.SharedMemory(create=True, size=capacity)
+        self.capacity = capacity
+
+    def send(self, data) -> SlotHandle:
+        """Copy a PDF into the slot and return the handle to pass to `shared_call`"""
+        if len(data) > self.capacity:
+            self._grow(len(data))
+        self.shm.buf[:len(data)] = data
+        return SlotHandle(self.shm.name, len(data), self.capacity)
+
+    def receive(self, result: Union[None, int, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Turn what `shared_call` returned into the record"""
+        if isinstance(result, int):
+            return read_record(self.shm.buf[:result])
+        return result
+
+    def close(self):
+        if self.shm is not None:
+            self.shm.close()
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+            self.shm = None
+
+
+class SharedMemoryTransport:
+    """A ring of `slots` SharedSlots, one per concurrent call, released together in `close`"""
+
+    def __init__(self, slots: int, slot_size: int = DEFAULT_SLOT_SIZE):
+        self.slots = []
+        try:
+            for _ in range(slots):
+                self.slots.append(SharedSlot(slot_size))
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        for slot in self.slots:
+            slot.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def attach_slot(handle: SlotHandle) -> shared_memory.SharedMemory:
+    """Map a slot in a worker, once per process.
+
+    Workers share the main process's resource tracker, so attaching adds
+    nothing to it and the segment is only unlinked by the owning slot.
+    """
+    shm = _attached.get(handle.name)
+    if shm is None:
+        shm = shared_memory.SharedMemory(name=handle.name)
+        _attached[handle.name] = shm
+        while len(_attached) > MAX_ATTACHED_SLOTS:
+            _attached.popitem(last=False)[1].close()
+    else:
+        _attached.move_to_end(handle.name)
+    return shm
+
+
+def shared_call(process_fn: Callable, handle: SlotHandle, name: str,
+                timings: Optional[dict] = None) -> Tuple[Union[None, int, Dict[str, Any]], float, dict]:
+    """Worker side: parse the PDF in place in the slot and write the record back into it.
+
+    Returns the encoded record size when it fits in the slot, the record
+    itself (pickled by the executor as usual) when it does not, or None.
+    """
+    from pipeline import profiled_call
+
+    shm = attach_slot(handle)
+    # The parser reads the PDF straight out of the slot; the view is released
+    # afterwards so the mapping can still be closed when it is evicted
+    source = shm.buf[:handle.size]
+    try:
+        record, latency, timings = profiled_call(process_fn, source, name, timings)
+    finally:
+        source.release()
+    if record is None:
+        return None, latency, timings
+
+    parts, size = encode_record(record)
+    if size > handle.capacity:
+        return record, latency, timings
+    write_record(shm.buf, parts)
+    return size, latency, timings
@@ -0,0 +1,503 @@
+import os
+import re
+import csv
+import sys
+import json
+import mmap
+import time
+import zlib
+import struct
+import argparse
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from stats import split_skills
+
+INDEX_VERSION = 1
+MANIFEST_FILENAME = "index.json"
+DOCS_FILENAME = "docs.dat"
+DOCS_INDEX_FILENAME = "docs.idx"
+DEFAULT_FIELDS = ('Skills',)
+
+# Non-skill fields are indexed as individual words under a field prefix,
+# e.g. "education:stanford" or "experience:kubernetes".
+FIELD_PREFIXES = {'Education': 'education', 'Work Experience': 'experience', 'Projects': 'projects'}
+WORD_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+QUERY_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+OPERATORS = {'AND', 'OR', 'NOT'}
+
+
+class QueryError(ValueError):
+    pass
+
+
+def normalize_term(term: str) -> str:
+    term = ' '.join(term.lower().split())
+    return term[len('skills:'):] if term.startswith('skills:') else term
+
+
+def record_terms(record: dict, fields: Iterable[str] = DEFAULT_FIELDS) -> set:
+    """Index terms of one extracted record: whole skills plus prefixed words of other fields"""
+    terms = set()
+    for field in fields:
+        value = record.get(field)
+        if not value:
+            continue
+        if field == 'Skills':
+            terms.update(normalize_term(skill) for skill in split_skills(str(value)))
+        else:
+            prefix = FIELD_PREFIXES.get(field, field.lower().replace(' ', '_'))
+            terms.update(f"{prefix}:{word.rstrip('.')}" for word in WORD_PATTERN.findall(str(value).lower()))
+    terms.discard('')
+    return terms
+
+
+def encode_postings(bits: int) -> bytes:
+    """Compress a posting list held as a bitset of segment-relative document ids"""
+    return zlib.compress(bits.to_bytes((bits.bit_length() + 7) // 8, 'little'), 6)
+
+
+def decode_postings(data: bytes) -> int:
+    return int.from_bytes(zlib.decompress(data), 'little')
+
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """Yield the positions of set bits, lowest first"""
+    while bits:
+        lowest = bits & -bits
+        yield lowest.bit_length() - 1
+        bits ^= lowest
+
+
+def count_bits(bits: int) -> int:
+    return bin(bits).count('1')
+
+
+def bitset_from_positions(positions: List[int]) -> int:
+    """Build a bitset in one pass; OR-ing bits into a growing int would be quadratic"""
+    bitmap = bytearray((max(positions) >> 3) + 1)
+    for position in positions:
+        bitmap[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bitmap, 'little')
+
+
+def build_postings(term_sets: Iterable[set]) -> Dict[str, int]:
+    """Map each term to the bitset of positions whose term set contains it"""
+    positions: Dict[str, List[int]] = {}
+    for position, terms in enumerate(term_sets):
+        for term in terms:
+            positions.setdefault(term, []).append(position)
+    return {term: bitset_from_positions(term_positions) for term, term_positions in positions.items()}
+
+
+def tokenize_query(query: str) -> List[Tuple[str, Optional[str]]]:
+    tokens = []
+    position = 0
+    query = query.strip()
+    while position < len(query):
+        match = QUERY_TOKEN.match(query, position)
+        if not match or match.end() == position:
+            raise QueryError(f"❌ Cannot parse query near '{query[position:]}'")
+        position = match.end()
+        open_paren, close_paren, phrase, word = match.groups()
+        if open_paren:
+            tokens.append(('(', None))
+        elif close_paren:
+            tokens.append((')', None))
+        elif phrase is not None:
+            tokens.append(('TERM', normalize_term(phrase)))
+        elif word.upper() in OPERATORS:
+            tokens.append((word.upper(), None))
+        else:
+            tokens.append(('TERM', normalize_term(word)))
+    return tokens
+
+
+def parse_query(query: str):
+    """Parse a boolean query into a tree of ('term', t), ('not', x), ('and', a, b) and ('or', a, b).
+
+    Precedence is NOT > AND > OR; adjacent terms are joined with AND, so
+    "python docker NOT php" means python AND docker AND NOT php. Multi-word
+    skills are quoted ("machine learning") and other indexed fields are
+    addressed with a prefix (education:stanford).
+    """
+    tokens = tokenize_query(query)
+    position = 0
+
+    def peek():
+        return tokens[position][0] if position < len(tokens) else None
+
+    def take(kind):
+        nonlocal position
+        if peek() != kind:
+            found = peek() or 'end of query'
+            raise QueryError(f"❌ Expected {kind} but found {found} in query '{query}'")
+        position += 1
+        return tokens[position - 1]
+
+    def parse_or():
+        node = parse_and()
+        while peek() == 'OR':
+            take('OR')
+            node = ('or', node, parse_and())
+        return node
+
+    def parse_and():
+        node = parse_not()
+        while peek() in ('AND', 'NOT', 'TERM', '('):
+            if peek() == 'AND':
+                take('AND')
+            node = ('and', node, parse_not())
+        return node
+
+    def parse_not():
+        if peek() == 'NOT':
+            take('NOT')
+            return ('not', parse_not())
+        if peek() == '(':
+            take('(')
+            node = parse_or()
+            take(')')
+            return node
+        return ('term', take('TERM')[1])
+
+    if not tokens:
+        raise QueryError("❌ Empty query")
+    tree = parse_or()
+    if position != len(tokens):
+        raise QueryError(f"❌ Unexpected {tokens[position][0]} in query '{query}'")
+    return tree
+
+
+def evaluate_query(tree, postings: Callable[[str], int], universe: int) -> int:
+    """Evaluate a parsed query to a bitset of matching document ids"""
+    kind = tree[0]
+    if kind == 'term':
+        return postings(tree[1])
+    if kind == 'not':
+        return universe & ~evaluate_query(tree[1], postings, universe)
+    left = evaluate_query(tree[1], postings, universe)
+    if kind == 'and' and not left:
+        return 0
+    right = evaluate_query(tree[2], postings, universe)
+    return left & right if kind == 'and' else left | right
+
+
+def search_records(records: List[dict], query: str, fields: Iterable[str] = DEFAULT_FIELDS) -> List[int]:
+    """Evaluate a query over in-memory records and return the indices of matches"""
+    index = build_postings(record_terms(record, fields) for record in records)
+    bits = evaluate_query(parse_query(query), lambda term: index.get(term, 0), (1 << len(records)) - 1)
+    return list(iter_bits(bits))
+
+
+class Segment:
+    """One immutable batch of postings: a memory-mapped postings file and its term dictionary"""
+
+    def __init__(self, index_dir: str, name: str, base: int, count: int):
+        self.name = name
+        self.base = base
+        self.count = count
+        with open(os.path.join(index_dir, f"{name}.terms.json"), encoding='utf-8') as f:
+            self.terms: Dict[str, List[int]] = json.load(f)
+        self.file = open(os.path.join(index_dir, f"{name}.postings"), 'rb')
+        size = os.fstat(self.file.fileno()).st_size
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+
+    def postings(self, term: str) -> int:
+        entry = self.terms.get(term)
+        if entry is None:
+            return 0
+        offset, length, _ = entry
+        return decode_postings(self.data[offset:offset + length]) << self.base
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+
+def write_segment(index_dir: str, name: str, postings: Dict[str, int]):
+    """Write term -> segment-relative bitset postings as a new segment"""
+    terms = {}
+    with open(os.path.join(index_dir, f"{name}.postings"), 'wb') as f:
+        offset = 0
+        for term in sorted(postings):
+            encoded = encode_postings(postings[term])
+            f.write(encoded)
+            terms[term] = [offset, len(encoded), count_bits(postings[term])]
+            offset += len(encoded)
+    with open(os.path.join(index_dir, f"{name}.terms.json"), 'w', encoding='utf-8') as f:
+        json.dump(terms, f, ensure_ascii=False, separators=(',', ':'))
+
+
+class SkillIndex:
+    """Persistent inverted index from skills (and optional field words) to resumes.
+
+    Each `add_records` call writes a new immutable segment, so batches can be
+    added as they land without rewriting what is already indexed; `compact`
+    merges segments when there are many. Posting lists are zlib-compressed
+    bitsets read straight from memory-mapped files, and boolean queries are
+    evaluated with integer bit operations.
+    """
+
+    def __init__(self, index_dir: str, fields: Optional[Iterable[str]] = None):
+        self.index_dir = index_dir
+        self.manifest_path = os.path.join(index_dir, MANIFEST_FILENAME)
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding='utf-8') as f:
+                self.manifest = json.load(f)
+            if fields and list(fields) != self.manifest['fields']:
+                print(f"⚠️ Index fields are fixed at creation: {', '.join(self.manifest['fields'])}")
+        else:
+            self.manifest = {'version': INDEX_VERSION, 'fields': list(fields or DEFAULT_FIELDS),
+                             'doc_count': 0, 'next_segment': 1, 'segments': []}
+        self._segments: Optional[List[Segment]] = None
+        self._docs = None
+
+    @property
+    def fields(self) -> List[str]:
+        return self.manifest['fields']
+
+    @property
+    def doc_count(self) -> int:
+        return self.manifest['doc_count']
+
+    @property
+    def universe(self) -> int:
+        return (1 << self.doc_count) - 1
+
+    def segments(self) -> List[Segment]:
+        if self._segments is None:
+            self._segments = [Segment(self.index_dir, s['name'], s['base'], s['count'])
+                              for s in self.manifest['segments']]
+        return self._segments
+
+    def postings(self, term: str) -> int:
+        bits = 0
+        for segment in self.segments():
+            bits |= segment.postings(term)
+        return bits
+
+    def document_frequency(self, term: str) -> int:
+        return sum(segment.terms.get(term, (0, 0, 0))[2] for segment in self.segments())
+
+    def _open_docs(self):
+        if self._docs is None:
+            handles = []
+            for filename in (DOCS_FILENAME, DOCS_INDEX_FILENAME):
+                path = os.path.join(self.index_dir, filename)
+                f = open(path, 'rb')
+                size = os.fstat(f.fileno()).st_size
+                handles.append((f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''))
+            self._docs = handles
+        return self._docs[0][1], self._docs[1][1]
+
+    def document_name(self, doc_id: int) -> str:
+        names, offsets = self._open_docs()
+        start, = struct.unpack_from('<Q', offsets, doc_id * 8)
+        end = names.find(b'\n', start)
+        return names[start:end].decode('utf-8')
+
+    def search(self, query: str, limit: Optional[int] = 50) -> Tuple[int, List[str]]:
+        """Return (number of matches, resume names of the first `limit` matches)"""
+        bits = evaluate_query(parse_query(query), self.postings, self.universe)
+        names = []
+        for doc_id in iter_bits(bits):
+            if limit is not None and len(names) >= limit:
+                break
+            names.append(self.document_name(doc_id))
+        return count_bits(bits), names
+
+    def indexed_names(self) -> set:
+        if not self.doc_count:
+            return set()
+        names, _ = self._open_docs()
+        return set(names[:].decode('utf-8').split('\n')[:self.doc_count])
+
+    def add_records(self, records: Iterable[dict], skip_existing: bool = True) -> int:
+        """Index a new batch as one segment; returns the number of resumes added"""
+        os.makedirs(self.index_dir, exist_ok=True)
+        existing = self.indexed_names() if skip_existing else set()
+        base = self.doc_count
+        names = []
+        term_sets = []
+
+        for record in records:
+            name = str(record.get('Resume Name') or f"resume_{base + len(names)}").replace('\n', ' ')
+            if name in existing:
+                continue
+            existing.add(name)
+            names.append(name)
+            term_sets.append(record_terms(record, self.fields))
+
+        if not names:
+            return 0
+        postings = build_postings(term_sets)
+
+        self.close()
+        segment_name = f"segment_{self.manifest['next_segment']:05d}"
+        write_segment(self.index_dir, segment_name, postings)
+        self._append_documents(names, base)
+
+        self.manifest['segments'].append({'name': segment_name, 'base': base, 'count': len(names)})
+        self.manifest['doc_count'] = base + len(names)
+        self.manifest['next_segment'] += 1
+        self._write_manifest()
+        return len(names)
+
+    def _append_documents(self, names: List[str], base: int):
+        """Append names to docs.dat/docs.idx, first dropping anything past the manifest (an interrupted add)"""
+        names_path = os.path.join(self.index_dir, DOCS_FILENAME)
+        offsets_path = os.path.join(self.index_dir, DOCS_INDEX_FILENAME)
+        for path in (names_path, offsets_path):
+            if not os.path.exists(path):
+                open(path, 'wb').close()
+
+        with open(offsets_path, 'r+b') as offsets, open(names_path, 'r+b') as data:
+            offsets.truncate(base * 8)
+            if base:
+                offsets.seek((base - 1) * 8)
+                last_start, = struct.unpack('<Q', offsets.read(8))
+                data.seek(last_start)
+                data.readline()
+                data.truncate(data.tell())
+            else:
+                data.truncate(0)
+
+            data.seek(0, os.SEEK_END)
+            offsets.seek(0, os.SEEK_END)
+            position = data.tell()
+            for name in names:
+                encoded = name.encode('utf-8') + b'\n'
+                offsets.write(struct.pack('<Q', position))
+                data.write(encoded)
+                position += len(encoded)
+
+    def _write_manifest(self):
+        temp_path = f"{self.manifest_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, indent=2)
+        os.replace(temp_path, self.manifest_path)
+
+    def compact(self) -> int:
+        """Merge all segments into one; returns the number of segments merged"""
+        segments = self.segments()
+        if len(segments) < 2:
+            return 0
+
+        terms = set()
+        for segment in segments:
+            terms.update(segment.terms)
+        merged = {term: self.postings(term) for term in terms}
+
+        segment_name = f"segment_{self.manifest['next_segment']:05d}"
+        write_segment(self.index_dir, segment_name, merged)
+        old_names = [segment.name for segment in segments]
+        self.close()
+
+        self.manifest['segments'] = [{'name': segment_name, 'base': 0, 'count': self.doc_count}]
+        self.manifest['next_segment'] += 1
+        self._write_manifest()
+        for name in old_names:
+            for suffix in ('.postings', '.terms.json'):
+                os.remove(os.path.join(self.index_dir, name + suffix))
+        return len(old_names)
+
+    def close(self):
+        for segment in self._segments or []:
+            segment.close()
+        self._segments = None
+        for f, data in self._docs or []:
+            if isinstance(data, mmap.mmap):
+                data.close()
+            f.close()
+        self._docs = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def iter_result_records(path: str) -> Iterator[dict]:
+    """Read records back from a CSV, JSONL or Parquet result file"""
+    if path.endswith('.jsonl'):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif path.endswith('.csv'):
+        with open(path, newline='', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+    elif path.endswith('.parquet'):
+        import pandas as pd
+
+        yield from pd.read_parquet(path).fillna('').to_dict('records')
+    else:
+        raise ValueError(f"❌ Unsupported result file '{path}', expected .csv, .jsonl or .parquet")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="main.py index",
+        description="🔎 Build and query a persistent skills index over extraction results",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    add_parser = commands.add_parser('add', help='Index result files (CSV, JSONL or Parquet) as a new segment')
+    add_parser.add_argument('index_dir', help='Index directory (created if missing)')
+    add_parser.add_argument('result_files', nargs='+', help='Result files written by main.py')
+    add_parser.add_argument('--field', action='append', dest='fields',
+                            choices=['Skills', 'Education', 'Work Experience', 'Projects'],
+                            help='Fields to index when creating the index (default: Skills)')
+    add_parser.add_argument('--allow-duplicates', action='store_true',
+                            help='Index resumes again even if their Resume Name is already indexed')
+
+    query_parser = commands.add_parser('query', help='Run a boolean query such as "python AND docker NOT php"')
+    query_parser.add_argument('index_dir', help='Index directory')
+    query_parser.add_argument('query', help='Query; quote multi-word skills and use education:/experience: prefixes')
+    query_parser.add_argument('--limit', type=int, default=50, help='Maximum resume names to print')
+
+    compact_parser = commands.add_parser('compact', help='Merge all segments into one')
+    compact_parser.add_argument('index_dir', help='Index directory')
+
+    args = parser.parse_args(argv)
+
+    if args.command != 'add' and not os.path.exists(os.path.join(args.index_dir, MANIFEST_FILENAME)):
+        print(f"❌ No index found in '{args.index_dir}'")
+        sys.exit(1)
+
+    try:
+        with SkillIndex(args.index_dir, args.fields if args.command == 'add' else None) as index:
+            if args.command == 'add':
+                for path in args.result_files:
+                    added = index.add_records(iter_result_records(path), skip_existing=not args.allow_duplicates)
+                    print(f"✅ Indexed {added} resume(s) from {path}")
+                print(f"📚 Index now holds {index.doc_count} resume(s) in {len(index.manifest['segments'])} segment(s)")
+
+            elif args.command == 'query':
+                start_time = time.perf_counter()
+                total, names = index.search(args.query, limit=args.limit)
+                elapsed = (time.perf_counter() - start_time) * 1000
+                print(f"🔎 {total} match(es) in {elapsed:.1f} ms")
+                for name in names:
+                    print(f"  {name}")
+                if total > len(names):
+                    print(f"  ... and {total - len(names)} more")
+
+            else:
+                merged = index.compact()
+                print(f"✅ Merged {merged} segment(s)" if merged else "ℹ️ Nothing to compact")
+
+    except ValueError as e:
+        print(f"{e}")
+        sys.exit(1)
+
+    except OSError as e:
+        print(f"❌ Index error: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
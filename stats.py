@@ -0,0 +1,216 @@
+import heapq
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SUMMARY_FIELDS = ['Name', 'Email', 'Phone', 'Skills', 'Work Experience',
+                  'Education', 'Projects', 'Hobbies', 'Qualities']
+
+
+def split_skills(skills: str) -> List[str]:
+    """Split a comma separated Skills value into individual skills"""
+    if not skills:
+        return []
+    return [skill.strip() for skill in skills.split(',') if skill.strip()]
+
+
+class SkillSketch:
+    """Bounded heavy-hitters counter (Space-Saving) for skill frequencies.
+
+    The eviction victim comes from a min-heap holding one (count, item)
+    entry per counter. Increments leave the heap alone, so an entry may
+    lag behind its counter; a stale entry is refreshed when it reaches
+    the top, which makes an eviction O(log capacity) amortised.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+
+    def add(self, item: str, count: int = 1):
+        if item in self.counts:
+            self.counts[item] += count
+            return
+
+        if len(self.counts) < self.capacity:
+            self.counts[item] = count
+            self.errors[item] = 0
+            heapq.heappush(self._heap, (count, item))
+            return
+
+        victim = self._pop_min()
+        floor = self.counts.pop(victim)
+        self.errors.pop(victim, None)
+        self.counts[item] = floor + count
+        self.errors[item] = floor
+        heapq.heappush(self._heap, (floor + count, item))
+
+    def _pop_min(self) -> str:
+        while True:
+            count, item = self._heap[0]
+            if self.counts[item] == count:
+                heapq.heappop(self._heap)
+                return item
+            heapq.heapreplace(self._heap, (self.counts[item], item))
+
+    def _rebuild_heap(self):
+        self._heap = [(count, item) for item, count in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def update(self, items: Iterable[str]):
+        for item in items:
+            self.add(item)
+
+    def merge(self, other: 'SkillSketch') -> 'SkillSketch':
+        combined = Counter(self.counts)
+        combined.update(other.counts)
+        errors = Counter(self.errors)
+        errors.update(other.errors)
+
+        kept = combined.most_common(self.capacity)
+        self.counts = dict(kept)
+        self.errors = {item: errors.get(item, 0) for item, _ in kept}
+        self._rebuild_heap()
+        return self
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[str, int]]:
+        return Counter(self.counts).most_common(n)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'capacity': self.capacity, 'counts': dict(self.counts), 'errors': dict(self.errors)}
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> 'SkillSketch':
+        sketch = cls(payload.get('capacity', 1000))
+        sketch.counts = dict(payload.get('counts', {}))
+        sketch.errors = dict(payload.get('errors', {}))
+        sketch._rebuild_heap()
+        return sketch
+
+
+class ExtractionStats:
+    """Mergeable running statistics, updated once per extracted record"""
+
+    def __init__(self, fields: Optional[List[str]] = None, skill_capacity: Optional[int] = None):
+        self.fields = list(fields or SUMMARY_FIELDS)
+        self.skill_capacity = skill_capacity
+        self.total = 0
+        self.failed = 0
+        self.duplicates = 0
+        self.field_counts: Counter = Counter()
+        self.skills = Counter() if skill_capacity is None else SkillSketch(skill_capacity)
+        self.latency_count = 0
+        self.latency_total = 0.0
+        self.latency_min: Optional[float] = None
+        self.latency_max: Optional[float] = None
+
+    def _add_latency(self, latency: Optional[float]):
+        if latency is None:
+            return
+        self.latency_count += 1
+        self.latency_total += latency
+        self.latency_min = latency if self.latency_min is None else min(self.latency_min, latency)
+        self.latency_max = latency if self.latency_max is None else max(self.latency_max, latency)
+
+    def add_record(self, record: Dict[str, Any], latency: Optional[float] = None):
+        """Fold one successfully extracted record into the statistics"""
+        self.total += 1
+        for field in self.fields:
+            if record.get(field):
+                self.field_counts[field] += 1
+        self.skills.update(split_skills(record.get('Skills', '')))
+        self._add_latency(latency)
+
+    def add_failure(self, latency: Optional[float] = None):
+        """Count a file that produced no record"""
+        self.failed += 1
+        self._add_latency(latency)
+
+    def add_duplicate(self, latency: Optional[float] = None):
+        """Count a near-duplicate whose extraction was skipped"""
+        self.duplicates += 1
+        self._add_latency(latency)
+
+    def merge(self, other: 'ExtractionStats') -> 'ExtractionStats':
+        """Merge another partial (e.g. from a worker) into this one"""
+        self.total += other.total
+        self.failed += other.failed
+        self.duplicates += other.duplicates
+        self.field_counts.update(other.field_counts)
+
+        if isinstance(self.skills, SkillSketch):
+            if isinstance(other.skills, SkillSketch):
+                self.skills.merge(other.skills)
+            else:
+                for skill, count in other.skills.items():
+                    self.skills.add(skill, count)
+        elif isinstance(other.skills, SkillSketch):
+            self.skills.update(other.skills.counts)
+        else:
+            self.skills.update(other.skills)
+
+        if other.latency_count:
+            self.latency_count += other.latency_count
+            self.latency_total += other.latency_total
+            self.latency_min = other.latency_min if self.latency_min is None else min(self.latency_min, other.latency_min)
+            self.latency_max = other.latency_max if self.latency_max is None else max(self.latency_max, other.latency_max)
+        return self
+
+    @property
+    def average_latency(self) -> Optional[float]:
+        if not self.latency_count:
+            return None
+        return self.latency_total / self.latency_count
+
+    def completion_rates(self) -> List[Tuple[str, int, int, float]]:
+        """Return (field, completed, total, percentage) for every tracked field"""
+        rates = []
+        for field in self.fields:
+            completed = self.field_counts.get(field, 0)
+            percentage = (completed / self.total) * 100 if self.total else 0.0
+            rates.append((field, completed, self.total, percentage))
+        return rates
+
+    def top_skills(self, n: int = 10) -> List[Tuple[str, int]]:
+        return self.skills.most_common(n)
+
+    def to_dict(self) -> Dict[str, Any]:
+        skills = self.skills.to_dict() if isinstance(self.skills, SkillSketch) else dict(self.skills)
+        return {
+            'fields': self.fields,
+            'skill_capacity': self.skill_capacity,
+            'total': self.total,
+            'failed': self.failed,
+            'duplicates': self.duplicates,
+            'field_counts': dict(self.field_counts),
+            'skills': skills,
+            'latency_count': self.latency_count,
+            'latency_total': self.latency_total,
+            'latency_min': self.latency_min,
+            'latency_max': self.latency_max,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> 'ExtractionStats':
+        stats = cls(payload.get('fields'), payload.get('skill_capacity'))
+        stats.total = payload.get('total', 0)
+        stats.failed = payload.get('failed', 0)
+        stats.duplicates = payload.get('duplicates', 0)
+        stats.field_counts = Counter(payload.get('field_counts', {}))
+        if stats.skill_capacity is None:
+            stats.skills = Counter(payload.get('skills', {}))
+        else:
+            stats.skills = SkillSketch.from_dict(payload.get('skills', {}))
+        stats.latency_count = payload.get('latency_count', 0)
+        stats.latency_total = payload.get('latency_total', 0.0)
+        stats.latency_min = payload.get('latency_min')
+        stats.latency_max = payload.get('latency_max')
+        return stats
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]], **kwargs) -> 'ExtractionStats':
+        stats = cls(**kwargs)
+        for record in records:
+            stats.add_record(record)
+        return stats
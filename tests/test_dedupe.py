@@ -0,0 +1,69 @@
+import pytest
+
+import dedupe
+from dedupe import DuplicateStore
+
+RESUME = ("Jane Doe, software engineer with eight years of Python and Go. Built data pipelines at "
+          "Acme Corp, led a team of five, and shipped a resume parsing service used by recruiters. "
+          "Education: BSc Computer Science, State University, 2014.")
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = DuplicateStore(str(tmp_path / 'dupes.db'))
+    yield store
+    store.close()
+
+
+def test_connection_is_cached_per_process(store):
+    assert store.connection is store.connection
+    assert list(dedupe._connections) == [(dedupe.os.getpid(), store.path)]
+    store.close()
+    assert not dedupe._connections
+
+
+def test_meta_fixes_parameters_of_existing_store(tmp_path):
+    path = str(tmp_path / 'dupes.db')
+    created = DuplicateStore(path, num_perm=64, bands=8)
+    created.connection
+    created.close()
+    reopened = DuplicateStore(path)
+    reopened.connection
+    assert (reopened.num_perm, reopened.bands) == (64, 8)
+    reopened.close()
+
+
+def test_invalid_parameters():
+    with pytest.raises(ValueError):
+        DuplicateStore('unused.db', mode='merge')
+    with pytest.raises(ValueError):
+        DuplicateStore('unused.db', threshold=0)
+    with pytest.raises(ValueError):
+        DuplicateStore('unused.db', num_perm=100, bands=16)
+
+
+def test_check_finds_near_duplicates(store):
+    pytest.importorskip('numpy')
+    assert store.check('jane.pdf', RESUME) is None
+    canonical, similarity = store.check('jane_copy.pdf', RESUME + " References available.")
+    assert canonical == 'jane.pdf'
+    assert similarity >= store.threshold
+    assert store.check('other.pdf', "Completely different text about gardening and cooking recipes.") is None
+    assert len(store) == 3
+
+
+def test_check_same_name_is_not_its_own_duplicate(store):
+    pytest.importorskip('numpy')
+    assert store.check('jane.pdf', RESUME) is None
+    assert store.check('jane.pdf', RESUME) is None
+    assert len(store) == 1
+
+
+def test_clusters_group_duplicates_by_canonical(store):
+    pytest.importorskip('numpy')
+    store.check('jane.pdf', RESUME)
+    store.check('jane_copy.pdf', RESUME)
+    store.check('jane_copy2.pdf', RESUME)
+    [(canonical, duplicates)] = store.clusters()
+    assert canonical == 'jane.pdf'
+    assert sorted(name for name, _ in duplicates) == ['jane_copy.pdf', 'jane_copy2.pdf']
@@ -0,0 +1,53 @@
+import pytest
+
+pytest.importorskip('regex')
+
+from extract_info import extract_contacts, extract_email, extract_phone_number
+
+TEXTS = [
+    "Jane Doe\njane.doe@example.org\n+1 (555) 123-4567",
+    "placeholder you@email.com then real@company.io",
+    "only YOU@EMAIL.COM here",
+    "A@email.comx q@z.io",
+    "call 555.987.6543 or 555-111-2222",
+    "1-800-555-0199",
+    "no contact details at all",
+    "",
+    "me@ſite.ſk and K@K.KK",
+    "１２３ 456 7890 is not ASCII",
+    "x@y.com\xa0555.123.4567",
+]
+
+
+def test_single_document_fields():
+    assert extract_email(TEXTS[0]) == 'jane.doe@example.org'
+    assert extract_phone_number(TEXTS[0]) == '+1 (555) 123-4567'
+    assert extract_email(TEXTS[1]) == 'real@company.io'
+    assert extract_email(TEXTS[2]) == 'YOU@EMAIL.COM'
+    assert extract_phone_number(TEXTS[4]) == '(555) 987-6543'
+    assert extract_email(TEXTS[6]) is None
+    assert extract_phone_number(TEXTS[6]) is None
+
+
+def test_extract_contacts_matches_per_document_extraction():
+    contacts = extract_contacts(TEXTS)
+    assert contacts == {'Email': [extract_email(text) for text in TEXTS],
+                        'Phone': [extract_phone_number(text) for text in TEXTS]}
+
+
+def test_extract_contacts_on_synthetic_corpus():
+    from benchmarks.synthetic_corpus import iter_corpus
+
+    texts = [text for _, _, text, _ in iter_corpus(50, seed=7)]
+    contacts = extract_contacts(texts)
+    assert contacts['Email'] == [extract_email(text) for text in texts]
+    assert contacts['Phone'] == [extract_phone_number(text) for text in texts]
+    assert any(contacts['Email']) and any(contacts['Phone'])
+
+
+def test_extract_contacts_series_with_missing_values():
+    pd = pytest.importorskip('pandas')
+    series = pd.Series([TEXTS[0], None, float('nan')], index=[10, 20, 30])
+    contacts = pd.DataFrame(extract_contacts(series), index=series.index)
+    assert contacts.loc[10, 'Email'] == 'jane.doe@example.org'
+    assert contacts.loc[20:, 'Phone'].isna().all()
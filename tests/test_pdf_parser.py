@@ -0,0 +1,35 @@
+import random
+
+import pytest
+
+pytest.importorskip('PyPDF2')
+pytest.importorskip('pdfplumber')
+
+from benchmarks.synthetic_corpus import generate_resume
+from pdf_parser import extract_with_pdfplumber, extract_with_pypdf2, join_pages
+
+
+@pytest.fixture(scope='module')
+def long_pdf():
+    pdf, _, _ = generate_resume(random.Random(11), page_count=6, column_count=1, noise=0.0)
+    return pdf
+
+
+def test_join_pages_skips_empty_pages():
+    assert join_pages(['one', '', None, 'two']) == "one\ntwo\n"
+    assert join_pages([]) == ""
+
+
+def test_pypdf2_bounded_mode_matches_normal_mode(long_pdf):
+    timings = {}
+    bounded = extract_with_pypdf2(long_pdf, timings, bounded=True, memory_budget_mb=0)
+    assert timings['pages'] == 6
+    assert bounded
+    assert bounded == extract_with_pypdf2(long_pdf, None, bounded=False, memory_budget_mb=0)
+
+
+def test_pdfplumber_bounded_mode_matches_normal_mode(long_pdf):
+    bounded = extract_with_pdfplumber(long_pdf, {}, page_workers=1, min_pages=50, bounded=True, memory_budget_mb=0)
+    assert bounded
+    assert bounded == extract_with_pdfplumber(long_pdf, None, page_workers=1, min_pages=50, bounded=False,
+                                              memory_budget_mb=0)
@@ -0,0 +1,48 @@
+import pytest
+
+import scheduler
+from scheduler import WorkerUtilization, lpt_schedule
+
+
+@pytest.fixture
+def costs(monkeypatch):
+    """Give each input the cost written into its source"""
+    monkeypatch.setattr(scheduler, 'estimate_cost', lambda source: source)
+
+
+def test_longest_first_keeps_ties_in_input_order(costs):
+    inputs = [(1.0, 'a'), (5.0, 'b'), (1.0, 'c'), (3.0, 'd')]
+    ordered, page_workers = lpt_schedule(inputs, workers=4)
+    assert [name for _, name in ordered] == ['b', 'd', 'a', 'c']
+    # An even share is 10 / 4 = 2.5 seconds
+    assert page_workers == {'b': 2, 'd': 2}
+
+
+def test_only_outliers_get_page_workers(costs):
+    inputs = [(1.0, f"short_{index}") for index in range(20)] + [(40.0, 'long'), (12.0, 'medium')]
+    ordered, page_workers = lpt_schedule(inputs, workers=8)
+    assert ordered[0][1] == 'long'
+    # An even share is 72 / 8 = 9 seconds; page workers are capped at the worker count
+    assert page_workers == {'long': 5, 'medium': 2}
+    assert lpt_schedule(inputs, workers=1)[1] == {}
+
+
+def test_empty_batch(costs):
+    assert lpt_schedule([], workers=4) == ([], {})
+
+
+def test_estimate_cost_falls_back_to_size():
+    pytest.importorskip('PyPDF2')
+    assert scheduler.estimate_page_count(b'not a pdf') is None
+    assert scheduler.estimate_cost(b'x' * 1024 * 1024) == pytest.approx(scheduler.SECONDS_PER_MB)
+
+
+def test_worker_utilization():
+    utilization = WorkerUtilization(workers=2)
+    utilization.record(101, 2.0)
+    utilization.record(102, 1.0)
+    utilization.record(101, 1.0)
+    utilization.record(None, 5.0)
+    assert utilization.ideal == pytest.approx(2.0)
+    assert [(pid, busy, documents) for pid, busy, documents, _ in utilization.per_worker()] == \
+        [(101, 3.0, 2), (102, 1.0, 1)]
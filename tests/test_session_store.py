@@ -0,0 +1,55 @@
+from session_store import SessionStore
+
+
+class FakeSession:
+    def __init__(self):
+        self.temp_dir = None
+        self.size = 0
+        self.busy = False
+        self.cleaned = False
+
+    def memory_usage(self):
+        return self.size
+
+    def is_busy(self):
+        return self.busy
+
+    def cleanup(self):
+        self.cleaned = True
+
+
+def test_each_session_is_charged_its_own_bytes():
+    store = SessionStore(FakeSession, memory_cap_bytes=100)
+    first, second = store.get('a'), store.get('b')
+    first.size, second.size = 150, 20
+
+    assert store.charge('a') == 150
+    assert store.charge('b') == 20
+    assert store.memory_usage('a') == 150
+    assert store.memory_usage() == 170
+
+    store.evict_idle()
+    assert not first.cleaned and not second.cleaned
+
+
+def test_evicted_session_is_no_longer_charged():
+    store = SessionStore(FakeSession)
+    session = store.get('a')
+    session.size = 50
+    store.charge('a')
+
+    store.evict('a')
+    assert session.cleaned
+    assert store.memory_usage() == 0
+    assert store.charge('a') == 0
+
+
+def test_session_limit_skips_busy_sessions():
+    store = SessionStore(FakeSession, max_sessions=2)
+    busy = store.get('a')
+    busy.busy = True
+    idle = store.get('b')
+    store.get('c')
+
+    assert not busy.cleaned and idle.cleaned
+    assert len(store) == 2
@@ -0,0 +1,73 @@
+import pickle
+
+import pytest
+
+import shm_transport
+from shm_transport import SharedSlot, encode_record, read_record, shared_call, write_record
+
+
+def round_trip(record):
+    parts, size = encode_record(record)
+    buf = bytearray(size)
+    write_record(buf, parts)
+    return read_record(memoryview(buf)), size
+
+
+def test_record_round_trip():
+    record = {'Name': 'Zoë Ünal', 'Email': None, 'Phone': '', 'Similarity': 0.93, 'Pages': 12,
+              'Skills': ['Python', 'SQL'], 'Resume Name': 'zoe.pdf'}
+    decoded, size = round_trip(record)
+    assert decoded == record
+    assert list(decoded) == list(record)
+    assert size == len(encode_record(record)[0]) * 9 + 4 + sum(len(k) + len(v) for _, k, v in
+                                                               encode_record(record)[0])
+
+
+def test_empty_record():
+    assert round_trip({}) == ({}, 4)
+
+
+def test_non_strings_are_pickled():
+    parts, _ = encode_record({'count': 3, 'text': 'x', 'none': None})
+    assert [kind for kind, _, _ in parts] == [b'p', b's', b'n']
+    assert pickle.loads(parts[0][2]) == 3
+
+
+def test_slot_grows_and_reads_results():
+    slot = SharedSlot(capacity=1024)
+    try:
+        handle = slot.send(b'%PDF' + b'x' * 3000)
+        assert handle.size == 3004
+        assert handle.capacity == slot.capacity == 4096
+        assert bytes(slot.shm.buf[:4]) == b'%PDF'
+
+        parts, size = encode_record({'Name': 'Ana'})
+        write_record(slot.shm.buf, parts)
+        assert slot.receive(size) == {'Name': 'Ana'}
+        assert slot.receive({'Name': 'inline'}) == {'Name': 'inline'}
+        assert slot.receive(None) is None
+    finally:
+        slot.close()
+    assert slot.shm is None
+
+
+def test_shared_call_parses_in_place_and_releases_the_view():
+    seen = []
+
+    def process(source, name, timings=None):
+        seen.append(source)
+        return {'Resume Name': name, 'Size': str(len(source)), 'Head': bytes(source[:4]).decode()}
+
+    slot = SharedSlot(capacity=1024)
+    try:
+        result, _, _ = shared_call(process, slot.send(b'%PDF-1.7 body'), 'a.pdf', {})
+        assert slot.receive(result) == {'Resume Name': 'a.pdf', 'Size': '13', 'Head': '%PDF'}
+        [source] = seen
+        assert isinstance(source, memoryview)
+        with pytest.raises(ValueError):
+            len(source)
+    finally:
+        for shm in shm_transport._attached.values():
+            shm.close()
+        shm_transport._attached.clear()
+        slot.close()
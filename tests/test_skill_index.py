@@ -0,0 +1,52 @@
+import pytest
+
+from skill_index import QueryError, SkillIndex, parse_query, search_records
+
+RECORDS = [
+    {'Resume Name': 'ana.pdf', 'Skills': 'Python, Docker, Machine Learning', 'Education': 'Stanford University'},
+    {'Resume Name': 'ben.pdf', 'Skills': 'Java, Docker', 'Education': 'MIT'},
+    {'Resume Name': 'cal.pdf', 'Skills': 'Python, PHP', 'Education': 'Stanford'},
+]
+
+
+def test_parse_query_precedence():
+    assert parse_query('python docker NOT php') == \
+        ('and', ('and', ('term', 'python'), ('term', 'docker')), ('not', ('term', 'php')))
+    assert parse_query('python OR java AND docker') == \
+        ('or', ('term', 'python'), ('and', ('term', 'java'), ('term', 'docker')))
+    assert parse_query('(python OR java) docker') == \
+        ('and', ('or', ('term', 'python'), ('term', 'java')), ('term', 'docker'))
+
+
+def test_parse_query_terms_are_normalized():
+    assert parse_query('"Machine  Learning"') == ('term', 'machine learning')
+    assert parse_query('Skills:Python') == ('term', 'python')
+    assert parse_query('education:stanford') == ('term', 'education:stanford')
+
+
+@pytest.mark.parametrize('query', ['', 'python AND', '(python', 'python)', 'NOT'])
+def test_parse_query_errors(query):
+    with pytest.raises(QueryError):
+        parse_query(query)
+
+
+def test_search_records():
+    assert search_records(RECORDS, 'python NOT php') == [0]
+    assert search_records(RECORDS, 'docker OR php') == [0, 1, 2]
+    assert search_records(RECORDS, '"machine learning"') == [0]
+
+
+def test_index_segments_and_compaction(tmp_path):
+    index_dir = str(tmp_path / 'index')
+    with SkillIndex(index_dir, fields=['Skills', 'Education']) as index:
+        assert index.add_records(RECORDS[:2]) == 2
+        assert index.add_records(RECORDS) == 1
+        assert index.search('python') == (2, ['ana.pdf', 'cal.pdf'])
+        assert index.search('education:stanford docker') == (1, ['ana.pdf'])
+        assert index.compact() == 2
+
+    with SkillIndex(index_dir) as index:
+        assert index.doc_count == 3
+        assert len(index.segments()) == 1
+        assert index.search('NOT docker') == (1, ['cal.pdf'])
+        assert index.search('python', limit=1) == (2, ['ana.pdf'])
@@ -0,0 +1,42 @@
+import random
+
+from stats import SkillSketch
+
+
+def reference_sketch(items, capacity):
+    """Space-Saving with a linear scan for the victim, ties broken like the heap"""
+    counts, errors = {}, {}
+    for item in items:
+        if item in counts:
+            counts[item] += 1
+        elif len(counts) < capacity:
+            counts[item], errors[item] = 1, 0
+        else:
+            victim = min(counts, key=lambda key: (counts[key], key))
+            floor = counts.pop(victim)
+            errors.pop(victim)
+            counts[item], errors[item] = floor + 1, floor
+    return counts, errors
+
+
+def test_sketch_matches_linear_scan_eviction():
+    rng = random.Random(0)
+    items = [f"skill{int(rng.paretovariate(1.2))}" for _ in range(5000)]
+
+    sketch = SkillSketch(capacity=20)
+    sketch.update(items)
+
+    assert (sketch.counts, sketch.errors) == reference_sketch(items, 20)
+    assert sum(sketch.counts.values()) == len(items)
+    assert sorted(item for _, item in sketch._heap) == sorted(sketch.counts)
+
+
+def test_restored_and_merged_sketches_keep_evicting_the_minimum():
+    sketch = SkillSketch.from_dict({'capacity': 2, 'counts': {'python': 5, 'go': 2}, 'errors': {}})
+    sketch.add('rust')
+    assert sketch.counts == {'python': 5, 'rust': 3}
+
+    merged = SkillSketch(2).merge(sketch)
+    merged.add('sql')
+    assert merged.counts == {'python': 5, 'sql': 4}
+    assert merged.errors['sql'] == 3
@@ -0,0 +1,121 @@
+import os
+
+import pytest
+
+import text_corpus
+from text_corpus import OFFSET_FORMAT, TEXT_KEY, TextCorpus, extract_range, save_record_text
+
+
+def write_corpus(path, count):
+    with TextCorpus(path) as corpus:
+        for index in range(count):
+            corpus.add(f"resume_{index}.pdf", f"Resume {index}\nSkills: Python, SQL\n" * 5)
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'texts.rtc')
+    write_corpus(path, text_corpus.DICTIONARY_SAMPLE + 5)
+    corpus = TextCorpus(path)
+    assert len(corpus) == text_corpus.DICTIONARY_SAMPLE + 5
+    assert corpus.get(3) == ('resume_3.pdf', "Resume 3\nSkills: Python, SQL\n" * 5)
+    assert [name for name, _ in corpus.iter_texts(1, 3)] == ['resume_1.pdf', 'resume_2.pdf']
+    corpus.close()
+
+
+def test_appending_and_latest(tmp_path):
+    path = str(tmp_path / 'texts.rtc')
+    write_corpus(path, 3)
+    with TextCorpus(path) as corpus:
+        corpus.add('resume_1.pdf', 'updated')
+    with TextCorpus(path) as corpus:
+        assert corpus.latest() == [0, 2, 3]
+        assert corpus.get(3) == ('resume_1.pdf', 'updated')
+
+
+def test_flush_writes_texts_held_back_for_the_dictionary(tmp_path):
+    path = str(tmp_path / 'texts.rtc')
+    corpus = TextCorpus(path)
+    corpus.add('first.pdf', 'first text')
+    assert len(corpus) == 0
+    corpus.flush()
+    assert len(TextCorpus(path)) == 1
+    corpus.close()
+
+
+def test_interrupted_write_is_dropped(tmp_path):
+    path = str(tmp_path / 'texts.rtc')
+    write_corpus(path, 4)
+    # Cut the last record short, as a crash in the middle of a write would
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - 3)
+    with TextCorpus(path) as corpus:
+        corpus.add('resume_4.pdf', 'after recovery')
+    with TextCorpus(path) as corpus:
+        assert len(corpus) == 4
+        assert [name for name, _ in corpus.iter_texts()] == ['resume_0.pdf', 'resume_1.pdf', 'resume_2.pdf',
+                                                                 'resume_4.pdf']
+        assert corpus.get(3)[1] == 'after recovery'
+
+
+def test_index_entry_without_record_is_dropped(tmp_path):
+    path = str(tmp_path / 'texts.rtc')
+    write_corpus(path, 2)
+    with open(path + '.idx', 'ab') as f:
+        f.write(OFFSET_FORMAT.pack(os.path.getsize(path)))
+    with TextCorpus(path) as corpus:
+        corpus.add('resume_2.pdf', 'third')
+    with TextCorpus(path) as corpus:
+        assert [name for name, _ in corpus.iter_texts()] == ['resume_0.pdf', 'resume_1.pdf', 'resume_2.pdf']
+
+
+def test_lost_index_is_rebuilt_from_the_records(tmp_path):
+    path = str(tmp_path / 'texts.rtc')
+    write_corpus(path, 5)
+    os.remove(path + '.idx')
+    with TextCorpus(path) as corpus:
+        corpus.add('resume_5.pdf', 'sixth')
+    with TextCorpus(path) as corpus:
+        assert [name for name, _ in corpus.iter_texts()] == [f"resume_{index}.pdf" for index in range(6)]
+        assert corpus.get(2)[1] == "Resume 2\nSkills: Python, SQL\n" * 5
+
+
+def test_record_missing_from_the_index_is_kept(tmp_path):
+    path = str(tmp_path / 'texts.rtc')
+    write_corpus(path, 3)
+    # A crash after the record was written but before its index entry was
+    index_size = os.path.getsize(path + '.idx')
+    with open(path + '.idx', 'r+b') as f:
+        f.truncate(index_size - OFFSET_FORMAT.size)
+    with TextCorpus(path) as corpus:
+        corpus.add('resume_3.pdf', 'fourth')
+    with TextCorpus(path) as corpus:
+        assert [name for name, _ in corpus.iter_texts()] == [f"resume_{index}.pdf" for index in range(4)]
+
+
+def test_not_a_corpus(tmp_path):
+    path = tmp_path / 'other.rtc'
+    path.write_bytes(b'not a corpus at all')
+    with pytest.raises(ValueError):
+        TextCorpus(str(path))
+
+
+def test_save_record_text_moves_the_text(tmp_path):
+    path = str(tmp_path / 'texts.rtc')
+    record = {'Resume Name': 'a.pdf', 'Name': 'Ana', TEXT_KEY: 'text of a'}
+    with TextCorpus(path) as corpus:
+        save_record_text(corpus, record)
+    assert TEXT_KEY not in record
+    save_record_text(None, {'Resume Name': 'b.pdf'})
+    with TextCorpus(path) as corpus:
+        assert corpus.get(0) == ('a.pdf', 'text of a')
+
+
+def test_extract_range(tmp_path):
+    pytest.importorskip('regex')
+    path = str(tmp_path / 'texts.rtc')
+    with TextCorpus(path) as corpus:
+        corpus.add('a.pdf', "Ana Lopez\nana.lopez@example.org\n(555) 123-4567\nSKILLS\nPython, SQL")
+    [(record, seconds)] = extract_range(path, [0])
+    assert record['Resume Name'] == 'a.pdf'
+    assert record['Email'] == 'ana.lopez@example.org'
+    assert seconds >= 0
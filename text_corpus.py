@@ -0,0 +1,281 @@
+import os
+import mmap
+import time
+import zlib
+import struct
+from typing import Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b'RPTC'
+CORPUS_VERSION = 1
+INDEX_SUFFIX = '.idx'
+COMPRESSION_LEVEL = 6
+# The first documents saved to a new corpus are held back to build the
+# preset dictionary that every record is compressed against. On the synthetic
+# corpus 16 texts compress best (6.8x; 6.6x with 64, 4.9x with one), and
+# fewer held-back texts are fewer to lose if the process dies.
+DICTIONARY_SAMPLE = 16
+DICTIONARY_SIZE = 32 * 1024
+
+# Header: magic, version, dictionary length, then the dictionary. Each record
+# is a '<HI' (name length, compressed text length) header, the UTF-8 name and
+# the compressed text; the index file holds one '<Q' record offset per record.
+HEADER_FORMAT = struct.Struct('<4sBI')
+RECORD_FORMAT = struct.Struct('<HI')
+OFFSET_FORMAT = struct.Struct('<Q')
+
+# Key under which process_single_resume returns the cleaned text to save
+TEXT_KEY = '_text'
+
+
+def build_dictionary(texts: List[str], size: int = DICTIONARY_SIZE) -> bytes:
+    """Preset zlib dictionary: the last `size` bytes of the sample texts.
+
+    Short records share little within themselves but a lot with each other
+    (section headings, skills, phrasing); on the synthetic corpus this
+    takes per-record compression from about 2.9x to 6.7x.
+    """
+    return "\n".join(texts).encode('utf-8')[-size:]
+
+
+class TextCorpus:
+    """Append-only file of compressed document texts with an offset index.
+
+    Built so parsed text can be re-extracted without parsing the PDFs
+    again. Records are compressed one by one against a preset dictionary,
+    so any of them can be read on its own through the index in
+    `<path>.idx`. Opening a corpus for appending drops a record whose write
+    was interrupted and indexes again any complete records the index lost
+    (all of them if `<path>.idx` is gone). A name added twice keeps both records; `latest` skips
+    all but the last.
+
+    The first DICTIONARY_SAMPLE texts of a new corpus are only kept in
+    memory until the dictionary is built from them, and are lost if the
+    process dies before then. `flush` and `close` build the dictionary from
+    whatever is held back and write it out.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.index_path = path + INDEX_SUFFIX
+        self.dictionary: Optional[bytes] = None
+        self._data = None
+        self._offsets = None
+        self._writer = None
+        self._pending: List[Tuple[str, str]] = []
+        if os.path.exists(path) and os.path.getsize(path):
+            self._read_header()
+
+    def _read_header(self):
+        with open(self.path, 'rb') as f:
+            header = f.read(HEADER_FORMAT.size)
+            if len(header) < HEADER_FORMAT.size:
+                raise ValueError(f"❌ '{self.path}' is not a text corpus (truncated header)")
+            magic, version, dictionary_size = HEADER_FORMAT.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"❌ '{self.path}' is not a text corpus")
+            if version != CORPUS_VERSION:
+                raise ValueError(f"❌ Unsupported text corpus version {version} in '{self.path}'")
+            self.dictionary = f.read(dictionary_size)
+        self.data_start = HEADER_FORMAT.size + len(self.dictionary)
+
+    # Reading
+
+    def _open(self):
+        if self._data is None:
+            handles = []
+            for path in (self.path, self.index_path):
+                if not os.path.exists(path):
+                    raise FileNotFoundError(f"❌ Text corpus file '{path}' not found")
+                with open(path, 'rb') as f:
+                    size = os.fstat(f.fileno()).st_size
+                    handles.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b'')
+            self._data, self._offsets = handles
+        return self._data, self._offsets
+
+    def __len__(self) -> int:
+        if not os.path.exists(self.index_path):
+            return 0
+        return os.path.getsize(self.index_path) // OFFSET_FORMAT.size
+
+    def _record_at(self, offset: int) -> Tuple[str, int, int]:
+        """(name, start, end) of the compressed text of the record at `offset`"""
+        data, _ = self._open()
+        name_size, text_size = RECORD_FORMAT.unpack_from(data, offset)
+        start = offset + RECORD_FORMAT.size + name_size
+        name = data[offset + RECORD_FORMAT.size:start].decode('utf-8', 'replace')
+        return name, start, start + text_size
+
+    def _offset(self, position: int) -> int:
+        _, offsets = self._open()
+        return OFFSET_FORMAT.unpack_from(offsets, position * OFFSET_FORMAT.size)[0]
+
+    def decompress(self, data) -> str:
+        decompressor = zlib.decompressobj(zdict=self.dictionary) if self.dictionary else zlib.decompressobj()
+        return (decompressor.decompress(data) + decompressor.flush()).decode('utf-8')
+
+    def names(self) -> Iterator[str]:
+        """Document names in record order, without decompressing any text"""
+        for position in range(len(self)):
+            yield self._record_at(self._offset(position))[0]
+
+    def latest(self) -> List[int]:
+        """Record positions, skipping records whose name was added again later"""
+        last: Dict[str, int] = {}
+        for position, name in enumerate(self.names()):
+            last[name] = position
+        return sorted(last.values())
+
+    def get(self, position: int) -> Tuple[str, str]:
+        """(name, text) of the record at `position`"""
+        data, _ = self._open()
+        name, start, end = self._record_at(self._offset(position))
+        return name, self.decompress(data[start:end])
+
+    def iter_texts(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+        """Yield (name, text) for the records in [start, stop)"""
+        for position in range(start, len(self) if stop is None else stop):
+            yield self.get(position)
+
+    # Appending
+
+    def add(self, name: str, text: str):
+        """Append a document's text; records of a new corpus are written once its dictionary is built"""
+        if self.dictionary is None:
+            self._pending.append((name, text))
+            if len(self._pending) >= DICTIONARY_SAMPLE:
+                self._flush_pending()
+            return
+        self._append(name, text)
+
+    def _flush_pending(self):
+        if self.dictionary is None:
+            if not self._pending:
+                return
+            self.dictionary = build_dictionary([text for _, text in self._pending])
+            with open(self.path, 'wb') as f:
+                f.write(HEADER_FORMAT.pack(MAGIC, CORPUS_VERSION, len(self.dictionary)))
+                f.write(self.dictionary)
+            open(self.index_path, 'wb').close()
+            self.data_start = HEADER_FORMAT.size + len(self.dictionary)
+        pending, self._pending = self._pending, []
+        for name, text in pending:
+            self._append(name, text)
+
+    def _scan_record(self, data, offset: int, data_size: int) -> Optional[int]:
+        """End of the complete record at `offset`, or None if it was cut short or does not decompress"""
+        data.seek(offset)
+        header = data.read(RECORD_FORMAT.size)
+        if len(header) < RECORD_FORMAT.size:
+            return None
+        name_size, text_size = RECORD_FORMAT.unpack(header)
+        end = offset + RECORD_FORMAT.size + name_size + text_size
+        if end > data_size:
+            return None
+        data.seek(offset + RECORD_FORMAT.size + name_size)
+        try:
+            self.decompress(data.read(text_size))
+        except (zlib.error, UnicodeDecodeError):
+            return None
+        return end
+
+    def _open_writer(self):
+        """Open both files for appending, repairing them after an interrupted write.
+        
+        Index entries whose record is incomplete are dropped. Complete records
+        past the last index entry, which is all of them if the index file was
+        lost, are indexed again, and only a partial record at the end of the
+        data file is cut off.
+        """
+        data = open(self.path, 'r+b')
+        index = open(self.index_path, 'r+b' if os.path.exists(self.index_path) else 'w+b')
+        data_size = os.fstat(data.fileno()).st_size
+        count = os.fstat(index.fileno()).st_size // OFFSET_FORMAT.size
+        end = self.data_start
+        while count:
+            index.seek((count - 1) * OFFSET_FORMAT.size)
+            offset, = OFFSET_FORMAT.unpack(index.read(OFFSET_FORMAT.size))
+            record_end = self._scan_record(data, offset, data_size)
+            if record_end is not None:
+                end = record_end
+                break
+            count -= 1
+        index.truncate(count * OFFSET_FORMAT.size)
+        index.seek(0, os.SEEK_END)
+        recovered = 0
+        while end < data_size:
+            record_end = self._scan_record(data, end, data_size)
+            if record_end is None:
+                break
+            index.write(OFFSET_FORMAT.pack(end))
+            end = record_end
+            recovered += 1
+        if recovered:
+            print(f"⚠️ Re-indexed {recovered} record(s) missing from '{self.index_path}'")
+        if end < data_size:
+            print(f"⚠️ Dropping {data_size - end} bytes of an interrupted write at the end of '{self.path}'")
+        data.truncate(end)
+        data.seek(end)
+        self._writer = (data, index)
+
+    def _append(self, name: str, text: str):
+        if self._writer is None:
+            self._open_writer()
+        data, index = self._writer
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zdict=self.dictionary)
+        compressed = compressor.compress(text.encode('utf-8')) + compressor.flush()
+        encoded_name = name.encode('utf-8')[:0xFFFF]
+        offset = data.tell()
+        data.write(RECORD_FORMAT.pack(len(encoded_name), len(compressed)) + encoded_name + compressed)
+        index.write(OFFSET_FORMAT.pack(offset))
+
+    def flush(self):
+        """Write any records held back for the dictionary, then flush both files, data before index"""
+        self._flush_pending()
+        if self._writer:
+            data, index = self._writer
+            data.flush()
+            index.flush()
+
+    def close(self):
+        self._flush_pending()
+        if self._writer:
+            data, index = self._writer
+            data.close()
+            index.close()
+            self._writer = None
+        for handle in (self._data, self._offsets):
+            if isinstance(handle, mmap.mmap):
+                handle.close()
+        self._data = self._offsets = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def save_record_text(corpus: Optional[TextCorpus], record: dict):
+    """Move a record's cleaned text, if it carries one, into the corpus"""
+    text = record.pop(TEXT_KEY, None)
+    if corpus is not None and text is not None:
+        corpus.add(record['Resume Name'], text)
+
+
+def extract_range(path: str, positions: List[int]) -> List[Tuple[Optional[dict], float]]:
+    """Worker side of a re-extraction: (record, seconds) for each record position"""
+    from extract_info import extract_information
+
+    results = []
+    with TextCorpus(path) as corpus:
+        for position in positions:
+            start_time = time.perf_counter()
+            try:
+                name, text = corpus.get(position)
+                record = extract_information(text)
+                record['Resume Name'] = name
+            except Exception as e:
+                print(f"❌ Error re-extracting record {position} of {path}: {str(e)}")
+                record = None
+            results.append((record, time.perf_counter() - start_time))
+    return results
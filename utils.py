@@ -1,8 +1,33 @@
 import os
-import pandas as pd
-from openpyxl.utils import get_column_letter
-from openpyxl import load_workbook
-from openpyxl.styles import Font, Alignment, PatternFill
+import json
+import itertools
+from abc import ABC, abstractmethod
+
+from stats import ExtractionStats
+
+# pandas and openpyxl are imported inside the writers that need them, so
+# importing utils (and therefore main) stays cheap for CSV-only or
+# streaming runs and for worker process start-up.
+
+COLUMN_ORDER = ['Name', 'Email', 'Phone', 'Skills', 
+                'Work Experience', 'Education', 'Projects', 'Hobbies', 'Qualities']
+
+EXCEL_MAX_ROWS = 1048576
+DEFAULT_EXCEL_ROWS_PER_PART = 100000
+
+def canonical_columns(columns):
+    """Return columns in the canonical output order, with 'Resume Name' last"""
+    existing_columns = [col for col in COLUMN_ORDER if col in columns]
+    remaining_columns = [col for col in columns if col not in existing_columns and col != 'Resume Name']
+    
+    column_order = existing_columns + remaining_columns
+    if 'Resume Name' in columns:
+        column_order.append('Resume Name')
+    return column_order
+
+def order_columns(df):
+    """Reorder a DataFrame into the canonical output column order"""
+    return df[canonical_columns(list(df.columns))]
 
 def create_output_directory(base_name="resume_extraction_results"):
     """Create a timestamped output directory"""
@@ -18,19 +43,11 @@ def save_to_csv(data, output_file='extracted_resume_data.csv'):
         return
     
     try:
-        df = pd.DataFrame(data)
-        
-        desired_order = ['Name', 'Email', 'Phone', 'Skills', 
-                        'Work Experience', 'Education', 'Projects', 'Hobbies', 'Qualities']
+        import pandas as pd
         
-        existing_columns = [col for col in desired_order if col in df.columns]
-        remaining_columns = [col for col in df.columns if col not in existing_columns and col != 'Resume Name']
-        
-        column_order = existing_columns + remaining_columns
-        if 'Resume Name' in df.columns:
-            column_order.append('Resume Name')
+        df = pd.DataFrame(data)
         
-        df = df[column_order]
+        df = order_columns(df)
         
         df.to_csv(output_file, index=False, encoding='utf-8')
         print(f"✅ CSV saved successfully: {output_file}")
@@ -44,20 +61,16 @@ def save_to_excel(data, output_file='extracted_resume_data.xlsx'):
         print("⚠️ No data to save to Excel")
         return
     
+    if len(data) > EXCEL_MAX_ROWS - 1:
+        print(f"⚠️ {len(data)} rows exceed the Excel sheet limit, splitting into sheets")
+        return save_to_excel_chunked(data, output_file, split='sheets')
+    
     try:
-        df = pd.DataFrame(data)
-        
-        desired_order = ['Name', 'Email', 'Phone', 'Skills', 
-                        'Work Experience', 'Education', 'Projects', 'Hobbies', 'Qualities']
+        import pandas as pd
         
-        existing_columns = [col for col in desired_order if col in df.columns]
-        remaining_columns = [col for col in df.columns if col not in existing_columns and col != 'Resume Name']
-        
-        column_order = existing_columns + remaining_columns
-        if 'Resume Name' in df.columns:
-            column_order.append('Resume Name')
+        df = pd.DataFrame(data)
         
-        df = df[column_order]
+        df = order_columns(df)
         
         df.to_excel(output_file, index=False, engine='openpyxl')
         
@@ -67,81 +80,299 @@ def save_to_excel(data, output_file='extracted_resume_data.xlsx'):
     except Exception as e:
         print(f"❌ Error saving Excel: {str(e)}")
 
+def format_worksheet(ws):
+    """Apply header styling, column widths and filters to a worksheet"""
+    from openpyxl.utils import get_column_letter
+    from openpyxl.styles import Font, Alignment, PatternFill
+    
+    header_font = Font(bold=True, size=12, color='FFFFFF')
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    
+    for cell in ws[1]:
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_alignment
+    
+    for column_cells in ws.columns:
+        max_length = 0
+        column = column_cells[0].column
+        column_letter = get_column_letter(column)
+        
+        for cell in column_cells:
+            try:
+                if cell.value:
+                    cell_length = len(str(cell.value))
+                    if cell_length > max_length:
+                        max_length = cell_length
+            except:
+                pass
+        
+        adjusted_width = min(max(max_length + 2, 12), 50)
+        ws.column_dimensions[column_letter].width = adjusted_width
+    
+    data_alignment = Alignment(vertical='top', wrap_text=True)
+    
+    for row in ws.iter_rows(min_row=2):
+        for cell in row:
+            cell.alignment = data_alignment
+            
+            ws.row_dimensions[cell.row].height = 60
+    
+    ws.freeze_panes = 'A2'
+    
+    ws.auto_filter.ref = ws.dimensions
+
 def format_excel_file(output_file):
     """Apply enhanced formatting to Excel file"""
     try:
-        wb = load_workbook(output_file)
-        ws = wb.active
-        
-        header_font = Font(bold=True, size=12, color='FFFFFF')
-        header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
-        header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+        from openpyxl import load_workbook
         
-        for cell in ws[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
+        wb = load_workbook(output_file)
+        format_worksheet(wb.active)
+        wb.save(output_file)
         
-        for column_cells in ws.columns:
-            max_length = 0
-            column = column_cells[0].column
-            column_letter = get_column_letter(column)
+    except Exception as e:
+        print(f"⚠️ Warning: Could not apply advanced formatting: {str(e)}")
+
+def _iter_chunks(data, size):
+    """Yield successive lists of at most `size` records from any iterable"""
+    iterator = iter(data)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _write_excel_sheet(writer, rows, sheet_name):
+    """Write one chunk of records to a sheet and format it in place"""
+    import pandas as pd
+    
+    df = order_columns(pd.DataFrame(rows))
+    df.to_excel(writer, sheet_name=sheet_name, index=False)
+    format_worksheet(writer.sheets[sheet_name])
+
+def _write_excel_part(rows, output_file):
+    """Write one chunk of records to its own workbook (runs in a worker process)"""
+    import pandas as pd
+    
+    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+        _write_excel_sheet(writer, rows, 'Resumes')
+    return len(rows)
+
+def save_to_excel_chunked(data, output_file='extracted_resume_data.xlsx',
+                          rows_per_part=DEFAULT_EXCEL_ROWS_PER_PART, split='files', max_workers=None):
+    """Save records to Excel, rolling over to a new sheet or file every `rows_per_part` rows.
+    
+    `data` may be any iterable, so records are only held one chunk at a time
+    (per worker) in 'files' mode. Separate workbooks are written in parallel;
+    sheets of a single workbook have to be written serially. An index file
+    listing every part is written next to `output_file`.
+    """
+    rows_per_part = max(1, min(rows_per_part, EXCEL_MAX_ROWS - 1))
+    stem = os.path.splitext(output_file)[0]
+    index_file = f"{stem}_index.json"
+    parts = []
+    first_row = 1
+    
+    try:
+        if split == 'sheets':
+            import pandas as pd
             
-            for cell in column_cells:
-                try:
-                    if cell.value:
-                        cell_length = len(str(cell.value))
-                        if cell_length > max_length:
-                            max_length = cell_length
-                except:
-                    pass
+            with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+                for number, chunk in enumerate(_iter_chunks(data, rows_per_part), 1):
+                    sheet_name = f"Part {number}"
+                    _write_excel_sheet(writer, chunk, sheet_name)
+                    parts.append({'file': os.path.basename(output_file), 'sheet': sheet_name,
+                                  'first_row': first_row, 'rows': len(chunk)})
+                    first_row += len(chunk)
+        
+        elif split == 'files':
+            from concurrent.futures import ProcessPoolExecutor
             
-            adjusted_width = min(max(max_length + 2, 12), 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+            max_workers = max_workers or os.cpu_count() or 1
+            pending = []
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                for number, chunk in enumerate(_iter_chunks(data, rows_per_part), 1):
+                    part_file = f"{stem}_part{number:03d}.xlsx"
+                    parts.append({'file': os.path.basename(part_file), 'sheet': 'Resumes',
+                                  'first_row': first_row, 'rows': len(chunk)})
+                    first_row += len(chunk)
+                    pending.append(executor.submit(_write_excel_part, chunk, part_file))
+                    
+                    if len(pending) >= max_workers * 2:
+                        pending.pop(0).result()
+                
+                for future in pending:
+                    future.result()
         
-        data_alignment = Alignment(vertical='top', wrap_text=True)
+        else:
+            raise ValueError(f"Unknown split mode '{split}', expected 'sheets' or 'files'")
         
-        for row in ws.iter_rows(min_row=2):
-            for cell in row:
-                cell.alignment = data_alignment
-                
-                ws.row_dimensions[cell.row].height = 60
+        if not parts:
+            print("⚠️ No data to save to Excel")
+            return None
         
-        ws.freeze_panes = 'A2'
+        index = {'total_rows': first_row - 1, 'rows_per_part': rows_per_part,
+                 'split': split, 'parts': parts}
+        with open(index_file, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2)
         
-        ws.auto_filter.ref = ws.dimensions
+        print(f"✅ Excel saved in {len(parts)} part(s), index: {index_file}")
+        return index
         
-        wb.save(output_file)
+    except Exception as e:
+        print(f"❌ Error saving chunked Excel: {str(e)}")
+        return None
+
+class RecordSink(ABC):
+    """Base class for writers that append records one at a time without pandas"""
+    
+    def __init__(self, output_file, append=False, columns=None):
+        self.output_file = output_file
+        self.columns = columns or canonical_columns(COLUMN_ORDER + ['Resume Name'])
+        self.resumed = append and os.path.exists(output_file) and os.path.getsize(output_file) > 0
+        self.file = open(output_file, 'a' if append else 'w', newline='', encoding='utf-8')
+        self.count = 0
+    
+    @abstractmethod
+    def write(self, record):
+        """Append one record"""
+    
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+    
+    def flush(self):
+        self.file.flush()
+    
+    def close(self):
+        if not self.file.closed:
+            self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+class CsvSink(RecordSink):
+    """Stream records to a CSV file in the canonical column order"""
+    
+    def __init__(self, output_file, append=False, columns=None):
+        import csv
+        
+        super().__init__(output_file, append, columns)
+        if self.resumed:
+            with open(output_file, newline='', encoding='utf-8') as f:
+                self.columns = next(csv.reader(f), None) or self.columns
+        self.writer = csv.DictWriter(self.file, fieldnames=self.columns, extrasaction='ignore')
+        if not self.resumed:
+            self.writer.writeheader()
+    
+    def write(self, record):
+        self.writer.writerow(record)
+        self.count += 1
+
+class JsonlSink(RecordSink):
+    """Stream records to a newline-delimited JSON file"""
+    
+    def write(self, record):
+        ordered = {column: record.get(column) for column in canonical_columns(list(record))}
+        self.file.write(json.dumps(ordered, ensure_ascii=False) + "\n")
+        self.count += 1
+
+SINK_TYPES = {'csv': CsvSink, 'jsonl': JsonlSink}
+
+def open_sink(output_file, output_format, append=False, columns=None):
+    """Open a streaming sink for `output_format` ('csv' or 'jsonl')"""
+    if output_format not in SINK_TYPES:
+        raise ValueError(f"❌ Streaming output is not supported for '{output_format}'")
+    return SINK_TYPES[output_format](output_file, append=append, columns=columns)
+
+def save_to_jsonl(data, output_file='extracted_resume_data.jsonl'):
+    """Save extracted data as newline-delimited JSON"""
+    if not data:
+        print("⚠️ No data to save to JSONL")
+        return
+    
+    try:
+        with JsonlSink(output_file) as sink:
+            sink.write_many(data)
+        print(f"✅ JSONL saved successfully: {output_file}")
         
     except Exception as e:
-        print(f"⚠️ Warning: Could not apply advanced formatting: {str(e)}")
+        print(f"❌ Error saving JSONL: {str(e)}")
 
-def create_summary_report(data, output_dir):
-    """Create a summary report of the extraction process"""
+def save_to_parquet(data, output_file='extracted_resume_data.parquet'):
+    """Save extracted data to a Parquet file (requires pyarrow)"""
     if not data:
+        print("⚠️ No data to save to Parquet")
         return
     
     try:
+        import pandas as pd
+        
+        df = order_columns(pd.DataFrame(data))
+        df.to_parquet(output_file, index=False)
+        print(f"✅ Parquet saved successfully: {output_file}")
+        
+    except ImportError as e:
+        print(f"❌ Parquet output needs pyarrow installed: {str(e)}")
+    
+    except Exception as e:
+        print(f"❌ Error saving Parquet: {str(e)}")
+
+STATS_FILENAME = "extraction_stats.json"
+
+def save_stats(stats, output_dir):
+    """Persist mergeable run statistics next to the results"""
+    stats_file = os.path.join(output_dir, STATS_FILENAME)
+    with open(stats_file, 'w', encoding='utf-8') as f:
+        json.dump(stats.to_dict(), f, indent=2, ensure_ascii=False)
+    return stats_file
+
+def load_stats(stats_file):
+    with open(stats_file, encoding='utf-8') as f:
+        return ExtractionStats.from_dict(json.load(f))
+
+def create_summary_report(data, output_dir, stats=None, duplicate_clusters=None):
+    """Create a summary report of the extraction process"""
+    if not data and not (stats and stats.total):
+        return
+    
+    try:
+        if stats is None:
+            stats = ExtractionStats.from_records(data)
+        
         summary_file = os.path.join(output_dir, "extraction_summary.txt")
         
         with open(summary_file, 'w', encoding='utf-8') as f:
             f.write("RESUME EXTRACTION SUMMARY REPORT\n")
             f.write("=" * 50 + "\n\n")
-            f.write(f"Total resumes processed: {len(data)}\n\n")
+            f.write(f"Total resumes processed: {stats.total}\n\n")
             
             f.write("FIELD COMPLETION STATISTICS:\n")
             f.write("-" * 30 + "\n")
             
-            fields = ['Name', 'Email', 'Phone', 'Skills', 'Work Experience', 
-                     'Education', 'Projects', 'Hobbies', 'Qualities']
+            for field, completed, total, percentage in stats.completion_rates():
+                f.write(f"{field}: {completed}/{total} ({percentage:.1f}%)\n")
+            
+            if stats.average_latency is not None:
+                f.write(f"\nAverage extraction time: {stats.average_latency:.2f}s "
+                        f"(min {stats.latency_min:.2f}s, max {stats.latency_max:.2f}s)\n")
             
-            for field in fields:
-                completed = sum(1 for item in data if item.get(field))
-                percentage = (completed / len(data)) * 100
-                f.write(f"{field}: {completed}/{len(data)} ({percentage:.1f}%)\n")
+            if duplicate_clusters:
+                f.write(f"\nNEAR-DUPLICATE CLUSTERS ({len(duplicate_clusters)}):\n")
+                f.write("-" * 30 + "\n")
+                for canonical, duplicates in duplicate_clusters:
+                    f.write(f"{canonical}\n")
+                    for name, similarity in duplicates:
+                        f.write(f"  ~ {name} ({similarity:.0%} similar)\n")
             
             f.write(f"\nSummary saved to: {summary_file}")
         
+        save_stats(stats, output_dir)
         print(f"📊 Summary report saved: {summary_file}")
         
     except Exception as e:
@@ -0,0 +1,161 @@
+import os
+import json
+import time
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional, Tuple
+
+from dedupe import is_skipped_duplicate
+from discovery import PathFilter, iter_pdf_files
+from pipeline import timed_call
+from stats import ExtractionStats
+from text_corpus import TextCorpus, save_record_text
+
+
+def init_watch_worker():
+    """Warm a worker: load the parsers and build the extractor once, ignore Ctrl+C"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    import pdf_parser
+    from extract_info import get_extractor
+    get_extractor()
+
+
+class FolderWatcher:
+    """Detect new or changed PDFs by polling mtime and size.
+
+    A file is only reported once its signature has been stable for
+    `settle_time` seconds, so half-copied files are not picked up. The
+    signatures of processed files are persisted in `state_file`, so a restart
+    does not reprocess the whole folder.
+    """
+
+    def __init__(self, root: str, recursive: bool = False, path_filter: Optional[PathFilter] = None,
+                 state_file: Optional[str] = None, settle_time: float = 2.0):
+        self.root = root
+        self.recursive = recursive
+        self.path_filter = path_filter
+        self.state_file = state_file
+        self.settle_time = settle_time
+        self.processed: Dict[str, List[float]] = {}
+        self._pending: Dict[str, Tuple[List[float], float]] = {}
+
+        if state_file and os.path.exists(state_file):
+            with open(state_file, encoding='utf-8') as f:
+                self.processed = json.load(f)
+
+    def poll(self) -> List[Tuple[str, str, List[float]]]:
+        """Return (path, name, signature) for files that are new or changed and have settled"""
+        now = time.monotonic()
+        ready = []
+        seen = set()
+
+        for path, name in iter_pdf_files(self.root, self.recursive, self.path_filter):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            signature = [stat.st_mtime, stat.st_size]
+            seen.add(name)
+            if self.processed.get(name) == signature:
+                continue
+
+            pending = self._pending.get(name)
+            if pending is None or pending[0] != signature:
+                self._pending[name] = (signature, now)
+            elif now - pending[1] >= self.settle_time:
+                ready.append((path, name, signature))
+
+        for name in [name for name in self._pending if name not in seen]:
+            del self._pending[name]
+        return ready
+
+    def mark_processed(self, name: str, signature: List[float]):
+        self.processed[name] = signature
+        self._pending.pop(name, None)
+
+    def save_state(self):
+        if not self.state_file:
+            return
+        temp_file = f"{self.state_file}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.processed, f)
+        os.replace(temp_file, self.state_file)
+
+
+def watch_folder(watcher: FolderWatcher, process_fn: Callable, sinks: list, stats: ExtractionStats,
+                 interval: float = 5.0, batch_size: int = 32, workers: Optional[int] = None,
+                 on_batch: Optional[Callable[[ExtractionStats], None]] = None, verbose: bool = True,
+                 corpus: Optional[TextCorpus] = None):
+    """Process new PDFs in micro-batches until SIGINT/SIGTERM, then finish the in-flight batch.
+
+    Records carrying their text (see process_single_resume's keep_text)
+    have it moved to `corpus`, which is flushed with each batch.
+    """
+    stop = threading.Event()
+
+    def request_stop(signum, frame):
+        if not stop.is_set():
+            print("\n⏹️ Stop requested, finishing in-flight files...")
+        stop.set()
+
+    def start_executor():
+        return ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1, initializer=init_watch_worker)
+
+    previous_handlers = {sig: signal.signal(sig, request_stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+    executor = start_executor()
+
+    try:
+        while not stop.is_set():
+            ready = watcher.poll()
+
+            for start in range(0, len(ready), batch_size):
+                batch = ready[start:start + batch_size]
+                if verbose:
+                    print(f"📥 Processing batch of {len(batch)} new or changed file(s)")
+
+                futures = [(name, signature, executor.submit(timed_call, process_fn, path, name))
+                           for path, name, signature in batch]
+                pool_broken = False
+                for name, signature, future in futures:
+                    try:
+                        record, latency = future.result()
+                    except BrokenProcessPool:
+                        print(f"❌ Worker crashed while processing {name}")
+                        record, latency = None, 0.0
+                        pool_broken = True
+                    except Exception as e:
+                        print(f"❌ Error processing {name}: {str(e)}")
+                        record, latency = None, 0.0
+
+                    if is_skipped_duplicate(record):
+                        stats.add_duplicate(latency)
+                    elif record:
+                        save_record_text(corpus, record)
+                        stats.add_record(record, latency)
+                        for sink in sinks:
+                            sink.write(record)
+                    else:
+                        stats.add_failure(latency)
+                    watcher.mark_processed(name, signature)
+
+                for sink in sinks:
+                    sink.flush()
+                if corpus is not None:
+                    corpus.flush()
+                watcher.save_state()
+                if pool_broken:
+                    executor.shutdown(wait=False)
+                    executor = start_executor()
+                if on_batch:
+                    on_batch(stats)
+
+                if stop.is_set():
+                    break
+
+            stop.wait(interval)
+    finally:
+        executor.shutdown(wait=True)
+        for sig, handler in previous_handlers.items():
+            signal.signal(sig, handler)